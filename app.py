@@ -5,14 +5,24 @@ from flask import Flask
 from flask_restful import Api
 from flask_apscheduler import APScheduler
 from database.db import init_db
-from resources.quote import QuotesApi, QuoteApi
+from database.indexes import indexes_cli
+from resources.quote import QuotesApi, QuoteApi, QuoteSearchApi
 from resources.author import AuthorsApi, AuthorApi
-from resources.scrape import ScrapeDataApi, ScrapeStatus
-from resources.stats import StatsApi
+from resources.scrape import (
+    ScrapeDataApi,
+    ScrapeStatus,
+    ScrapeEventsApi,
+    ScrapeWorkersApi,
+)
+from resources.stats import StatsApi, CacheStatsApi
+from resources.scheduler import SchedulerApi
 from utils.logger import init_logger
 from utils.celery_app import init_celery
+from utils.worker_registry import init_worker_registry
+from utils.task_events import init_task_events
 from utils.rate_limiter import init_limiter
-from services.scraper.scheduler import init_scheduler_jobs
+from utils.cache import init_cache
+from services.scraper.scheduler import SchedulerLeader
 from config import CONFIG
 
 
@@ -31,19 +41,32 @@ def create_app(context: str = "main") -> Flask:
 
     # Initialize Celery
     init_celery(app)
+    init_worker_registry(app)
+    init_task_events(app)
 
     # Rate Limiter
     init_limiter(app)
 
+    # Response Cache
+    init_cache(app)
+
     # Routes
     api = Api(app)
     api.add_resource(QuotesApi, "/quotes/")
+    api.add_resource(QuoteSearchApi, "/quotes/search/", strict_slashes=False)
     api.add_resource(QuoteApi, "/quotes/<quote_id>/")
     api.add_resource(AuthorsApi, "/authors/")
     api.add_resource(AuthorApi, "/authors/<author_id>/")
     api.add_resource(ScrapeDataApi, "/scrape/data/")
     api.add_resource(ScrapeStatus, "/scrape/tasks/<task_id>/")
+    api.add_resource(ScrapeEventsApi, "/scrape/tasks/<task_id>/events/")
+    api.add_resource(ScrapeWorkersApi, "/scrape/workers/")
     api.add_resource(StatsApi, "/stats/")
+    api.add_resource(CacheStatsApi, "/stats/cache/")
+    api.add_resource(SchedulerApi, "/scheduler/lease/")
+
+    # Management commands
+    app.cli.add_command(indexes_cli)
 
     # Health check
     @app.route("/health/")
@@ -57,7 +80,11 @@ def create_app(context: str = "main") -> Flask:
         scheduler.api_enabled = True
         scheduler.init_app(app)
 
-        init_scheduler_jobs(scheduler)
+        # Only the holder of the lease, one process of all the workers and hosts,
+        # runs the scheduled jobs
+        leader = SchedulerLeader(scheduler)
+        app.extensions["scheduler_leader"] = leader
+        leader.start()
         scheduler.start()
 
     return app
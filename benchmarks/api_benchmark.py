@@ -0,0 +1,249 @@
+"""Latency percentiles and throughput of the read endpoints on a synthetic corpus
+
+Every endpoint is driven through the Flask test client (in process, no
+network) and through gunicorn (real HTTP, concurrent clients).
+
+Usage:
+    ENV=test MONGODB_DATABASE=quotes_bench python -m benchmarks.api_benchmark --quotes 100000 --drop --save-baseline
+    ENV=test MONGODB_DATABASE=quotes_bench python -m benchmarks.api_benchmark --quotes 100000 --drop
+
+Results are compared with the stored baseline of the same corpus, the run
+fails if the p95 latency or the throughput of an endpoint regressed by more
+than --tolerance.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+import requests
+from app import create_app
+from database.models import Stats
+from services.stats.reconcile import reconcile_stats
+from benchmarks.corpus import TAGS, ensure_empty, seed_corpus
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines", "api.json")
+
+ENDPOINTS = {
+    "quotes": "/quotes/?limit=50",
+    "quotes_tags_any": "/quotes/?tags=love,life,humor&limit=50",
+    "quotes_tags_all": "/quotes/?tags=love,life&mode=all&limit=50",
+    "quotes_tags_exclude": "/quotes/?exclude=love&limit=50",
+    "quotes_search": "/quotes/search/?q=love&limit=50",
+    "authors": "/authors/?limit=50",
+    "stats_live": "/stats/",
+}
+# measured once reconcile_stats built the Stats document
+MATERIALIZED_ENDPOINTS = {"stats_materialized": "/stats/"}
+
+
+def percentile(latencies: list, pct: int) -> float:
+    """Returns the pct percentile of the latencies"""
+
+    return statistics.quantiles(latencies, n=100, method="inclusive")[pct - 1]
+
+
+def measure(get, url: str, n_requests: int, concurrency: int) -> dict:
+    """Sends n_requests GET requests from concurrency clients
+
+    Args:
+        get (Callable): sends a request and returns its status code
+        url (str): path of the endpoint
+        n_requests (int): no. of requests
+        concurrency (int): no. of concurrent clients
+
+    Returns:
+        dict: p50, p95, p99 latency (ms) and requests/sec
+    """
+
+    def timed(_):
+        start = time.perf_counter()
+        status = get(url)
+        if status != 200:
+            raise SystemExit(f"GET {url} returned {status}")
+        return (time.perf_counter() - start) * 1000
+
+    get(url)  # warm up
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(n_requests)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "rps": n_requests / elapsed,
+    }
+
+
+def client_driver(app):
+    """Returns a get function calling the app in process"""
+
+    client = app.test_client()
+    return lambda url: client.get(url).status_code
+
+
+def free_port() -> int:
+    """Returns a free local port"""
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(workers: int) -> tuple:
+    """Starts gunicorn serving the app, without the scheduler
+
+    Returns:
+        tuple: the gunicorn process and its base url
+    """
+    port = free_port()
+    process = subprocess.Popen(  # pylint: disable=R1732
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "-w",
+            str(workers),
+            "-b",
+            f"127.0.0.1:{port}",
+            "app:create_app('benchmark')",
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    for _ in range(100):
+        try:
+            if requests.get(f"{url}/health/", timeout=1).status_code == 200:
+                return process, url
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    process.terminate()
+    raise SystemExit("gunicorn did not start")
+
+
+def http_driver(url: str):
+    """Returns a get function sending requests to the server,
+    every client thread keeps its own keep-alive session"""
+
+    sessions = local()
+
+    def get(path: str) -> int:
+        if not hasattr(sessions, "session"):
+            sessions.session = requests.Session()
+        return sessions.session.get(f"{url}{path}", timeout=30).status_code
+
+    return get
+
+
+def run_endpoints(drivers: dict, endpoints: dict, args) -> dict:
+    """Measures every endpoint with every driver and prints the results"""
+
+    results = {}
+    for driver, (get, concurrency) in drivers.items():
+        for name, url in endpoints.items():
+            result = measure(get, url, args.requests, concurrency)
+            results[f"{driver}:{name}"] = result
+            print(
+                f"{driver:8} {name:20} p50={result['p50']:8.2f}ms"
+                f" p95={result['p95']:8.2f}ms p99={result['p99']:8.2f}ms"
+                f" rps={result['rps']:8.1f}"
+            )
+
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Returns the regressions of the results against the baseline"""
+
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result["p95"] > base["p95"] * (1 + tolerance):
+            regressions.append(
+                f"{key} p95 {base['p95']:.2f}ms -> {result['p95']:.2f}ms"
+            )
+        if result["rps"] < base["rps"] / (1 + tolerance):
+            regressions.append(f"{key} rps {base['rps']:.1f} -> {result['rps']:.1f}")
+
+    return regressions
+
+
+def main():
+    """Seeds the corpus, measures the endpoints and checks the baseline"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--authors", type=int, default=1000)
+    parser.add_argument("--quotes", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=len(TAGS))
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--drivers", nargs="+", default=["client", "gunicorn"])
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    corpus = {"authors": args.authors, "quotes": args.quotes, "tags": args.tags}
+    app = create_app("benchmark")
+    with app.app_context():
+        ensure_empty(args.drop)
+        Stats.drop_collection()
+        seed_corpus(args.authors, args.quotes, n_tags=args.tags)
+
+    drivers, server = {}, None
+    if "client" in args.drivers:
+        # the test client is driven sequentially, it measures the app alone
+        drivers["client"] = (client_driver(app), 1)
+    if "gunicorn" in args.drivers:
+        server, url = start_gunicorn(args.workers)
+        drivers["gunicorn"] = (http_driver(url), args.concurrency)
+
+    try:
+        results = run_endpoints(drivers, ENDPOINTS, args)
+        with app.app_context():
+            reconcile_stats()
+        results |= run_endpoints(drivers, MATERIALIZED_ENDPOINTS, args)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    baselines = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as file:
+            baselines = json.load(file)
+    key = json.dumps(corpus, sort_keys=True)
+
+    if args.save_baseline:
+        baselines[key] = results
+        os.makedirs(os.path.dirname(BASELINE_FILE), exist_ok=True)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+        print(f"Baseline saved to {BASELINE_FILE}")
+        return
+
+    if key not in baselines:
+        print(f"No baseline for {corpus}, run with --save-baseline to store one")
+        return
+
+    regressions = compare(results, baselines[key], args.tolerance)
+    if regressions:
+        print("REGRESSIONS:\n  " + "\n  ".join(regressions))
+        raise SystemExit(1)
+    print(f"No regression against the baseline (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
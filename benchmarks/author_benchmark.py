@@ -0,0 +1,58 @@
+"""Wall-clock time of fetching author pages, serial vs. concurrent pool
+
+Usage:
+    python -m benchmarks.author_benchmark --authors 200 --latency 0.05
+"""
+
+import argparse
+import time
+import requests
+from benchmarks.fixture_server import start_fixture_server
+from services.scraper.crawler import fetch_authors, parse_author_page
+from constants.app_constants import SCRAPER_CONCURRENCY, SCRAPER_REQUEST_TIMEOUT
+
+
+def fetch_authors_serial(links: list) -> None:
+    """Fetches the pages one by one, as scrape_authors did before the pool"""
+
+    for link in links:
+        res = requests.get(link, timeout=SCRAPER_REQUEST_TIMEOUT)
+        parse_author_page(res.content)
+
+
+def fetch_authors_pooled(links: list) -> None:
+    """Fetches the pages through fetch_authors"""
+
+    for _ in fetch_authors(links):
+        pass
+
+
+def main():
+    """Serves the fixture site with latency and prints time of both modes"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--authors", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server, url = start_fixture_server(1, args.authors, latency=args.latency)
+    links = [f"{url}author/Author-{i}" for i in range(args.authors)]
+    ideal = args.authors * args.latency / SCRAPER_CONCURRENCY
+    try:
+        for mode, func in (
+            ("serial", fetch_authors_serial),
+            ("pooled", fetch_authors_pooled),
+        ):
+            start = time.perf_counter()
+            func(links)
+            elapsed = time.perf_counter() - start
+            print(
+                f"mode={mode:7} authors={args.authors:<5} latency={args.latency}s"
+                f" elapsed={elapsed:7.2f}s (latency bound {ideal:.2f}s)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Synthetic corpus of Authors and Quotes for benchmarks
+
+Tags and authors follow a Zipf distribution like real quotes: a few tags
+and authors are on most of the quotes, with a long tail of rare ones.
+
+Usage:
+    ENV=test MONGODB_DATABASE=quotes_bench python -m benchmarks.corpus --quotes 100000 --drop
+"""
+
+import argparse
+import random
+from itertools import accumulate
+from datetime import datetime, timedelta, timezone
+from app import create_app
+from database.models import Author, Quote
+
+WORDS = (
+    "life love truth world time people heart mind dream friend hope fear "
+    "light dark happiness sorrow wisdom fool book word silence music "
+    "freedom change courage kindness nothing everything always never "
+    "believe remember forget imagine create destroy learn teach live die "
+    "laugh cry think know understand choose become begin end simple "
+    "beautiful strange impossible possible young old true false real"
+).split()
+
+TAGS = (
+    "love life inspirational humor philosophy truth friendship books "
+    "reading writing happiness wisdom death poetry hope faith music "
+    "courage change success science god romance knowledge dreams"
+).split()
+
+BATCH_SIZE = 10000
+
+# exponent of the Zipf distribution of tags and authors, ~1 for natural data
+ZIPF_EXPONENT = 1.1
+
+
+def get_tags(n_tags: int) -> list:
+    """Returns n_tags tags, TAGS followed by generated rare tags"""
+
+    return (TAGS + [f"tag-{i}" for i in range(len(TAGS), n_tags)])[:n_tags]
+
+
+def zipf_cum_weights(n_items: int, exponent: float = ZIPF_EXPONENT) -> list:
+    """Returns cumulative weights of n_items ranked by a Zipf distribution"""
+
+    return list(accumulate(1 / rank**exponent for rank in range(1, n_items + 1)))
+
+
+def sample_distinct(
+    rnd: random.Random, population: list, cum_weights: list, k: int
+) -> list:
+    """Returns k distinct items drawn by weight"""
+
+    picked = []
+    while len(picked) < min(k, len(population)):
+        item = rnd.choices(population, cum_weights=cum_weights)[0]
+        if item not in picked:
+            picked.append(item)
+
+    return picked
+
+
+def ensure_empty(drop: bool) -> None:
+    """Drops the collections or fails if they already contain data
+
+    Args:
+        drop (bool): drop existing Authors and Quotes
+    """
+    if drop:
+        Quote.drop_collection()
+        Author.drop_collection()
+    elif Quote.objects.count() or Author.objects.count():
+        raise SystemExit(
+            "Database is not empty, pass --drop to replace its Authors and Quotes"
+        )
+
+    Author.ensure_indexes()
+    Quote.ensure_indexes()
+
+
+def seed_corpus(
+    n_authors: int, n_quotes: int, seed: int = 0, n_tags: int = len(TAGS)
+) -> None:
+    """Inserts n_authors Authors and n_quotes Quotes with random text and tags
+
+    Args:
+        n_authors (int): no. of authors
+        n_quotes (int): no. of quotes
+        seed (int): seed of the random generator
+        n_tags (int): no. of distinct tags
+    """
+    rnd = random.Random(seed)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    authors = [
+        {
+            "name": f"Author {i}",
+            "dob": start - timedelta(days=rnd.randint(7000, 30000)),
+            "country": "Nowhere",
+            "description": " ".join(rnd.choices(WORDS, k=40)),
+            "createdBy": "benchmark",
+            "createdOn": start,
+            "updatedOn": start,
+        }
+        for i in range(n_authors)
+    ]
+    author_ids = Author._get_collection().insert_many(authors).inserted_ids
+
+    tags = get_tags(n_tags)
+    tag_weights = zipf_cum_weights(len(tags))
+    author_weights = zipf_cum_weights(len(author_ids))
+
+    collection = Quote._get_collection()
+    for offset in range(0, n_quotes, BATCH_SIZE):
+        quotes = [
+            {
+                "quote": f"{' '.join(rnd.choices(WORDS, k=rnd.randint(6, 30)))} #{i}",
+                "author": rnd.choices(author_ids, cum_weights=author_weights)[0],
+                "tags": sample_distinct(rnd, tags, tag_weights, rnd.randint(1, 4)),
+                "createdBy": "benchmark",
+                "createdOn": start + timedelta(seconds=i),
+                "updatedOn": start + timedelta(seconds=i),
+            }
+            for i in range(offset, min(offset + BATCH_SIZE, n_quotes))
+        ]
+        collection.insert_many(quotes, ordered=False)
+
+
+def main():
+    """Seeds the corpus into the configured database"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--authors", type=int, default=1000)
+    parser.add_argument("--quotes", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=len(TAGS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    app = create_app("benchmark")
+    with app.app_context():
+        ensure_empty(args.drop)
+        seed_corpus(args.authors, args.quotes, args.seed, args.tags)
+    print(f"Seeded {args.authors} authors, {args.quotes} quotes, {args.tags} tags")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Startup latency of Selenium scraping tasks, new browser vs. warm pool
+
+Every task opens the first listing page of the fixture site, the time until
+its quotes are read is the startup latency.
+
+Usage:
+    python -m benchmarks.driver_pool_benchmark --tasks 20
+"""
+
+import argparse
+import statistics
+import time
+from selenium.webdriver.common.by import By
+from benchmarks.fixture_server import start_fixture_server
+from services.scraper.driver_pool import DriverPool
+from utils.utils import init_driver
+
+
+def first_page(pool: DriverPool, url: str) -> None:
+    """Reads the quotes of the first page with a browser of the pool"""
+
+    with pool.driver() as driver:
+        driver.get(url)
+        driver.find_elements(By.CLASS_NAME, "quote")
+
+
+def run_tasks(url: str, tasks: int, pool: DriverPool) -> list:
+    """Returns startup latency of every task"""
+
+    latencies = []
+    try:
+        for _ in range(tasks):
+            start = time.perf_counter()
+            first_page(pool, url)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        pool.close()
+
+    return latencies
+
+
+def main():
+    """Serves the fixture site and prints latency with and without the pool"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--max-uses", type=int, default=20)
+    args = parser.parse_args()
+
+    server, url = start_fixture_server(1, 10)
+    try:
+        for mode, pool in (
+            # size 0 keeps no idle browser, every task starts Chrome
+            ("new", DriverPool(init_driver, size=0)),
+            ("pooled", DriverPool(init_driver, size=1, max_uses=args.max_uses)),
+        ):
+            latencies = run_tasks(url, args.tasks, pool)
+            print(
+                f"mode={mode:7} tasks={args.tasks:<4}"
+                f" first={latencies[0] * 1000:8.1f}ms"
+                f" median={statistics.median(latencies) * 1000:8.1f}ms"
+                f" total={sum(latencies):7.2f}s"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Local HTTP server serving generated pages with the markup of quotes.toscrape.com
+
+Run it standalone and point the scraper at it with SCRAPER_BASE_URL:
+    python -m benchmarks.fixture_server --pages 100 --authors 50 --port 8000
+    SCRAPER_BASE_URL=http://127.0.0.1:8000/ celery -A make_celery worker
+"""
+
+import argparse
+import random
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from benchmarks.corpus import WORDS, TAGS
+
+QUOTES_PER_PAGE = 10
+
+QUOTE_HTML = """<div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+    <span class="text" itemprop="text">“{quote}”</span>
+    <span>by <small class="author" itemprop="author">{name}</small>
+    <a href="/author/{slug}">(about)</a>
+    </span>
+    <div class="tags">
+        Tags:
+        {tags}
+    </div>
+</div>"""
+
+TAG_HTML = '<a class="tag" href="/tag/{tag}/page/1/">{tag}</a>'
+
+NEXT_HTML = """<li class="next">
+    <a href="/page/{page}/">Next <span aria-hidden="true">&rarr;</span></a>
+</li>"""
+
+PAGE_HTML = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="UTF-8"><title>Quotes to Scrape</title></head>
+<body><div class="container">
+{quotes}
+<nav><ul class="pager">{next}</ul></nav>
+</div></body></html>"""
+
+AUTHOR_HTML = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="UTF-8"><title>Quotes to Scrape</title></head>
+<body><div class="container"><div class="author-details">
+    <h3 class="author-title">{name}</h3>
+    <p><strong>Born:</strong> <span class="author-born-date">March 14, 1879</span>
+    <span class="author-born-location">in Ulm, Germany</span></p>
+    <div class="author-description">
+        {description}
+    </div>
+</div></div></body></html>"""
+
+
+def render_pages(
+    pages: int, authors: int, quotes_per_page: int = QUOTES_PER_PAGE, seed: int = 0
+) -> dict:
+    """Returns html of every path of the site
+
+    Args:
+        pages (int): no. of quotes pages
+        authors (int): no. of distinct authors
+        quotes_per_page (int): no. of quotes on every page
+        seed (int): seed of the random generator, same seed renders same site
+    """
+    rand = random.Random(seed)
+    names = [f"Author {i}" for i in range(authors)]
+
+    site = {}
+    for page in range(1, pages + 1):
+        quotes = []
+        for i in range(quotes_per_page):
+            name = rand.choice(names)
+            words = " ".join(rand.choices(WORDS, k=rand.randint(8, 30)))
+            tags = rand.sample(TAGS, k=rand.randint(1, 4))
+            quotes.append(
+                QUOTE_HTML.format(
+                    quote=f"{words.capitalize()} ({page}-{i}).",
+                    name=name,
+                    slug=name.replace(" ", "-"),
+                    tags="\n        ".join(TAG_HTML.format(tag=tag) for tag in tags),
+                )
+            )
+
+        next_html = NEXT_HTML.format(page=page + 1) if page < pages else ""
+        site[f"/page/{page}/"] = PAGE_HTML.format(
+            quotes="\n".join(quotes), next=next_html
+        )
+
+    site["/"] = site["/page/1/"]
+    for name in names:
+        description = " ".join(rand.choices(WORDS, k=60))
+        site[f"/author/{name.replace(' ', '-')}"] = AUTHOR_HTML.format(
+            name=name, description=description
+        )
+
+    return site
+
+
+def start_fixture_server(
+    pages: int,
+    authors: int,
+    port: int = 0,
+    latency: float = 0,
+    quotes_per_page: int = QUOTES_PER_PAGE,
+    error_rate: float = 0,
+    seed: int = 0,
+) -> tuple:
+    """Serves the generated site from a background thread
+
+    Args:
+        pages (int): no. of quotes pages
+        authors (int): no. of distinct authors
+        port (int): port to listen on, 0 for any free port
+        latency (float): seconds every response is delayed, like a remote site
+        quotes_per_page (int): no. of quotes on every page
+        error_rate (float): share of requests answered 503, like an overloaded site
+        seed (int): seed of the site and of the errors
+
+    Returns:
+        tuple: the server (call shutdown() to stop it) and its base url
+    """
+    site = {
+        path: html.encode()
+        for path, html in render_pages(pages, authors, quotes_per_page, seed).items()
+    }
+    errors = random.Random(seed)
+    errors_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serves the pages of the site"""
+
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # pylint: disable=C0103
+            """Serves a page, 304 if the ETag matches, 404 or an injected 503"""
+
+            time.sleep(latency)
+            with errors_lock:
+                failed = errors.random() < error_rate
+            if failed:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = site.get(
+                self.path.rstrip("/") if "/author/" in self.path else self.path
+            )
+            etag = f'"{hashlib.sha1(body).hexdigest()}"' if body else None
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body or b"")))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+        def log_message(self, *args):  # pylint: disable=W0221
+            """Silences the request log"""
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+def main():
+    """Serves the fixture site until interrupted"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--authors", type=int, default=50)
+    parser.add_argument("--quotes-per-page", type=int, default=QUOTES_PER_PAGE)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, url = start_fixture_server(
+        args.pages,
+        args.authors,
+        port=args.port,
+        latency=args.latency,
+        quotes_per_page=args.quotes_per_page,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Serving {args.pages} pages at {url}, press Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
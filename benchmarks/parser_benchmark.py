@@ -0,0 +1,51 @@
+"""Parse throughput of the HTML parsers over saved fixture pages
+
+Usage:
+    python -m benchmarks.parser_benchmark --repeat 200
+"""
+
+import argparse
+import os
+import time
+from services.scraper.parsers import PARSERS, get_parser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+PAGE_URL = "https://quotes.toscrape.com/"
+
+
+def read_fixture(name: str) -> bytes:
+    """Returns content of a saved page"""
+
+    with open(os.path.join(FIXTURES, name), "rb") as fixture:
+        return fixture.read()
+
+
+def main():
+    """Parses the fixture pages with every parser and prints pages/sec"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    quotes_page = read_fixture("quotes_page.html")
+    author_page = read_fixture("author_page.html")
+
+    for name in PARSERS:
+        html_parser = get_parser(name)
+        for page, parse in (
+            ("quotes", lambda: html_parser.parse_quotes(quotes_page, PAGE_URL)),
+            ("author", lambda: html_parser.parse_author(author_page)),
+        ):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                parse()
+            elapsed = time.perf_counter() - start
+            print(
+                f"parser={html_parser.name:9} page={page:7}"
+                f" pages/sec={args.repeat / elapsed:9.1f}"
+                f" ms/page={elapsed * 1000 / args.repeat:7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""End to end scrape_data against the local fixture server: pages/sec,
+database round trips and peak memory of the quotes and authors scraping
+
+Usage:
+    ENV=test MONGODB_DATABASE=quotes_bench python -m benchmarks.scrape_data_benchmark --pages 100 --drop
+
+With --rerun the task runs a second time on the scraped data, measuring a
+scheduled run where nothing changed.
+"""
+
+import argparse
+import resource
+import time
+from collections import Counter
+from pymongo import monitoring
+from app import create_app
+from database.models import ScrapedAuthor, ScrapedPage
+from services.scraper.scraper import scrape_data
+from benchmarks.corpus import ensure_empty
+from benchmarks.fixture_server import QUOTES_PER_PAGE, start_fixture_server
+
+# commands of the driver itself, not sent by the application
+DRIVER_COMMANDS = {"hello", "isMaster", "ismaster", "ping", "endSessions"}
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts the commands sent to MongoDB, one per round trip"""
+
+    def __init__(self):
+        self.commands = Counter()
+
+    def started(self, event):
+        if event.command_name not in DRIVER_COMMANDS:
+            self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def run(pages: int, commands: CommandCounter) -> None:
+    """Runs scrape_data in this process and prints its measurements"""
+
+    commands.commands.clear()
+    start = time.perf_counter()
+    result = scrape_data.apply(kwargs={"single_page": False}).get()
+    elapsed = time.perf_counter() - start
+
+    round_trips = sum(commands.commands.values())
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    quotes = result["quotes"]
+    print(
+        f"pages={pages:<5} processed={quotes['processed_pages']:<5}"
+        f" quotes={quotes['fetched_records']:<6}"
+        f" authors={result['authors']['fetched_records']:<5}"
+        f" elapsed={elapsed:7.2f}s pages/sec={pages / elapsed:8.2f}"
+        f" round_trips={round_trips:<6} ({round_trips / pages:.2f}/page)"
+        f" peak_rss={peak_kb / 1024:8.1f}MB"
+    )
+    print("    " + " ".join(f"{n}={c}" for n, c in commands.commands.most_common()))
+
+
+def main():
+    """Serves the fixture site and scrapes it into the benchmark database"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--authors", type=int, default=50)
+    parser.add_argument("--quotes-per-page", type=int, default=QUOTES_PER_PAGE)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rerun", action="store_true")
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    # listeners are registered before the app connects to MongoDB
+    commands = CommandCounter()
+    monitoring.register(commands)
+
+    server, url = start_fixture_server(
+        args.pages,
+        args.authors,
+        latency=args.latency,
+        quotes_per_page=args.quotes_per_page,
+        error_rate=args.error_rate,
+    )
+    app = create_app("benchmark")
+    app.config["SCRAPER_BASE_URL"] = url
+    try:
+        with app.app_context():
+            ensure_empty(args.drop)
+            ScrapedAuthor.drop_collection()
+            ScrapedPage.drop_collection()
+
+            run(args.pages, commands)
+            if args.rerun:
+                run(args.pages, commands)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
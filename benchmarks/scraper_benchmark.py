@@ -0,0 +1,76 @@
+"""Pages/sec and peak memory of the quote crawlers against a local fixture server
+
+Usage:
+    python -m benchmarks.scraper_benchmark --pages 100 --modes http selenium
+
+With --rerun every crawler runs a second time with the fingerprints of the
+first run, measuring a scheduled run where nothing changed.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+from benchmarks.fixture_server import start_fixture_server
+from services.scraper.crawler import CRAWLERS, PageFingerprints
+
+
+def run_crawler(
+    mode: str, url: str, rerun: bool, results: multiprocessing.Queue
+) -> None:
+    """Crawls all the pages and reports elapsed time and peak memory
+
+    Runs in its own process, so the peak RSS is of this crawler only.
+    Browser processes are counted through RUSAGE_CHILDREN once they exit.
+    """
+    fingerprints = None
+    if rerun:
+        first_run = PageFingerprints()
+        for _ in CRAWLERS[mode](url, False, first_run):
+            pass
+        fingerprints = PageFingerprints(first_run.changed)
+
+    start = time.perf_counter()
+    quotes = sum(len(quotes) for _, quotes in CRAWLERS[mode](url, False, fingerprints))
+    elapsed = time.perf_counter() - start
+
+    peak_kb = (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    results.put((quotes, elapsed, peak_kb))
+
+
+def main():
+    """Serves the fixture site and prints throughput of every crawler"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--authors", type=int, default=50)
+    parser.add_argument("--modes", nargs="+", default=list(CRAWLERS))
+    parser.add_argument("--rerun", action="store_true")
+    args = parser.parse_args()
+
+    server, url = start_fixture_server(args.pages, args.authors)
+    try:
+        for mode in args.modes:
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=run_crawler, args=(mode, url, args.rerun, results)
+            )
+            process.start()
+            quotes, elapsed, peak_kb = results.get()
+            process.join()
+
+            print(
+                f"mode={mode:9} rerun={args.rerun!s:5}"
+                f" pages={args.pages:<5} quotes={quotes:<6}"
+                f" pages/sec={args.pages / elapsed:8.2f}"
+                f" peak_rss={peak_kb / 1024:8.1f}MB"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
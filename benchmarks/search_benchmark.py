@@ -0,0 +1,59 @@
+"""Latency of GET /quotes/search/ on a synthetic corpus
+
+Usage:
+    ENV=test python -m benchmarks.search_benchmark --quotes 500000 --drop
+"""
+
+import argparse
+import statistics
+import time
+from app import create_app
+from benchmarks.corpus import ensure_empty, seed_corpus
+
+QUERIES = ["love", "life truth", "happiness", '"never forget"', "impossible dream"]
+
+
+def measure(client, url: str, repeat: int) -> list:
+    """Returns latencies (ms) of repeated GET requests"""
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.get_json()
+
+    return latencies
+
+
+def main():
+    """Seeds the corpus and prints latency of every query"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--authors", type=int, default=1000)
+    parser.add_argument("--quotes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    app = create_app("benchmark")
+    client = app.test_client()
+
+    ensure_empty(args.drop)
+    seed_corpus(args.authors, args.quotes)
+
+    print(f"{args.quotes} quotes, {args.repeat} requests per query")
+    for query in QUERIES:
+        for limit in (10, 100):
+            latencies = measure(
+                client, f"/quotes/search/?q={query}&limit={limit}", args.repeat
+            )
+            print(
+                f"q={query!r:22} limit={limit:<4}"
+                f" p50={statistics.median(latencies):8.2f}ms"
+                f" max={max(latencies):8.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
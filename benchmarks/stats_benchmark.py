@@ -0,0 +1,84 @@
+"""Latency of the live /stats/ computation, per-query vs. $facet pipeline
+
+Usage:
+    ENV=test python -m benchmarks.stats_benchmark --sizes 10000 100000 1000000 --drop
+"""
+
+import argparse
+import statistics
+import time
+from app import create_app
+from database.models import Quote, Author
+from resources.stats import get_live_stats, get_query_most_popular
+from benchmarks.corpus import ensure_empty, seed_corpus
+
+
+def get_legacy_stats() -> dict:
+    """Live statistics as computed before the $facet pipeline,
+    seven round trips per request"""
+
+    top_tags_query = get_query_most_popular("tags", 5)
+    tag_cursor = Quote.objects(author__exists=True).aggregate(top_tags_query)
+    top_author_query = get_query_most_popular("author", 1)
+    author_cursor = list(Quote.objects(author__exists=True).aggregate(top_author_query))
+    top_tags = [tag["_id"] for tag in tag_cursor]
+
+    top_author = Author.objects.get(id=author_cursor[0]["_id"])
+    author_tags = Quote.objects(author=author_cursor[0]["_id"]).aggregate(
+        top_tags_query
+    )
+
+    return {
+        "top_tags": top_tags,
+        "top_author": {
+            "name": top_author.name,
+            "total_quotes": author_cursor[0]["count"],
+            "top_tags": [tag["_id"] for tag in author_tags],
+        },
+        "total_quotes": Quote.objects(author__exists=True).count(),
+        "total_author": Author.objects.count(),
+    }
+
+
+def measure(func, repeat: int) -> list:
+    """Returns latencies (ms) of repeated calls"""
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def main():
+    """Seeds a corpus of every size and prints latency of both implementations"""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--authors", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    app = create_app("benchmark")
+    with app.app_context():
+        for index, size in enumerate(args.sizes):
+            ensure_empty(args.drop or index > 0)
+            seed_corpus(args.authors, size)
+
+            for name, func in (
+                ("legacy", get_legacy_stats),
+                ("facet", lambda: get_live_stats(5, 1)),
+            ):
+                latencies = measure(func, args.repeat)
+                print(
+                    f"quotes={size:<8} {name:7}"
+                    f" p50={statistics.median(latencies):9.2f}ms"
+                    f" max={max(latencies):9.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
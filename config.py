@@ -2,6 +2,7 @@
 
 from os import environ
 from pydantic import BaseSettings
+from constants.app_constants import QUOTES_URL
 
 
 class GlobalConfig(BaseSettings):
@@ -19,8 +20,31 @@ class GlobalConfig(BaseSettings):
     CELERY: dict = {
         "broker_url": environ.get("CELERY_BROKER_URL"),
         "result_backend": environ.get("CELERY_RESULT_BACKEND"),
+        # page tasks of a distributed crawl, the limit applies per worker
+        "task_annotations": {
+            "services.scraper.distributed.scrape_page": {
+                "rate_limit": environ.get("SCRAPER_PAGE_RATE_LIMIT", "2/s")
+            }
+        },
     }
     LIMITER_STORAGE_URI: str = environ.get("LIMITER_STORAGE_URI")
+    CACHE_STORAGE_URI: str = environ.get(
+        "CACHE_STORAGE_URI", environ.get("LIMITER_STORAGE_URI")
+    )
+    # Redis of the worker registry, workers are pinged without it
+    WORKER_REGISTRY_URI: str = environ.get(
+        "WORKER_REGISTRY_URI", environ.get("CELERY_RESULT_BACKEND")
+    )
+    # Redis pub/sub of the task progress, status streams poll the backend without it
+    TASK_EVENTS_URI: str = environ.get(
+        "TASK_EVENTS_URI", environ.get("CELERY_RESULT_BACKEND")
+    )
+    # site the quotes are scraped from, e.g. a local fixture server
+    SCRAPER_BASE_URL: str = environ.get("SCRAPER_BASE_URL", QUOTES_URL)
+    # "http" crawls the static pages, "selenium" renders them in headless Chrome
+    SCRAPER_BACKEND: str = environ.get("SCRAPER_BACKEND", "http")
+    # "lxml" (default if installed) or "html5lib"
+    SCRAPER_PARSER: str = environ.get("SCRAPER_PARSER")
 
 
 class DevConfig(GlobalConfig):
@@ -33,6 +57,8 @@ class TestConfig(GlobalConfig):
     """Test Configurations"""
 
     TESTING: bool = True
+    # Tests change the database directly, cached responses would go stale
+    CACHE_STORAGE_URI: str = None
 
 
 configs = {
@@ -5,5 +5,55 @@ QUOTES_URL = "https://quotes.toscrape.com/"
 SCRAPING_SCHEDULER_DURATION = 120
 # DURATION in seconds
 SCRAPED_DATA_CLEAN_UP_DURATION = 86400
+# DURATION in minutes, full recount of the materialized stats
+STATS_RECONCILE_DURATION = 60
+# SCHEDULER LEASE, DURATION in seconds it is held without renewal, renewed every n seconds
+SCHEDULER_LEASE_TTL = 30
+SCHEDULER_LEASE_RENEW = 10
+# SIZE of top tags and top authors lists in the stats (default and max)
+STATS_TOP_N = 5
+STATS_TOP_N_MAX = 50
 # RATE LIMIT FOR SCRAPER ([count] [per|/] [n (optional)] [second|minute|hour|day|month|year][s])
 SCRAPER_RATE_LIMIT = "1/10minutes"
+# WORKER REGISTRY, TTL in seconds of a worker after its last heartbeat (sent every 2s)
+# and seconds the registry is cached in memory
+WORKER_TTL = 10
+WORKER_REGISTRY_CACHE_TTL = 2
+# TASK EVENTS stream, seconds between keep-alives and between reads of the
+# result backend when pub/sub is not configured
+TASK_EVENTS_KEEPALIVE = 15
+TASK_EVENTS_POLL_INTERVAL = 1
+# MAX DURATION in seconds of a task events stream, the client reconnects after it
+TASK_EVENTS_MAX_DURATION = 300
+# TIMEOUT in seconds of a scraper HTTP request
+SCRAPER_REQUEST_TIMEOUT = 10
+# CONCURRENT author page requests (total and per host)
+SCRAPER_CONCURRENCY = 16
+SCRAPER_HOST_CONCURRENCY = 8
+# RETRIES of a failed scraper request, backoff factor in seconds (0.5, 1, 2, ...)
+SCRAPER_RETRIES = 3
+SCRAPER_RETRY_BACKOFF = 0.5
+# BATCH SIZE of scraped quotes written to the database with one bulk write
+SCRAPER_BATCH_SIZE = 1000
+# PAGES crawled ahead of the database writes
+SCRAPER_PREFETCH_PAGES = 4
+# SELENIUM drivers kept warm per worker process, recycled after n tasks
+SELENIUM_POOL_SIZE = 1
+SELENIUM_DRIVER_MAX_USES = 20
+# PROGRESS of scraping tasks is written every n records or seconds, whichever first
+PROGRESS_REPORT_EVERY = 50
+PROGRESS_REPORT_INTERVAL = 1.0
+# PAGINATION of list endpoints (no. of documents per page)
+PAGINATION_DEFAULT_LIMIT = 50
+PAGINATION_MAX_LIMIT = 500
+# TAGS FILTER of the quotes list, max no. of tags (and of excluded tags) and
+# max no. of candidates ranked by matched tags
+TAGS_QUERY_MAX_TAGS = 10
+TAGS_QUERY_MAX_CANDIDATES = 5000
+# RESPONSE CACHE, TIMEOUT in seconds and max no. of cached responses
+CACHE_TIMEOUT = 300
+CACHE_MAX_ENTRIES = 10000
+# VERSION of a cache tag expires after TIMEOUT seconds without a write
+CACHE_VERSION_TIMEOUT = 86400
+# BATCH SIZE of mongo cursors while streaming list endpoints
+STREAM_BATCH_SIZE = 500
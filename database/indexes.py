@@ -0,0 +1,82 @@
+"""Commands for managing the indexes declared on the Data Models"""
+
+import click
+from flask.cli import AppGroup
+from database.models import (
+    Author,
+    ScrapedAuthor,
+    Quote,
+    ScheduledTask,
+    ScrapedPage,
+    Stats,
+    TagStat,
+    AuthorStat,
+    SchedulerLease,
+)
+
+MODELS = (
+    Author,
+    ScrapedAuthor,
+    Quote,
+    ScheduledTask,
+    ScrapedPage,
+    Stats,
+    TagStat,
+    AuthorStat,
+    SchedulerLease,
+)
+
+indexes_cli = AppGroup("indexes", help="Create and check database indexes.")
+
+
+def get_index_drift() -> dict:
+    """Compares the declared indexes with the indexes in the database
+
+    Returns:
+        dict: missing and extra indexes of every collection that drifted
+    """
+    drift = {}
+    for model in MODELS:
+        diff = model.compare_indexes()
+        # _id index is reported missing until the collection is created
+        diff["missing"] = [index for index in diff["missing"] if index != [("_id", 1)]]
+        if diff["missing"] or diff["extra"]:
+            drift[model._get_collection_name()] = diff
+
+    return drift
+
+
+def report_drift(drift: dict) -> None:
+    """Prints missing and extra indexes"""
+
+    if not drift:
+        click.echo("Indexes are in sync with the models.")
+
+    for collection, diff in drift.items():
+        for index in diff["missing"]:
+            click.echo(f"{collection}: missing index {index}")
+        for index in diff["extra"]:
+            click.echo(f"{collection}: extra index {index}")
+
+
+@indexes_cli.command("sync")
+def sync_indexes() -> None:
+    """Create the missing indexes and report the remaining drift"""
+
+    for model in MODELS:
+        model.ensure_indexes()
+        click.echo(f"{model._get_collection_name()}: indexes created")
+
+    # Indexes that exist in the database but are not declared are not dropped,
+    # they are reported so they can be removed deliberately.
+    report_drift(get_index_drift())
+
+
+@indexes_cli.command("check")
+def check_indexes() -> None:
+    """Report drift between the declared and the existing indexes"""
+
+    drift = get_index_drift()
+    report_drift(drift)
+    if drift:
+        raise SystemExit(1)
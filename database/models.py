@@ -42,7 +42,10 @@ class ScrapedAuthor(db.Document):
             {
                 "fields": ["updatedOn"],
                 "expireAfterSeconds": SCRAPED_DATA_CLEAN_UP_DURATION,
-            }
+            },
+            # add_quotes_db looks up authors by link, page tasks running
+            # at the same time upsert the same author once
+            {"fields": ["link"], "unique": True},
         ],
     }
 
@@ -65,7 +68,23 @@ class Quote(db.Document):
     updatedBy = db.StringField()
     createdOn = db.DateTimeField(default=datetime.datetime.utcnow)
     updatedOn = db.DateTimeField(default=datetime.datetime.utcnow)
-    meta = {"collection": "quotes"}
+    meta = {
+        "collection": "quotes",
+        "indexes": [
+            # multikey index for filtering quotes by tags
+            {"fields": ["tags"]},
+            # serves author__exists and quotes of an author sorted by creation
+            {"fields": ["author", "createdOn"]},
+            # update_authors_collection re-points quotes of a scraped author
+            {"fields": ["scrapedAuthor"]},
+            # full-text search, matches in the quote rank above matches in tags
+            {
+                "fields": ["$quote", "$tags"],
+                "default_language": "english",
+                "weights": {"quote": 10, "tags": 2},
+            },
+        ],
+    }
 
     def to_json(self, *args, **kwargs):
         obj = self.to_mongo().to_dict()
@@ -82,3 +101,64 @@ class ScheduledTask(db.Document):
     description = db.StringField()
     status = db.DictField(default=ScrapingTask().to_dict())
     meta = {"collection": "scheduledTasks"}
+
+
+class ScrapedPage(db.Document):
+    """Fingerprint of a scraped page, used for conditional requests"""
+
+    url = db.StringField(primary_key=True)
+    etag = db.StringField()
+    lastModified = db.StringField()
+    contentHash = db.StringField()
+    # next listing page, followed without parsing an unchanged page
+    nextUrl = db.StringField()
+    updatedOn = db.DateTimeField(default=datetime.datetime.utcnow)
+    meta = {"collection": "scrapedPages"}
+
+
+class Stats(db.Document):
+    """Materialized Statistics, a single document kept up to date by writes"""
+
+    key = db.StringField(primary_key=True, default="global")
+    totalQuotes = db.IntField(default=0)
+    totalAuthors = db.IntField(default=0)
+    topTags = db.ListField(db.StringField())
+    topAuthor = db.DictField()
+    topAuthors = db.ListField(db.DictField())
+    updatedOn = db.DateTimeField(default=datetime.datetime.utcnow)
+    reconciledOn = db.DateTimeField(default=datetime.datetime.utcnow)
+    meta = {"collection": "stats"}
+
+
+class TagStat(db.Document):
+    """No. of Quotes with a tag, overall (author is None) and per Author"""
+
+    tag = db.StringField(required=True)
+    author = db.ObjectIdField()
+    count = db.IntField(default=0)
+    meta = {
+        "collection": "tagStats",
+        "indexes": [
+            {"fields": ["tag", "author"], "unique": True},
+            # top tags overall and of an author
+            {"fields": ["author", "-count"]},
+        ],
+    }
+
+
+class AuthorStat(db.Document):
+    """No. of Quotes of an Author"""
+
+    author = db.ObjectIdField(required=True, unique=True)
+    count = db.IntField(default=0)
+    meta = {"collection": "authorStats", "indexes": [{"fields": ["-count"]}]}
+
+
+class SchedulerLease(db.Document):
+    """Lease of the scheduler, its holder is the only process running the jobs"""
+
+    name = db.StringField(primary_key=True)
+    holder = db.StringField()
+    acquiredOn = db.DateTimeField()
+    expiresOn = db.DateTimeField()
+    meta = {"collection": "schedulerLeases"}
@@ -5,27 +5,80 @@ from flask import Response, jsonify, make_response, current_app
 from mongoengine.errors import DoesNotExist, ValidationError, NotUniqueError
 from flask_restful import Resource
 from flask_pydantic import validate
-from database.models import Author
+from database.models import Author, Quote
 from database.schemas import AuthorSchema, AuthorUpdateSchema
 from utils.utils import cursor_to_json
+from utils.pagination import InvalidPageArgs, get_page_args
+from utils.streaming import wants_stream, stream_json_lines
+from utils.cache import cache, quote_list_tags
+from services.stats.counters import StatsDelta
+from constants.app_constants import PAGINATION_DEFAULT_LIMIT, STREAM_BATCH_SIZE
+
+
+def invalidate_author(author_id: str) -> None:
+    """Invalidates cached responses of the Author and of its Quotes,
+    which contain the name of the Author"""
+
+    if not cache.enabled:
+        return
+
+    tags = [f"author:{author_id}", "authors", "stats"]
+    quotes = list(Quote.objects(author=author_id).only("tags"))
+    # lists of Quotes are unchanged if the Author has no Quotes
+    if quotes:
+        tags += [f"quote:{quote.id}" for quote in quotes]
+        tags += quote_list_tags({tag for quote in quotes for tag in quote.tags})
+    cache.invalidate(*tags)
 
 
 class AuthorsApi(Resource):
     """GET and POST API for Authors"""
 
+    @cache.cached(["authors"])
     def get(self) -> Response:
-        """Get all the Authors
+        """Get a page of the Authors
+
+        Query Params:
+            limit (int): no. of authors per page
+            after (str): cursor of the next page, from the previous response
+            stream (str): "1" to stream all the authors as newline delimited JSON
 
         Returns:
-            Response: JSON object of all the Authors
+            Response: JSON object of the Authors and the next page cursor
         """
         current_app.logger.info("GET Authors - REQUEST RECEIVED")
 
-        cursor = Author.objects().exclude("scrapeId")
+        stream = wants_stream()
+        try:
+            page = get_page_args(
+                default_limit=None if stream else PAGINATION_DEFAULT_LIMIT
+            )
+        except InvalidPageArgs as exp_err:
+            current_app.logger.error(f"GET Authors - {str(exp_err)}")
+            return make_response(jsonify({"Error": str(exp_err)}), 400)
+
+        cursor = Author.objects()
+        if page.after:
+            cursor = cursor.filter(id__gt=page.after["id"])
+        cursor = cursor.exclude("scrapeId").order_by("id")
+        if page.fetch_limit:
+            cursor = cursor.limit(page.fetch_limit)
+        if stream:
+            current_app.logger.info("GET Authors - STREAMING")
+            authors = cursor.batch_size(STREAM_BATCH_SIZE)
+            return stream_json_lines(
+                (author.to_json() for author in authors), page.limit
+            )
+
         authors = cursor_to_json(cursor)
+        authors, next_cursor = page.paginate(
+            authors, lambda author: {"id": author["_id"]}
+        )
 
         current_app.logger.info(f"GET Authors - FETCHED {len(authors)} Authors")
-        return make_response(jsonify(authors), 200)
+        return make_response(
+            jsonify({"data": authors, "next_cursor": next_cursor}), 200
+        )
 
     @validate()
     def post(self, body: AuthorSchema) -> Response:
@@ -39,8 +92,10 @@ class AuthorsApi(Resource):
         try:
             author = Author(**body.dict(), createdBy="author")
             author.save()
+            StatsDelta(authors=1).apply()
 
             response, status = author.to_json(), 201
+            cache.invalidate("authors", "stats")
             current_app.logger.info(f"POST Author - ADDED Author Id:{author.id}")
         except NotUniqueError:
             response, status = {"Error": "Author Name Already Exist"}, 400
@@ -55,6 +110,7 @@ class AuthorsApi(Resource):
 class AuthorApi(Resource):
     """GET Detail, PUT, and DELETE API for Authors"""
 
+    @cache.cached(lambda author_id: [f"author:{author_id}"])
     def get(self, author_id: str) -> Response:
         """Get single Author with given id
 
@@ -96,6 +152,10 @@ class AuthorApi(Resource):
             )
 
             response, status = {"id": author_id}, 200
+            invalidate_author(author_id)
+            if body.name is not None:
+                # name of the top author is stored in the stats
+                StatsDelta().apply()
             current_app.logger.info(f"PUT Author Id:{author_id} - UPDATED")
         except NotUniqueError:
             response, status = {"Error": "Author Name Already Exist"}, 400
@@ -122,7 +182,13 @@ class AuthorApi(Resource):
 
         try:
             author = Author.objects.get(id=author_id)
+            # Quotes of the Author are deleted with it (CASCADE)
+            stats = StatsDelta(authors=-1)
+            for quote in Quote.objects(author=author.id).only("tags"):
+                stats.remove_quote(author.id, quote.tags)
+            invalidate_author(author_id)
             author.delete()
+            stats.apply()
             response, status = "", 204
             current_app.logger.info(f"DELETE Author Id:{author_id} - DELETED")
         except (DoesNotExist, ValidationError):
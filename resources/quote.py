@@ -1,70 +1,240 @@
 """All the Quotes API endpoints"""
 
 from datetime import datetime, timezone
+from typing import Iterator
 from flask import Response, request, jsonify, make_response, current_app
 from mongoengine.errors import DoesNotExist, ValidationError, NotUniqueError
 from flask_restful import Resource
 from flask_pydantic import validate
 from database.models import Quote, Author
 from database.schemas import QuoteSchema, QuoteUpdateSchema
-from utils.utils import cursor_to_json, quote_aggregate_to_json
+from utils.utils import (
+    quote_cursor_to_json,
+    quote_aggregate_to_json,
+    iter_quote_cursor_json,
+    iter_quote_aggregate_json,
+)
+from utils.pagination import Page, InvalidPageArgs, get_page_args
+from utils.tag_query import TagQuery, InvalidTagQuery, get_tag_query_args
+from utils.streaming import wants_stream, stream_json_lines
+from utils.cache import cache, quote_list_tags
+from services.stats.counters import StatsDelta
+from constants.app_constants import (
+    PAGINATION_DEFAULT_LIMIT,
+    STREAM_BATCH_SIZE,
+    TAGS_QUERY_MAX_CANDIDATES,
+)
+
+
+def get_query_quote_author(exclude: tuple = ()) -> list:
+    """Returns Query stages that join the name of the author to quotes
+
+    Args:
+        exclude (tuple): extra fields of the quote to leave out
+    """
+
+    return [
+        {
+            "$lookup": {
+                "from": "authors",
+                "localField": "author",
+                "foreignField": "_id",
+                "as": "author",
+            }
+        },
+        {"$set": {"author": {"$arrayElemAt": ["$author", 0]}}},
+        {
+            "$project": {
+                **{field: 0 for field in exclude},
+                "scrapedAuthor": 0,
+                "author.dob": 0,
+                "author.country": 0,
+                "author.description": 0,
+                "author.createdOn": 0,
+                "author.updatedOn": 0,
+                "author.scrapeId": 0,
+            }
+        },
+    ]
+
+
+def get_query_ranked_page(field: str, cursor_key: str, page: Page) -> list:
+    """Returns Query stages that sort by a rank field and select the page
+
+    Documents are sorted by the rank descending, _id is the tiebreak
+    that keeps the keyset cursor stable between pages.
+
+    Args:
+        field (str): rank field computed by the previous stages
+        cursor_key (str): key of the rank in the cursor
+        page (Page): requested page
+    """
+
+    pipeline = []
+    if page.after:
+        rank = page.after[cursor_key]
+        pipeline.append(
+            {
+                "$match": {
+                    "$or": [
+                        {field: {"$lt": rank}},
+                        {field: rank, "_id": {"$gt": page.after["id"]}},
+                    ]
+                }
+            }
+        )
+    pipeline.append({"$sort": {field: -1, "_id": 1}})
+    if page.fetch_limit:
+        pipeline.append({"$limit": page.fetch_limit})
+
+    return pipeline
+
+
+def get_query_quotes_by_tags(tag_query: TagQuery, page: Page) -> list:
+    """Returns Query to get a page of quotes of a tags query, the limit is
+    applied before the author join. The queryset must contain the filter
+    of the tags query.
+
+    Ranked queries compute the no. of matched tags of at most
+    TAGS_QUERY_MAX_CANDIDATES quotes selected by the tags index, a query
+    matching more quotes ranks the first candidates of the index only.
+
+    Args:
+        tag_query (TagQuery): requested tags filter
+        page (Page): requested page
+    """
+
+    if not tag_query.ranked:
+        pipeline = []
+        if page.after:
+            pipeline.append({"$match": {"_id": {"$gt": page.after["id"]}}})
+        pipeline.append({"$sort": {"_id": 1}})
+        if page.fetch_limit:
+            pipeline.append({"$limit": page.fetch_limit})
+        return [*pipeline, *get_query_quote_author()]
+
+    return [
+        {"$limit": TAGS_QUERY_MAX_CANDIDATES},
+        {"$addFields": {"matched": tag_query.to_matched_count()}},
+        *get_query_ranked_page("matched", "m", page),
+        *get_query_quote_author(exclude=("matched",)),
+    ]
+
+
+def iter_quotes_by_tags(tag_query: TagQuery, page: Page) -> Iterator[dict]:
+    """Yields quotes of a tags query, most matched tags first
+
+    Args:
+        tag_query (TagQuery): requested tags filter
+        page (Page): requested page
+
+    Yields:
+        dict: json object of a quote
+    """
+    queryset = Quote.objects(author__exists=True, __raw__=tag_query.to_filter())
+    cursor = queryset.aggregate(
+        get_query_quotes_by_tags(tag_query, page), batchSize=STREAM_BATCH_SIZE
+    )
+    yield from iter_quote_aggregate_json(cursor)
+
+
+def get_query_quotes_by_text(page: Page) -> list:
+    """Returns Query to get a page of quotes matched by a text search,
+    sorted by relevance. The queryset must contain the $text filter."""
+
+    return [
+        {"$addFields": {"score": {"$meta": "textScore"}}},
+        *get_query_ranked_page("score", "s", page),
+        *get_query_quote_author(),
+    ]
+
+
+def get_quotes_cache_tags() -> list:
+    """Returns cache tags of a GET /quotes/ response, a list filtered by tags
+    only changes with the quotes having one of them"""
+
+    try:
+        tag_query = get_tag_query_args()
+    except InvalidTagQuery:
+        return ["quotes"]
+
+    if tag_query and tag_query.tags:
+        return [f"tag:{tag}" for tag in tag_query.tags]
+    return ["quotes"]
 
 
 class QuotesApi(Resource):
     """GET and POST API for Quotes"""
 
+    @cache.cached(get_quotes_cache_tags)
     def get(self) -> Response:
-        """Get all the Quotes
+        """Get a page of the Quotes
+
+        Query Params:
+            tags (str): comma separated tags, quotes are sorted by matched tags
+            mode (str): "any" (default) to match any of the tags, "all" for all
+            exclude (str): comma separated tags the quotes must not have
+            limit (int): no. of quotes per page
+            after (str): cursor of the next page, from the previous response
+            stream (str): "1" to stream all the quotes as newline delimited JSON
 
         Returns:
-            Response: JSON object of all the Quotes
+            Response: JSON object of the Quotes and the next page cursor
         """
-        current_app.logger.info("GET Authors - REQUEST RECEIVED")
-
-        tags = request.args.get("tags", None)
-        if tags is not None:
-            tags = tags.split(",")
-            pipeline = [
-                {"$match": {"tags": {"$in": tags}}},
-                {
-                    "$addFields": {
-                        "matchedCount": {"$size": {"$setIntersection": [tags, "$tags"]}}
-                    }
-                },
-                {"$sort": {"matchedCount": -1}},
-                {
-                    "$lookup": {
-                        "from": "authors",
-                        "localField": "author",
-                        "foreignField": "_id",
-                        "as": "author",
-                    }
-                },
-                {"$set": {"author": {"$arrayElemAt": ["$author", 0]}}},
-                {
-                    "$project": {
-                        "matchedCount": 0,
-                        "scrapedAuthor": 0,
-                        "author.dob": 0,
-                        "author.country": 0,
-                        "author.description": 0,
-                        "author.createdOn": 0,
-                        "author.updatedOn": 0,
-                        "author.scrapeId": 0,
-                    }
+        current_app.logger.info("GET Quotes - REQUEST RECEIVED")
+
+        stream = wants_stream()
+        try:
+            tag_query = get_tag_query_args()
+            page = get_page_args(
+                cursor_keys=("m",) if tag_query and tag_query.ranked else (),
+                default_limit=None if stream else PAGINATION_DEFAULT_LIMIT,
+            )
+            if page.after and not isinstance(page.after.get("m", 0), int):
+                raise InvalidPageArgs("Invalid cursor")
+        except (InvalidTagQuery, InvalidPageArgs) as exp_err:
+            current_app.logger.error(f"GET Quotes - {str(exp_err)}")
+            return make_response(jsonify({"Error": str(exp_err)}), 400)
+
+        if tag_query and tag_query.tags:
+            tags = tag_query.tags
+            quotes = iter_quotes_by_tags(tag_query, page)
+            if stream:
+                current_app.logger.info(f"GET Quotes by tags {tags} - STREAMING")
+                return stream_json_lines(quotes, page.limit)
+
+            quotes, next_cursor = page.paginate(
+                list(quotes),
+                lambda quote: {
+                    "m": len(set(tags).intersection(quote["tags"])),
+                    "id": quote["_id"],
                 },
-            ]
-            cursor = Quote.objects(author__exists=True).aggregate(pipeline)
-            quotes = quote_aggregate_to_json(cursor)
+            )
             current_app.logger.info(
                 f"GET Quotes by tags {tags} - FETCHED {len(quotes)} Quotes"
             )
         else:
-            cursor = Quote.objects(author__exists=True).exclude("scrapedAuthor")
-            quotes = cursor_to_json(cursor)
+            cursor = Quote.objects(author__exists=True)
+            if tag_query:
+                cursor = cursor.filter(__raw__=tag_query.to_filter())
+            if page.after:
+                cursor = cursor.filter(id__gt=page.after["id"])
+            cursor = cursor.exclude("scrapedAuthor").order_by("id")
+            if page.fetch_limit:
+                cursor = cursor.limit(page.fetch_limit)
+            if stream:
+                current_app.logger.info("GET Quotes - STREAMING")
+                return stream_json_lines(
+                    iter_quote_cursor_json(cursor, STREAM_BATCH_SIZE), page.limit
+                )
+
+            quotes = quote_cursor_to_json(cursor)
+            quotes, next_cursor = page.paginate(
+                quotes, lambda quote: {"id": quote["_id"]}
+            )
             current_app.logger.info(f"GET Quotes - FETCHED {len(quotes)} Quotes")
 
-        return make_response(jsonify(quotes), 200)
+        return make_response(jsonify({"data": quotes, "next_cursor": next_cursor}), 200)
 
     @validate()
     def post(self, body: QuoteSchema) -> Response:
@@ -82,7 +252,12 @@ class QuotesApi(Resource):
             quote = Quote(**body.dict(), createdBy="author")
             quote.save()
 
+            stats = StatsDelta()
+            stats.add_quote(body.author, body.tags)
+            stats.apply()
+
             response, status = quote.to_json(), 201
+            cache.invalidate("stats", *quote_list_tags(body.tags))
             current_app.logger.info(f"POST Quote - ADDED Quote Id:{quote.id}")
         except NotUniqueError:
             response, status = {"Error": "Quote Already Exist"}, 400
@@ -113,13 +288,26 @@ class QuoteApi(Resource):
         current_app.logger.info(f"PUT Quote Id:{quote_id} - RECEIVED REQUEST")
 
         try:
-            Quote.objects.get(id=quote_id).update(
+            quote = Quote.objects.get(id=quote_id)
+            quote.update(
                 **body.dict(exclude_unset=True),
                 updatedOn=datetime.now(timezone.utc),
                 updatedBy="author",
             )
 
+            if body.tags is not None:
+                author_id = quote.to_mongo().get("author")
+                stats = StatsDelta()
+                stats.remove_quote(author_id, quote.tags)
+                stats.add_quote(author_id, body.tags)
+                stats.apply()
+
             response, status = {"id": quote_id}, 200
+            cache.invalidate(
+                f"quote:{quote_id}",
+                "stats",
+                *quote_list_tags({*quote.tags, *(body.tags or [])}),
+            )
             current_app.logger.info(f"PUT Quote Id:{quote_id} - UPDATED")
         except NotUniqueError:
             response, status = {"Error": "Quote Already Exist"}, 400
@@ -147,7 +335,13 @@ class QuoteApi(Resource):
         try:
             quote = Quote.objects.get(id=quote_id)
             quote.delete()
+
+            stats = StatsDelta()
+            stats.remove_quote(quote.to_mongo().get("author"), quote.tags)
+            stats.apply()
+
             response, status = "", 204
+            cache.invalidate(f"quote:{quote_id}", "stats", *quote_list_tags(quote.tags))
             current_app.logger.info(f"DELETE Quote Id:{quote_id} - DELETED")
         except (DoesNotExist, ValidationError):
             response, status = {"Error": "Quote with given id Does Not Exist!"}, 404
@@ -155,6 +349,7 @@ class QuoteApi(Resource):
 
         return make_response(jsonify(response), status)
 
+    @cache.cached(lambda quote_id: [f"quote:{quote_id}"])
     def get(self, quote_id: str) -> Response:
         """Get single Quote with given id
 
@@ -167,11 +362,59 @@ class QuoteApi(Resource):
         current_app.logger.info(f"GET Quote Id:{quote_id} - RECEIVED REQUEST")
 
         try:
-            quote = Quote.objects.exclude("scrapedAuthor").get(id=quote_id)
-            response, status = quote.to_json(), 200
+            quotes = quote_cursor_to_json(
+                Quote.objects(id=quote_id).exclude("scrapedAuthor")
+            )
+            if not quotes:
+                raise DoesNotExist()
+
+            response, status = quotes[0], 200
             current_app.logger.info(f"GET Quote Id:{quote_id} - FETCHED")
         except (DoesNotExist, ValidationError):
             response, status = {"Error": "Quote with given id Does Not Exist!"}, 404
             current_app.logger.error(f"GET Quote Id:{quote_id} - NOT FOUND")
 
         return make_response(jsonify(response), status)
+
+
+class QuoteSearchApi(Resource):
+    """Full-text search API for Quotes"""
+
+    @cache.cached(["quotes"])
+    def get(self) -> Response:
+        """Search the Quotes by text, most relevant first
+
+        Query Params:
+            q (str): words or "phrase" to search in quotes and tags
+            limit (int): no. of quotes per page
+            after (str): cursor of the next page, from the previous response
+
+        Returns:
+            Response: JSON object of the Quotes and the next page cursor
+        """
+        current_app.logger.info("GET Quotes Search - REQUEST RECEIVED")
+
+        text = request.args.get("q", "").strip()
+        if not text:
+            current_app.logger.error("GET Quotes Search - EMPTY QUERY")
+            return make_response(jsonify({"Error": "Query param q is required"}), 400)
+
+        try:
+            page = get_page_args(cursor_keys=("s",))
+        except InvalidPageArgs as exp_err:
+            current_app.logger.error(f"GET Quotes Search - {str(exp_err)}")
+            return make_response(jsonify({"Error": str(exp_err)}), 400)
+
+        pipeline = get_query_quotes_by_text(page)
+        cursor = (
+            Quote.objects(author__exists=True).search_text(text).aggregate(pipeline)
+        )
+        quotes = quote_aggregate_to_json(cursor)
+        quotes, next_cursor = page.paginate(
+            quotes, lambda quote: {"s": quote["score"], "id": quote["_id"]}
+        )
+
+        current_app.logger.info(
+            f"GET Quotes Search {text} - FETCHED {len(quotes)} Quotes"
+        )
+        return make_response(jsonify({"data": quotes, "next_cursor": next_cursor}), 200)
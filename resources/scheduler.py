@@ -0,0 +1,34 @@
+"""Scheduler API endpoint"""
+
+from flask import jsonify, make_response, current_app
+from flask_restful import Resource
+from services.scraper.scheduler import get_scheduler_lease
+
+
+class SchedulerApi(Resource):
+    """Returns the node running the scheduled jobs"""
+
+    def get(self):
+        """Returns the holder of the scheduler lease and the state of this node
+
+        Returns:
+            Response: JSON object of the lease
+        """
+        current_app.logger.info("GET Scheduler - REQUEST RECEIVED")
+
+        try:
+            lease = get_scheduler_lease()
+            leader = current_app.extensions.get("scheduler_leader")
+            response, status = {
+                "leader": lease["holder"] if lease else None,
+                "acquired_on": lease.get("acquiredOn") if lease else None,
+                "expires_on": lease["expiresOn"] if lease else None,
+                "node": leader.node if leader else None,
+                "is_leader": leader.is_leader if leader else False,
+            }, 200
+            current_app.logger.info(f"GET Scheduler - Leader: {response['leader']}")
+        except Exception as exp_err:
+            response, status = {"Error": str(exp_err)}, 400
+            current_app.logger.error(f"GET Scheduler - {str(exp_err)}")
+
+        return make_response(jsonify(response), status)
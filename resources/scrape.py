@@ -1,13 +1,28 @@
 """All the Scrape API endpoints"""
 
-from flask import make_response, jsonify, current_app
+import time
+from typing import Iterator, Optional
+from flask import request, make_response, jsonify, current_app
 from flask_restful import Resource
 from celery import states
 from celery.result import AsyncResult
 from services.scraper.scraper import scrape_data
+from services.scraper.distributed import (
+    scrape_data_distributed,
+    is_distributed_crawl,
+    get_crawl_status,
+)
 from utils.celery_app import check_celery_available
 from utils.rate_limiter import limiter
-from constants.app_constants import SCRAPER_RATE_LIMIT
+from utils.worker_registry import worker_registry
+from utils.task_events import task_events
+from utils.streaming import stream_events
+from constants.app_constants import (
+    SCRAPER_RATE_LIMIT,
+    TASK_EVENTS_KEEPALIVE,
+    TASK_EVENTS_POLL_INTERVAL,
+    TASK_EVENTS_MAX_DURATION,
+)
 
 
 class ScrapeDataApi(Resource):
@@ -18,13 +33,19 @@ class ScrapeDataApi(Resource):
     def get(self):
         """Scrape and add data to the database
 
+        Query Params:
+            mode (str): "distributed" to fetch the pages on all the workers
+
         Returns:
             Response: JSON object of message success
         """
         current_app.logger.info("GET Scrape Data - REQUEST RECEIVED")
 
         try:
-            task = scrape_data.delay()
+            if request.args.get("mode") == "distributed":
+                task = scrape_data_distributed.delay()
+            else:
+                task = scrape_data.delay()
 
             response, status = {
                 "message": "Scraping task started!",
@@ -38,6 +59,80 @@ class ScrapeDataApi(Resource):
         return make_response(jsonify(response), status)
 
 
+def format_task_status(state: str, info: object) -> dict:
+    """Returns the status response of a task from its state and progress"""
+
+    if state == states.FAILURE:
+        return {"task_status": "FAILED"}
+    if state == states.PENDING:
+        return {"task_status": "Task id does not exists"}
+
+    return {"task_status": state} | (info if isinstance(info, dict) else {})
+
+
+def iter_task_events(task_id: str) -> Iterator[Optional[dict]]:
+    """Yields the status of a task every time it changes, until it completes
+
+    Updates are received from the task events, the result backend is read
+    every TASK_EVENTS_POLL_INTERVAL seconds if they are not published.
+    A distributed crawl is followed through its page and merge tasks.
+
+    Every stream holds a server thread, it ends after TASK_EVENTS_MAX_DURATION
+    seconds and the client reconnects to follow the task.
+
+    Args:
+        task_id (str): id of the task
+
+    Yields:
+        dict: status of the task, None if nothing changed for
+            TASK_EVENTS_KEEPALIVE seconds
+    """
+    deadline = time.monotonic() + TASK_EVENTS_MAX_DURATION
+    # subscribed before the state is read, so no update is missed
+    pubsub = task_events.subscribe(task_id) if task_events.enabled else None
+    try:
+        task_result = AsyncResult(task_id)
+        state, info, crawl = task_result.status, task_result.result, None
+        last_status = None
+        while True:
+            if crawl is None and state == states.SUCCESS and is_distributed_crawl(info):
+                crawl = info
+                if pubsub:
+                    task_events.subscribe(
+                        crawl["group_id"], crawl["merge_id"], pubsub=pubsub
+                    )
+            if crawl:
+                state, info = get_crawl_status(crawl)
+
+            status = format_task_status(state, info)
+            if status != last_status:
+                yield status
+                last_status = status
+            if state in states.READY_STATES | {states.PENDING}:
+                return
+
+            if pubsub is None:
+                if time.monotonic() + TASK_EVENTS_POLL_INTERVAL > deadline:
+                    return
+                time.sleep(TASK_EVENTS_POLL_INTERVAL)
+                task_result = AsyncResult(task_id)
+                state, info = task_result.status, task_result.result
+                continue
+
+            event = None
+            while event is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                event = task_events.wait(pubsub, min(TASK_EVENTS_KEEPALIVE, remaining))
+                if event is None:
+                    yield None
+            state, info = event
+    finally:
+        if pubsub:
+            pubsub.close()
+
+
 class ScrapeStatus(Resource):
     """Returns status of background task (scraping)"""
 
@@ -53,14 +148,53 @@ class ScrapeStatus(Resource):
         current_app.logger.info("GET Scrape Status - REQUEST RECEIVED")
 
         task_result = AsyncResult(task_id)
-        result = {"task_status": "Task id does not exists"}
+        state, info = task_result.status, task_result.result
+        # a distributed crawl reports progress of its page and merge tasks
+        if state == states.SUCCESS and is_distributed_crawl(info):
+            state, info = get_crawl_status(info)
+
+        current_app.logger.info(f"GET Scrape Status - Status: {state}")
+        return make_response(jsonify(format_task_status(state, info)), 200)
+
+
+class ScrapeEventsApi(Resource):
+    """Streams status of background task (scraping) as Server-Sent Events"""
+
+    def get(self, task_id: str):
+        """Streams the task status every time it changes, until it completes
+
+        Args:
+            task_id (str): id of the task to get status
+
+        Returns:
+            Response: `text/event-stream` of the task status
+        """
+        current_app.logger.info(f"GET Scrape Events - STREAMING Task Id: {task_id}")
+
+        return stream_events(iter_task_events(task_id))
+
+
+class ScrapeWorkersApi(Resource):
+    """Returns the live Celery workers"""
+
+    def get(self):
+        """Returns the workers and how many of them consume the scraping queue
 
-        if task_result.status == states.FAILURE:
-            return {"task_status": "FAILED"}
+        Returns:
+            Response: JSON object of the workers
+        """
+        current_app.logger.info("GET Scrape Workers - REQUEST RECEIVED")
 
-        if task_result.status != states.PENDING:
-            result["task_status"] = task_result.status
-            result |= task_result.result
+        try:
+            workers = worker_registry.workers()
+            response, status = {
+                "workers": workers,
+                "queue": worker_registry.queue,
+                "scraping_workers": len(worker_registry.scraping_workers()),
+            }, 200
+            current_app.logger.info(f"GET Scrape Workers - {len(workers)} Workers")
+        except Exception as exp_err:
+            response, status = {"Error": str(exp_err)}, 400
+            current_app.logger.error(f"GET Scrape Workers - {str(exp_err)}")
 
-        current_app.logger.info(f"GET Scrape Status - Status: {task_result.status}")
-        return make_response(jsonify(result), 200)
+        return make_response(jsonify(response), status)
@@ -1,8 +1,10 @@
 """All the Statistics API endpoints"""
 
-from flask import current_app, make_response, jsonify
+from flask import current_app, request, make_response, jsonify
 from flask_restful import Resource
-from database.models import Quote, Author
+from database.models import Quote, Author, Stats
+from utils.cache import cache
+from constants.app_constants import STATS_TOP_N, STATS_TOP_N_MAX
 
 
 def get_query_most_popular(field, top_n):
@@ -17,47 +19,176 @@ def get_query_most_popular(field, top_n):
     ]
 
 
+def get_query_quote_stats(top_tags: int, top_authors: int) -> list:
+    """Returns Query that ranks tags and authors and counts quotes in one pass"""
+
+    return [
+        {
+            "$facet": {
+                "tags": get_query_most_popular("tags", top_tags),
+                "authors": get_query_most_popular("author", top_authors),
+                "total": [{"$count": "count"}],
+            }
+        }
+    ]
+
+
+def get_query_author_stats(author_ids: list, top_tags: int) -> list:
+    """Returns Query that counts authors, and gets names of the top authors
+    and top tags of the first one"""
+
+    return [
+        {
+            "$facet": {
+                "total": [{"$count": "count"}],
+                "names": [
+                    {"$match": {"_id": {"$in": author_ids}}},
+                    {"$project": {"name": 1}},
+                ],
+                "tags": [
+                    {"$match": {"_id": author_ids[0] if author_ids else None}},
+                    {
+                        "$lookup": {
+                            "from": "quotes",
+                            "localField": "_id",
+                            "foreignField": "author",
+                            "as": "quote",
+                        }
+                    },
+                    # $unwind right after $lookup is coalesced into it by the
+                    # server, quotes are not collected into one document
+                    {"$unwind": "$quote"},
+                    {"$replaceRoot": {"newRoot": "$quote"}},
+                    *get_query_most_popular("tags", top_tags),
+                ],
+            }
+        }
+    ]
+
+
+def get_live_stats(top_tags: int, top_authors: int) -> dict:
+    """Computes the Statistics from the Quotes and Authors collections"""
+
+    quote_stats = next(
+        Quote.objects(author__exists=True).aggregate(
+            get_query_quote_stats(top_tags, top_authors)
+        )
+    )
+    current_app.logger.info("GET Stats - FETCHED TOP Tags and Authors")
+
+    author_ids = [author["_id"] for author in quote_stats["authors"]]
+    author_stats = next(
+        Author.objects.aggregate(get_query_author_stats(author_ids, top_tags))
+    )
+    current_app.logger.info("GET Stats - FETCHED TOP Author Tags")
+
+    names = {author["_id"]: author["name"] for author in author_stats["names"]}
+    authors = [
+        {"name": names.get(author["_id"]), "total_quotes": author["count"]}
+        for author in quote_stats["authors"]
+    ]
+
+    return {
+        "top_tags": [tag["_id"] for tag in quote_stats["tags"]],
+        "top_author": {
+            **authors[0],
+            "top_tags": [tag["_id"] for tag in author_stats["tags"]],
+        }
+        if authors
+        else None,
+        "top_authors": authors,
+        "total_quotes": quote_stats["total"][0]["count"] if quote_stats["total"] else 0,
+        "total_author": author_stats["total"][0]["count"]
+        if author_stats["total"]
+        else 0,
+    }
+
+
+def get_materialized_stats(stats: Stats, top_tags: int, top_authors: int) -> dict:
+    """Returns the Statistics stored in the Stats document
+
+    updated_on is the time of the last incremental update and reconciled_on
+    the time of the last full recount, which bounds the drift of the counters.
+    """
+
+    top_author = None
+    if stats.topAuthor:
+        top_author = {
+            "name": stats.topAuthor["name"],
+            "total_quotes": stats.topAuthor["total_quotes"],
+            "top_tags": stats.topAuthor["top_tags"][:top_tags],
+        }
+
+    return {
+        "top_tags": stats.topTags[:top_tags],
+        "top_author": top_author,
+        "top_authors": stats.topAuthors[:top_authors],
+        "total_quotes": stats.totalQuotes,
+        "total_author": stats.totalAuthors,
+        "updated_on": stats.updatedOn,
+        "reconciled_on": stats.reconciledOn,
+    }
+
+
+def get_top_n_arg(name: str) -> int:
+    """Reads size of a top list from the query string, capped at STATS_TOP_N_MAX"""
+
+    try:
+        top_n = int(request.args.get(name, STATS_TOP_N))
+    except ValueError as exp_err:
+        raise ValueError(f"{name} must be an integer") from exp_err
+
+    if top_n < 1:
+        raise ValueError(f"{name} must be greater than 0")
+
+    return min(top_n, STATS_TOP_N_MAX)
+
+
 class StatsApi(Resource):
     """All the Statistics API endpoints"""
 
+    @cache.cached(["stats"])
     def get(self):
-        """Get Statistics for Quotes, Authors and Tags"""
+        """Get Statistics for Quotes, Authors and Tags
+
+        Statistics are read from the materialized Stats document, they are
+        computed from the Quotes until reconcile_stats builds it.
+
+        Query Params:
+            top_tags (int): no. of top tags, overall and of the top author
+            top_authors (int): no. of top authors
+        """
 
         try:
-            top_tags_query = get_query_most_popular("tags", 5)
-            tag_cursor = Quote.objects(author__exists=True).aggregate(top_tags_query)
-            current_app.logger.info("GET Stats - FETCHED TOP Tags")
-
-            top_author_query = get_query_most_popular("author", 1)
-            author_cursor = list(
-                Quote.objects(author__exists=True).aggregate(top_author_query)
-            )
-            current_app.logger.info("GET Stats - FETCHED TOP Author")
-
-            top_tags = [tag["_id"] for tag in tag_cursor]
-
-            top_author = Author.objects.get(id=author_cursor[0]["_id"])
-            author_tags = Quote.objects(author=author_cursor[0]["_id"]).aggregate(
-                top_tags_query
-            )
-            tags_by_author = [tag["_id"] for tag in author_tags]
-
-            total_quotes = Quote.objects(author__exists=True).count()
-            total_authors = Author.objects.count()
-
-            response, status = {
-                "top_tags": top_tags,
-                "top_author": {
-                    "name": top_author.name,
-                    "total_quotes": author_cursor[0]["count"],
-                    "top_tags": tags_by_author,
-                },
-                "total_quotes": total_quotes,
-                "total_author": total_authors,
-            }, 200
-            current_app.logger.info("GET Stats - FETCHED ALL Stats")
+            top_tags = get_top_n_arg("top_tags")
+            top_authors = get_top_n_arg("top_authors")
+
+            stats = Stats.objects(key="global").first()
+            if stats is not None:
+                response = get_materialized_stats(stats, top_tags, top_authors)
+                status = 200
+                current_app.logger.info("GET Stats - FETCHED Materialized Stats")
+            else:
+                response, status = get_live_stats(top_tags, top_authors), 200
+                current_app.logger.info("GET Stats - FETCHED ALL Stats")
         except Exception as exp_err:
             response, status = {"Error": str(exp_err)}, 400
             current_app.logger.error(f"GET Stats - {str(exp_err)}")
 
         return make_response(jsonify(response), status)
+
+
+class CacheStatsApi(Resource):
+    """Statistics of the Response Cache"""
+
+    def get(self):
+        """Get hit and miss counters of the Response Cache"""
+
+        try:
+            response, status = cache.stats(), 200
+            current_app.logger.info("GET Cache Stats - FETCHED")
+        except Exception as exp_err:
+            response, status = {"Error": str(exp_err)}, 400
+            current_app.logger.error(f"GET Cache Stats - {str(exp_err)}")
+
+        return make_response(jsonify(response), status)
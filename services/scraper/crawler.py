@@ -0,0 +1,398 @@
+"""Crawlers that walk the quotes pages and fetch the author pages"""
+
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pymongo import UpdateOne
+from selenium.webdriver.common.by import By
+from database.models import ScrapedPage
+from services.scraper.parsers import clean_quote, get_parser
+from services.scraper.driver_pool import driver_pool
+from constants.app_constants import (
+    SCRAPER_REQUEST_TIMEOUT,
+    SCRAPER_CONCURRENCY,
+    SCRAPER_HOST_CONCURRENCY,
+    SCRAPER_RETRIES,
+    SCRAPER_RETRY_BACKOFF,
+)
+
+
+def make_session(pool_size: int = 1) -> requests.Session:
+    """Returns a session reusing keep-alive connections, failed requests
+    (connection errors, 429 and 5xx) are retried with exponential backoff
+
+    Args:
+        pool_size (int): max no. of open connections per host
+    """
+    retry = Retry(
+        total=SCRAPER_RETRIES,
+        backoff_factor=SCRAPER_RETRY_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PageFingerprints:
+    """ETag, Last-Modified and content hash of the scraped pages
+
+    Requests send the stored validators, a page is unchanged if the server
+    answers 304 or the content hash matches. New fingerprints are kept in
+    memory until save(), call it once the scraped data is written, so a
+    failed run scrapes the pages again.
+    """
+
+    def __init__(self, pages: Optional[dict] = None):
+        self.pages = pages if pages is not None else {}
+        self.changed = {}
+        self.processed = 0
+        self.skipped = 0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, urls: Optional[list] = None) -> "PageFingerprints":
+        """Loads the fingerprints of the given pages, all the pages by default"""
+
+        pages = ScrapedPage.objects(url__in=urls) if urls else ScrapedPage.objects
+        return cls({page["_id"]: page for page in pages.as_pymongo()})
+
+    def forget(self, urls: Iterable[str]) -> None:
+        """Drops fingerprints, the pages are fetched and processed again"""
+
+        for url in urls:
+            self.pages.pop(url, None)
+
+    def headers(self, url: str) -> dict:
+        """Returns conditional request headers of a page"""
+
+        page = self.pages.get(url, {})
+        headers = {}
+        if page.get("etag"):
+            headers["If-None-Match"] = page["etag"]
+        if page.get("lastModified"):
+            headers["If-Modified-Since"] = page["lastModified"]
+
+        return headers
+
+    def next_url(self, url: str) -> Optional[str]:
+        """Returns the stored next page of an unchanged listing page"""
+
+        return self.pages.get(url, {}).get("nextUrl")
+
+    def is_unchanged(self, url: str, res: requests.Response) -> bool:
+        """Checks a response against the fingerprint and counts the page
+        as skipped or processed"""
+
+        content_hash = None
+        if res.status_code != 304:
+            content_hash = hashlib.sha1(res.content).hexdigest()
+
+        page = self.pages.get(url, {})
+        unchanged = url in self.pages and (
+            res.status_code == 304 or content_hash == page.get("contentHash")
+        )
+
+        with self.lock:
+            if unchanged:
+                self.skipped += 1
+            else:
+                self.processed += 1
+                self.changed[url] = {
+                    "etag": res.headers.get("ETag"),
+                    "lastModified": res.headers.get("Last-Modified"),
+                    "contentHash": content_hash,
+                }
+
+        return unchanged
+
+    def set_next_url(self, url: str, next_url: Optional[str]) -> None:
+        """Stores the next page of a processed listing page"""
+
+        with self.lock:
+            self.changed[url]["nextUrl"] = next_url
+
+    def save(self, urls: Optional[Iterable[str]] = None) -> None:
+        """Writes the fingerprints of the processed pages
+
+        Args:
+            urls (Iterable): pages whose data is written, all by default
+        """
+        with self.lock:
+            urls = list(self.changed) if urls is None else urls
+            changed = {
+                url: self.changed.pop(url) for url in urls if url in self.changed
+            }
+        if not changed:
+            return
+
+        now = datetime.now(timezone.utc)
+        ScrapedPage._get_collection().bulk_write(
+            [
+                UpdateOne(
+                    {"_id": url}, {"$set": {**page, "updatedOn": now}}, upsert=True
+                )
+                for url, page in changed.items()
+            ],
+            ordered=False,
+        )
+        with self.lock:
+            self.pages.update(changed)
+
+    def counts(self) -> dict:
+        """Returns no. of processed and skipped pages"""
+
+        return {"processed_pages": self.processed, "skipped_pages": self.skipped}
+
+
+def parse_quotes_page(html: bytes, url: str) -> tuple:
+    """Parses quotes of a page and the link of the next page
+
+    Args:
+        html (bytes): content of the page
+        url (str): url of the page, relative links are resolved against it
+
+    Returns:
+        tuple: list of quotes and url of the next page (or None)
+    """
+    return get_parser().parse_quotes(html, url)
+
+
+def crawl_quotes_http(
+    url: str, single_page: bool, fingerprints: Optional[PageFingerprints] = None
+) -> Iterator[dict]:
+    """Follows the next page links over plain HTTP
+
+    Args:
+        url (str): url of the first page
+        single_page (bool): bool to scrape only single page
+        fingerprints (PageFingerprints): unchanged pages are not parsed,
+            only their stored next page is followed
+
+    Yields:
+        dict: scraped quote
+    """
+    for _, quotes in crawl_pages_http(url, single_page, fingerprints):
+        yield from quotes
+
+
+def crawl_pages_http(
+    url: str, single_page: bool, fingerprints: Optional[PageFingerprints] = None
+) -> Iterator[tuple]:
+    """Follows the next page links over plain HTTP, page by page
+
+    Args:
+        url (str): url of the first page
+        single_page (bool): bool to scrape only single page
+        fingerprints (PageFingerprints): unchanged pages are not parsed,
+            only their stored next page is followed
+
+    Yields:
+        tuple: url of the page and its quotes, empty if unchanged
+    """
+    with make_session() as session:
+        while url:
+            page_url = url
+            quotes, url = fetch_quotes_page(session, url, fingerprints)
+            yield page_url, quotes or []
+
+            if single_page:
+                break
+
+
+def fetch_quotes_page(
+    session: requests.Session,
+    url: str,
+    fingerprints: Optional[PageFingerprints] = None,
+) -> tuple:
+    """Fetches and parses a listing page, unless it is unchanged
+
+    Args:
+        session (Session): http session
+        url (str): url of the page
+        fingerprints (PageFingerprints): fingerprints of the scraped pages
+
+    Returns:
+        tuple: quotes of the page (None if unchanged) and url of the next page
+    """
+    headers = fingerprints.headers(url) if fingerprints else {}
+    res = session.get(url, headers=headers, timeout=SCRAPER_REQUEST_TIMEOUT)
+    res.raise_for_status()
+
+    if fingerprints and fingerprints.is_unchanged(url, res):
+        return None, fingerprints.next_url(url)
+
+    quotes, next_url = parse_quotes_page(res.content, res.url)
+    if fingerprints:
+        fingerprints.set_next_url(url, next_url)
+    return quotes, next_url
+
+
+def get_page_url(url: str, page: int) -> str:
+    """Returns url of a listing page by its number"""
+
+    return urljoin(url, f"page/{page}/")
+
+
+def count_pages(session: requests.Session, url: str) -> int:
+    """Finds the no. of listing pages with an exponential and a binary search,
+    in O(log n) requests instead of walking every page
+
+    Args:
+        session (Session): http session
+        url (str): url of the site, pages are at page/<n>/
+
+    Returns:
+        int: no. of the last page with quotes, 0 if there is none
+    """
+
+    def has_quotes(page: int) -> bool:
+        res = session.get(get_page_url(url, page), timeout=SCRAPER_REQUEST_TIMEOUT)
+        if res.status_code == 404:
+            return False
+        res.raise_for_status()
+        return bool(parse_quotes_page(res.content, res.url)[0])
+
+    if not has_quotes(1):
+        return 0
+
+    # the last page is in [low, high)
+    low, high = 1, 2
+    while has_quotes(high):
+        low, high = high, high * 2
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if has_quotes(middle):
+            low = middle
+        else:
+            high = middle
+
+    return low
+
+
+def parse_author_page(html: bytes) -> dict:
+    """Parses details of an author page
+
+    Args:
+        html (bytes): content of the page
+
+    Returns:
+        dict: dob, country and description of the author
+    """
+    return get_parser().parse_author(html)
+
+
+def fetch_authors(
+    links: Iterable[str], fingerprints: Optional[PageFingerprints] = None
+) -> Iterator[tuple]:
+    """Fetches author pages concurrently over a shared connection pool
+
+    At most SCRAPER_CONCURRENCY pages are fetched at a time, and at most
+    SCRAPER_HOST_CONCURRENCY from the same host.
+
+    Args:
+        links (Iterable): urls of the author pages
+        fingerprints (PageFingerprints): unchanged pages are not parsed
+
+    Raises:
+        requests.RequestException: if a page fails after all the retries
+
+    Yields:
+        tuple: url and parsed details of an author page (None if unchanged),
+            in completion order
+    """
+    host_limits = defaultdict(
+        lambda: threading.BoundedSemaphore(SCRAPER_HOST_CONCURRENCY)
+    )
+    lock = threading.Lock()
+
+    def fetch(session: requests.Session, link: str) -> Optional[dict]:
+        headers = fingerprints.headers(link) if fingerprints else {}
+        with lock:
+            host_limit = host_limits[urlsplit(link).netloc]
+        with host_limit:
+            res = session.get(link, headers=headers, timeout=SCRAPER_REQUEST_TIMEOUT)
+        res.raise_for_status()
+
+        if fingerprints and fingerprints.is_unchanged(link, res):
+            return None
+        return parse_author_page(res.content)
+
+    with make_session(SCRAPER_CONCURRENCY) as session, ThreadPoolExecutor(
+        max_workers=SCRAPER_CONCURRENCY
+    ) as executor:
+        futures = {executor.submit(fetch, session, link): link for link in links}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def crawl_pages_selenium(
+    url: str,
+    single_page: bool,
+    fingerprints: Optional[PageFingerprints] = None,  # pylint: disable=W0613
+) -> Iterator[tuple]:
+    """Walks the pages in a headless Chrome by clicking next,
+    only needed if the pages are rendered by javascript. The browser is
+    borrowed from the warm pool of the worker process.
+
+    Args:
+        url (str): url of the first page
+        single_page (bool): bool to scrape only single page
+        fingerprints (PageFingerprints): not supported, every page is processed
+
+    Yields:
+        tuple: url of the page and its quotes
+    """
+    with driver_pool.driver() as driver:
+        driver.get(url)
+
+        next_page = True
+        while next_page:
+            quotes = []
+            for quote_div in driver.find_elements(By.CLASS_NAME, "quote"):
+                quote = quote_div.find_element(By.CLASS_NAME, "text")
+                author_name = quote_div.find_element(By.CLASS_NAME, "author").text
+                author_link = quote_div.find_element(By.TAG_NAME, "a")
+                tags = quote_div.find_elements(By.CLASS_NAME, "tag")
+                quotes.append(
+                    {
+                        "quote": clean_quote(quote.text),
+                        "author": {
+                            "name": author_name,
+                            "link": author_link.get_attribute("href"),
+                        },
+                        "tags": [tag.text for tag in tags],
+                    }
+                )
+            yield driver.current_url, quotes
+
+            try:
+                next_li = driver.find_element(By.CLASS_NAME, "next")
+                next_page = not single_page
+
+                a_link = next_li.find_element(By.TAG_NAME, "a")
+                a_link.click()
+            except Exception:
+                next_page = False
+
+
+# crawlers yielding the quotes page by page
+CRAWLERS = {"http": crawl_pages_http, "selenium": crawl_pages_selenium}
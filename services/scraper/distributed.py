@@ -0,0 +1,131 @@
+"""Distributed scraping, listing pages are fetched by a group of Celery tasks"""
+
+from collections import Counter
+from flask import current_app
+from celery import shared_task, chord, states
+from celery.result import AsyncResult, GroupResult
+from services.scraper.crawler import (
+    PageFingerprints,
+    count_pages,
+    fetch_quotes_page,
+    get_page_url,
+    make_session,
+)
+from services.scraper.scraper import add_quotes_db, scrape_authors
+from constants.app_constants import QUOTES_URL
+
+
+@shared_task(bind=True)
+def scrape_data_distributed(self) -> dict:
+    """Finds the listing pages and scrapes them with a chord, page tasks run
+    on all the workers and write their quotes, merge_scraped_pages sums
+    their counts and scrapes the authors.
+
+    Page tasks are rate limited per worker by SCRAPER_PAGE_RATE_LIMIT.
+
+    Returns:
+        dict: ids of the page group and the merge task, used for the status
+    """
+    self.update_state(state="IN_PROGRESS", meta={"scraping": "page_range"})
+    base_url = current_app.config.get("SCRAPER_BASE_URL", QUOTES_URL)
+    with make_session() as session:
+        total_pages = count_pages(session, base_url)
+
+    # the first page has the url the sequential crawl starts at, so both
+    # crawls share its fingerprint
+    pages = [
+        base_url if page == 1 else get_page_url(base_url, page)
+        for page in range(1, total_pages + 1)
+    ]
+    merge = chord(scrape_page.s(url) for url in pages)(merge_scraped_pages.s())
+    merge.parent.save()
+
+    return {
+        "group_id": merge.parent.id,
+        "merge_id": merge.id,
+        "total_pages": total_pages,
+    }
+
+
+@shared_task
+def scrape_page(url: str) -> dict:
+    """Fetches and parses a listing page, unless it is unchanged, and writes
+    its quotes
+
+    The fingerprint is saved after the quotes are written,
+    so a failed page is scraped again.
+
+    Args:
+        url (str): url of the page
+
+    Returns:
+        dict: no. of fetched, inserted, updated and unchanged quotes and
+            no. of processed and skipped pages
+    """
+    fingerprints = PageFingerprints.load(urls=[url])
+    with make_session() as session:
+        quotes, _ = fetch_quotes_page(session, url, fingerprints)
+
+    counts = add_quotes_db(quotes or [])
+    fingerprints.save()
+
+    return {"fetched_records": len(quotes or []), **counts, **fingerprints.counts()}
+
+
+@shared_task(bind=True)
+def merge_scraped_pages(self, pages: list) -> dict:
+    """Sums the counts of the pages, then scrapes the authors
+
+    Args:
+        pages (list): results of the page tasks
+
+    Returns:
+        dict: dict of no. of fetched records
+    """
+    quote_status = Counter()
+    for page in pages:
+        quote_status.update(page)
+    author_status = scrape_authors(self)
+
+    return {"quotes": dict(quote_status), "authors": author_status}
+
+
+def is_distributed_crawl(result: object) -> bool:
+    """True if the result is of scrape_data_distributed"""
+
+    return isinstance(result, dict) and "group_id" in result and "merge_id" in result
+
+
+def get_crawl_status(crawl: dict) -> tuple:
+    """Aggregates the status of the page tasks and the merge task of a crawl
+
+    Args:
+        crawl (dict): result of scrape_data_distributed
+
+    Returns:
+        tuple: state and progress (or result) of the crawl
+    """
+    pages = GroupResult.restore(crawl["group_id"])
+    merge = AsyncResult(crawl["merge_id"])
+
+    if merge.state == states.FAILURE or (pages and pages.failed()):
+        return states.FAILURE, {}
+
+    if merge.successful():
+        return states.SUCCESS, merge.result
+
+    # the merge task reports its own progress once it writes the quotes
+    if merge.state == "IN_PROGRESS" and isinstance(merge.info, dict):
+        return "IN_PROGRESS", merge.info
+
+    # the merge task is published once all the pages completed
+    if merge.state != states.PENDING:
+        completed_pages = crawl["total_pages"]
+    else:
+        completed_pages = pages.completed_count() if pages else 0
+
+    return "IN_PROGRESS", {
+        "scraping": "pages",
+        "completed_pages": completed_pages,
+        "total_pages": crawl["total_pages"],
+    }
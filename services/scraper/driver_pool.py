@@ -0,0 +1,120 @@
+"""Pool of warm Selenium drivers, kept per worker process"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from celery.signals import worker_process_shutdown, worker_shutdown
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from utils.utils import init_driver
+from constants.app_constants import SELENIUM_POOL_SIZE, SELENIUM_DRIVER_MAX_USES
+
+logger = logging.getLogger("app")
+
+
+class DriverPool:
+    """Reuses browsers between tasks instead of starting Chrome every time
+
+    Drivers are created lazily, checked before they are handed out and
+    recycled after `max_uses` tasks or when a task fails with a driver error.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome] = init_driver,
+        size: int = SELENIUM_POOL_SIZE,
+        max_uses: int = SELENIUM_DRIVER_MAX_USES,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.idle = []
+        self.uses = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """Lends a driver for the duration of the block"""
+
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken)
+
+    def acquire(self) -> webdriver.Chrome:
+        """Returns a healthy idle driver, or a new one"""
+
+        while True:
+            with self.lock:
+                driver = self.idle.pop() if self.idle else None
+            if driver is None:
+                driver = self.factory()
+                self.uses[id(driver)] = 0
+                return driver
+            if self.is_healthy(driver):
+                return driver
+            self.quit(driver)
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """Returns the driver to the pool, or quits it if it is worn out"""
+
+        self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+        if broken or self.uses[id(driver)] >= self.max_uses:
+            self.quit(driver)
+            return
+
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            self.quit(driver)
+            return
+
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(driver)
+                return
+        self.quit(driver)
+
+    @staticmethod
+    def is_healthy(driver: webdriver.Chrome) -> bool:
+        """True if the browser still answers commands"""
+
+        try:
+            return driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def quit(self, driver: webdriver.Chrome) -> None:
+        """Quits the browser, errors of a dead browser are ignored"""
+
+        self.uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as exp_err:
+            logger.warning(f"Driver Pool - {str(exp_err)}")
+
+    def close(self) -> None:
+        """Quits all the idle drivers"""
+
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for driver in idle:
+            self.quit(driver)
+
+
+driver_pool = DriverPool()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_driver_pool(**kwargs) -> None:  # pylint: disable=W0613
+    """Quits the browsers of the pool when the worker (process) stops"""
+
+    driver_pool.close()
@@ -0,0 +1,184 @@
+"""HTML parsers extracting quotes and author details from the scraped pages
+
+LxmlParser builds the tree with lxml and selects with XPath, it is used when
+lxml can be imported. Html5libParser (BeautifulSoup with html5lib) is the
+fallback, slower but tolerant of any markup. Both return identical data.
+"""
+
+import re
+from typing import Optional
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, UnicodeDammit
+from config import CONFIG
+from utils.utils import get_date
+
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover
+    lxml = None
+
+
+def clean_quote(text: str) -> str:
+    """This removes html quotes (“ ”) to get only text of the quote.
+    The function replaces quote(“”) characters with empty character.
+    For example. “This is quote” will result to "This is quote"
+    """
+    return re.sub(r"[\“\”]", "", text)
+
+
+def author_details(dob: str, location: str, description: str) -> dict:
+    """Returns details of an author from the texts of the author page"""
+
+    return {
+        "dob": get_date(dob),
+        "country": location[3:],
+        "description": description.strip(),
+    }
+
+
+class Html5libParser:
+    """Parses with BeautifulSoup and html5lib"""
+
+    name = "html5lib"
+
+    def parse_quotes(self, html: bytes, url: str) -> tuple:
+        """Parses quotes of a page and the link of the next page
+
+        Args:
+            html (bytes): content of the page
+            url (str): url of the page, relative links are resolved against it
+
+        Returns:
+            tuple: list of quotes and url of the next page (or None)
+        """
+        soup = BeautifulSoup(html, features="html5lib")
+
+        quotes = []
+        for quote_div in soup.select("div.quote"):
+            quotes.append(
+                {
+                    "quote": clean_quote(quote_div.select_one(".text").get_text()),
+                    "author": {
+                        "name": quote_div.select_one(".author").get_text(),
+                        "link": urljoin(url, quote_div.find("a")["href"]),
+                    },
+                    "tags": [tag.get_text() for tag in quote_div.select(".tag")],
+                }
+            )
+
+        next_link = soup.select_one("li.next a")
+        next_url = urljoin(url, next_link["href"]) if next_link else None
+
+        return quotes, next_url
+
+    def parse_author(self, html: bytes) -> dict:
+        """Parses details of an author page
+
+        Args:
+            html (bytes): content of the page
+
+        Returns:
+            dict: dob, country and description of the author
+        """
+        soup = BeautifulSoup(html, features="html5lib")
+
+        return author_details(
+            soup.find(class_="author-born-date").text,
+            soup.find(class_="author-born-location").text,
+            soup.find(class_="author-description").text,
+        )
+
+
+def has_class(name: str) -> str:
+    """Returns XPath predicate matching elements having the class"""
+
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class LxmlParser:
+    """Parses with lxml, selecting the elements with XPath"""
+
+    name = "lxml"
+
+    QUOTES = f"//div[{has_class('quote')}]"
+    TEXT = f".//*[{has_class('text')}]"
+    AUTHOR = f".//*[{has_class('author')}]"
+    TAGS = f".//*[{has_class('tag')}]"
+    NEXT = f"//li[{has_class('next')}]//a"
+
+    @staticmethod
+    def parse(html: bytes):
+        """Builds the tree, decoding like BeautifulSoup does"""
+
+        return lxml.html.document_fromstring(
+            UnicodeDammit(html, is_html=True).unicode_markup
+        )
+
+    @staticmethod
+    def first_text(node, xpath: str) -> str:
+        """Returns text of the first element matching the XPath"""
+
+        return node.xpath(xpath)[0].text_content()
+
+    def parse_quotes(self, html: bytes, url: str) -> tuple:
+        """Parses quotes of a page and the link of the next page
+
+        Args:
+            html (bytes): content of the page
+            url (str): url of the page, relative links are resolved against it
+
+        Returns:
+            tuple: list of quotes and url of the next page (or None)
+        """
+        tree = self.parse(html)
+
+        quotes = []
+        for quote_div in tree.xpath(self.QUOTES):
+            quotes.append(
+                {
+                    "quote": clean_quote(self.first_text(quote_div, self.TEXT)),
+                    "author": {
+                        "name": self.first_text(quote_div, self.AUTHOR),
+                        "link": urljoin(url, quote_div.xpath(".//a")[0].get("href")),
+                    },
+                    "tags": [tag.text_content() for tag in quote_div.xpath(self.TAGS)],
+                }
+            )
+
+        next_link = tree.xpath(self.NEXT)
+        next_url = urljoin(url, next_link[0].get("href")) if next_link else None
+
+        return quotes, next_url
+
+    def parse_author(self, html: bytes) -> dict:
+        """Parses details of an author page
+
+        Args:
+            html (bytes): content of the page
+
+        Returns:
+            dict: dob, country and description of the author
+        """
+        tree = self.parse(html)
+
+        return author_details(
+            self.first_text(tree, f"//*[{has_class('author-born-date')}]"),
+            self.first_text(tree, f"//*[{has_class('author-born-location')}]"),
+            self.first_text(tree, f"//*[{has_class('author-description')}]"),
+        )
+
+
+PARSERS = {"lxml": LxmlParser, "html5lib": Html5libParser}
+
+
+def get_parser(name: Optional[str] = None):
+    """Returns the parser by name, SCRAPER_PARSER by default
+
+    lxml is used when no parser is configured and it is installed,
+    html5lib otherwise.
+    """
+    name = name or CONFIG.get("SCRAPER_PARSER") or ("lxml" if lxml else "html5lib")
+    if name == "lxml" and lxml is None:
+        name = "html5lib"
+
+    return PARSERS[name]()
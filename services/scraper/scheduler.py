@@ -1,12 +1,27 @@
-"""Scraping Tasks Scheduler"""
+"""Scraping and Statistics Tasks Scheduler"""
 
-from typing import Callable
+import os
+import time
+import atexit
+import socket
+import logging
+from datetime import datetime
+from typing import Callable, Optional
 from functools import wraps
 from uuid import uuid4
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from flask_apscheduler import APScheduler
-from database.models import ScheduledTask
+from database.models import ScheduledTask, SchedulerLease
 from services.scraper.scraper import scrape_data_scheduler
-from constants.app_constants import SCRAPING_SCHEDULER_DURATION
+from services.stats.reconcile import reconcile_stats
+from constants.app_constants import (
+    SCRAPING_SCHEDULER_DURATION,
+    STATS_RECONCILE_DURATION,
+    SCHEDULER_LEASE_TTL,
+    SCHEDULER_LEASE_RENEW,
+)
+
+logger = logging.getLogger("app")
 
 
 def add_task(func: Callable, job_id: str) -> Callable:
@@ -31,3 +46,147 @@ def init_scheduler_jobs(scheduler: APScheduler) -> None:
         trigger="interval",
         minutes=SCRAPING_SCHEDULER_DURATION,
     )
+
+    # Builds the materialized stats on start, then corrects their drift
+    scheduler.add_job(
+        id="reconcile_stats",
+        func=reconcile_stats.delay,
+        trigger="interval",
+        minutes=STATS_RECONCILE_DURATION,
+        next_run_time=datetime.now(),
+    )
+
+
+class SchedulerLeader:
+    """Leader election of the schedulers through a lease in MongoDB
+
+    Every process running a scheduler tries to take or renew the lease every
+    SCHEDULER_LEASE_RENEW seconds, only the holder runs the scheduled jobs.
+    The lease expires SCHEDULER_LEASE_TTL seconds after its last renewal,
+    another process takes it over when the leader dies. It is released when
+    the process exits.
+
+    Expiry is computed and compared with the clock of the MongoDB server
+    ($$NOW), so clock skew between the nodes cannot make two leaders. A node
+    tells how long it may still hold the lease from its monotonic clock,
+    counted from before the renewal was sent.
+    """
+
+    LEASE = "scheduler"
+    JOB_ID = "scheduler_lease"
+
+    def __init__(
+        self,
+        scheduler: APScheduler,
+        init_jobs: Callable[[APScheduler], None] = init_scheduler_jobs,
+        node: Optional[str] = None,
+    ):
+        self.scheduler = scheduler
+        self.init_jobs = init_jobs
+        self.node = node or f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self.held_until = None
+
+    def start(self) -> None:
+        """Schedules the renewal of the lease, the first one right away"""
+
+        self.scheduler.add_job(
+            id=self.JOB_ID,
+            func=self.renew,
+            trigger="interval",
+            seconds=SCHEDULER_LEASE_RENEW,
+            next_run_time=datetime.now(),
+        )
+        atexit.register(self.release)
+
+    def try_acquire(self) -> bool:
+        """Takes the lease if it expired, or renews it if this node holds it
+
+        Returns:
+            bool: True if this node holds the lease
+        """
+        sent_at = time.monotonic()
+        try:
+            SchedulerLease._get_collection().update_one(
+                {
+                    "_id": self.LEASE,
+                    "$or": [
+                        {"holder": self.node},
+                        {"$expr": {"$lt": ["$expiresOn", "$$NOW"]}},
+                    ],
+                },
+                [
+                    {
+                        "$set": {
+                            "holder": self.node,
+                            # fields of the stage read the lease before the update
+                            "acquiredOn": {
+                                "$cond": [
+                                    {"$eq": ["$holder", self.node]},
+                                    "$acquiredOn",
+                                    "$$NOW",
+                                ]
+                            },
+                            "expiresOn": {
+                                "$add": ["$$NOW", SCHEDULER_LEASE_TTL * 1000]
+                            },
+                        }
+                    }
+                ],
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # another node holds a valid lease
+            return False
+
+        self.held_until = sent_at + SCHEDULER_LEASE_TTL
+        return True
+
+    def renew(self) -> None:
+        """Renews the lease, starts or stops the jobs when leadership changes"""
+
+        try:
+            is_leader = self.try_acquire()
+        except PyMongoError as exp_err:
+            logger.error(f"Scheduler Lease - {str(exp_err)}")
+            # the lease is kept until it may have been taken over
+            is_leader = self.is_leader and time.monotonic() < self.held_until
+
+        if is_leader and not self.is_leader:
+            logger.info(f"Scheduler Lease - ACQUIRED by {self.node}")
+            self.init_jobs(self.scheduler)
+        elif not is_leader and self.is_leader:
+            logger.warning(f"Scheduler Lease - LOST by {self.node}")
+            for job in self.scheduler.get_jobs():
+                if job.id != self.JOB_ID:
+                    self.scheduler.remove_job(job.id)
+        self.is_leader = is_leader
+
+    def release(self) -> None:
+        """Gives up the lease, another node takes it on its next renewal"""
+
+        if not self.is_leader:
+            return
+
+        try:
+            SchedulerLease._get_collection().delete_one(
+                {"_id": self.LEASE, "holder": self.node}
+            )
+        except PyMongoError as exp_err:
+            logger.error(f"Scheduler Lease - {str(exp_err)}")
+        self.is_leader = False
+
+
+def get_scheduler_lease() -> Optional[dict]:
+    """Returns the holder of the scheduler lease, None if it expired"""
+
+    return (
+        SchedulerLease.objects(
+            __raw__={
+                "_id": SchedulerLeader.LEASE,
+                "$expr": {"$gt": ["$expiresOn", "$$NOW"]},
+            }
+        )
+        .as_pymongo()
+        .first()
+    )
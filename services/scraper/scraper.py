@@ -1,19 +1,31 @@
 """Utility for scraping quotes data"""
 
 
-import re
 import traceback
 from datetime import datetime, timezone
-import requests
-from bs4 import BeautifulSoup
+from flask import current_app
 from celery import shared_task, states
 from celery.exceptions import Ignore
-from selenium.webdriver.common.by import By
-from mongoengine.errors import NotUniqueError
-from utils.utils import init_driver, get_date
+from pymongo import UpdateOne, UpdateMany
+from pymongo.errors import BulkWriteError
 from database.models import ScrapedAuthor, Author, Quote, ScheduledTask
-from constants.app_constants import QUOTES_URL
-from services.scraper.utils import ScrapingTask, TaskStatus
+from constants.app_constants import (
+    QUOTES_URL,
+    SCRAPER_BATCH_SIZE,
+    SCRAPER_PREFETCH_PAGES,
+)
+from services.scraper.utils import (
+    ScrapingTask,
+    TaskStatus,
+    ProgressReporter,
+    prefetch,
+)
+from services.scraper.crawler import CRAWLERS, PageFingerprints, fetch_authors
+from utils.cache import cache, quote_list_tags
+from services.stats.counters import StatsDelta
+
+# details of an author copied from the scraped author
+AUTHOR_DETAILS = ("dob", "country", "description")
 
 
 @shared_task(bind=True)
@@ -79,90 +91,206 @@ def scrape_data(self, single_page: bool = False) -> dict:
 def scrape_quotes(self, single_page: bool) -> dict:
     """This function scrape quotes data
 
+    Pages are crawled on a background thread while the quotes are written
+    in batches of SCRAPER_BATCH_SIZE, memory does not grow with the site.
+
     Args:
         single_page (bool): bool to scrape only single page
 
     Returns:
         dict: dict of no. of fetched records
     """
-    self.update_state(
-        state="IN_PROGRESS",
-        meta={"scraping": "quotes", "fetched_records": 0},
+    progress = ProgressReporter(
+        lambda meta: self.update_state(state="IN_PROGRESS", meta=meta)
     )
+    progress.report({"scraping": "quotes", "fetched_records": 0}, phase="quotes")
 
-    driver = init_driver()
-    driver.get(QUOTES_URL)
+    crawl_pages = CRAWLERS[current_app.config.get("SCRAPER_BACKEND", "http")]
+    base_url = current_app.config.get("SCRAPER_BASE_URL", QUOTES_URL)
+    fingerprints = PageFingerprints.load()
+    pages = prefetch(
+        crawl_pages(base_url, single_page, fingerprints), SCRAPER_PREFETCH_PAGES
+    )
 
-    quotes_data = []
-    next_page = True
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+    batch, batch_pages = [], []
     fetched_records = 0
 
-    while next_page:
-
-        for quote_div in driver.find_elements(By.CLASS_NAME, "quote"):
-            quote = quote_div.find_element(By.CLASS_NAME, "text")
-            # This removes html quotes (“ ”) to get only text of the quote.
-            # The function replaces quote(“”) characters with empty character.
-            # For example. “This is quote” will result to "This is quote"
-            quote = re.sub(r"[\“\”]", "", quote.text)
-
-            author_name = quote_div.find_element(By.CLASS_NAME, "author").text
-            author_link = quote_div.find_element(By.TAG_NAME, "a").get_attribute("href")
-            tags = [tag.text for tag in quote_div.find_elements(By.CLASS_NAME, "tag")]
-            data = {
-                "quote": quote,
-                "author": {"name": author_name, "link": author_link},
-                "tags": tags,
-            }
+    def flush():
+        for key, count in add_quotes_db(batch).items():
+            counts[key] += count
+        # pages are marked as scraped only once all their quotes are written
+        fingerprints.save(batch_pages)
+        batch.clear()
+        batch_pages.clear()
 
-            quotes_data.append(data)
-            fetched_records += 1
-            self.update_state(
-                state="IN_PROGRESS",
-                meta={"scraping": "quotes", "fetched_records": fetched_records},
-            )
+    for url, quotes in pages:
+        batch.extend(quotes)
+        batch_pages.append(url)
+        fetched_records += len(quotes)
+        progress.report({"scraping": "quotes", "fetched_records": fetched_records})
 
-        try:
-            next_li = driver.find_element(By.CLASS_NAME, "next")
-            next_page = not single_page
+        if len(batch) >= SCRAPER_BATCH_SIZE:
+            flush()
+    flush()
+    progress.flush()
 
-            a_link = next_li.find_element(By.TAG_NAME, "a")
-            a_link.click()
-        except Exception:
-            next_page = False
+    return {"fetched_records": fetched_records, **counts, **fingerprints.counts()}
 
-    driver.quit()
-    add_quotes_db(quotes_data)
 
-    return {"fetched_records": fetched_records}
+def resolve_scraped_authors(authors: dict) -> dict:
+    """Creates the missing scraped authors with a single bulk upsert,
+    unique on the link
+
+    Args:
+        authors (dict): name of the authors by link
+
+    Returns:
+        dict: id of the scraped authors by link
+    """
+    now = datetime.now(timezone.utc)
+    collection = ScrapedAuthor._get_collection()
+    ops = [
+        UpdateOne(
+            {"link": link},
+            {
+                "$setOnInsert": {
+                    "name": name,
+                    "link": link,
+                    "createdOn": now,
+                    "updatedOn": now,
+                }
+            },
+            upsert=True,
+        )
+        for link, name in authors.items()
+    ]
+    try:
+        collection.bulk_write(ops, ordered=False)
+    except BulkWriteError as exp_err:
+        # an author inserted meanwhile by another page task (duplicate
+        # key error 11000), the upserts of the retry match it
+        errors = exp_err.details["writeErrors"]
+        if any(error["code"] != 11000 for error in errors):
+            raise
+        collection.bulk_write(ops, ordered=False)
+
+    return {
+        author["link"]: author["_id"]
+        for author in collection.find(
+            {"link": {"$in": list(authors)}}, {"_id": 1, "link": 1}
+        )
+    }
+
 
+def add_quotes_batch(quotes: list, stats: StatsDelta) -> dict:
+    """Upserts a batch of quotes keyed on the quote text
 
-def add_quotes_db(quotes: list) -> bool:
-    """This functions add the quotes documents to the database
+    New quotes are inserted, existing ones are updated only if their tags
+    or scraped author changed.
 
     Args:
         quotes (list): List of quotes documents
-    """
+        stats (StatsDelta): collects the changes of tags of updated quotes
 
-    for quote in quotes:
-        author_data = quote.pop("author")
-        author = ScrapedAuthor.objects(link=author_data["link"]).first()
+    Returns:
+        dict: no. of inserted, updated and unchanged quotes and cache tags
+            of the updated quotes, inserted quotes have no author and are
+            in no list yet
+    """
+    # the same quote scraped twice in a batch, the last one wins
+    quotes = {quote["quote"]: quote for quote in quotes}
+    author_ids = resolve_scraped_authors(
+        {quote["author"]["link"]: quote["author"]["name"] for quote in quotes.values()}
+    )
 
-        if author is None:
-            author = ScrapedAuthor(**author_data)
-            author.save()
-
-        quote["scrapedAuthor"] = author.id
-        try:
-            quote_obj = Quote(**quote, createdBy="scraper")
-            quote_obj.save()
-        except NotUniqueError:
-            quote_obj = Quote.objects.get(quote=quote["quote"])
-            quote_obj.update(
-                **quote, updatedOn=datetime.now(timezone.utc), updatedBy="scraper"
+    collection = Quote._get_collection()
+    existing = {
+        quote["quote"]: quote
+        for quote in collection.find(
+            {"quote": {"$in": list(quotes)}},
+            {"quote": 1, "tags": 1, "author": 1, "scrapedAuthor": 1},
+        )
+    }
+
+    now = datetime.now(timezone.utc)
+    ops, updated, invalidated = [], [], []
+    for text, quote in quotes.items():
+        data = {
+            "tags": quote["tags"],
+            "scrapedAuthor": author_ids[quote["author"]["link"]],
+        }
+        old = existing.get(text)
+        if old is None:
+            ops.append(
+                UpdateOne(
+                    {"quote": text},
+                    {
+                        "$setOnInsert": {
+                            "quote": text,
+                            **data,
+                            "createdBy": "scraper",
+                            "createdOn": now,
+                            "updatedOn": now,
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+        elif (
+            old.get("tags") != data["tags"]
+            or old.get("scrapedAuthor") != data["scrapedAuthor"]
+        ):
+            stats.remove_quote(old.get("author"), old.get("tags"))
+            stats.add_quote(old.get("author"), data["tags"])
+            ops.append(
+                UpdateOne(
+                    {"_id": old["_id"]},
+                    {"$set": {**data, "updatedOn": now, "updatedBy": "scraper"}},
+                )
             )
+            updated.append(old["_id"])
+            invalidated.append(f"quote:{old['_id']}")
+            if old.get("author"):
+                invalidated += quote_list_tags({*old.get("tags", []), *data["tags"]})
+
+    inserted = 0
+    if ops:
+        inserted = collection.bulk_write(ops, ordered=False).upserted_count
 
-    return True
+    return {
+        "inserted": inserted,
+        "updated": len(updated),
+        "unchanged": len(quotes) - len(ops),
+        "invalidated": invalidated,
+    }
+
+
+def add_quotes_db(quotes: list) -> dict:
+    """This functions add the quotes documents to the database,
+    in batches of SCRAPER_BATCH_SIZE quotes
+
+    Args:
+        quotes (list): List of quotes documents
+
+    Returns:
+        dict: no. of inserted, updated and unchanged quotes
+    """
+
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+    invalidated = []
+    stats = StatsDelta()
+    for start in range(0, len(quotes), SCRAPER_BATCH_SIZE):
+        result = add_quotes_batch(quotes[start : start + SCRAPER_BATCH_SIZE], stats)
+        invalidated.extend(result.pop("invalidated"))
+        for key, count in result.items():
+            counts[key] += count
+
+    if quotes:
+        stats.apply()
+        cache.invalidate("stats", *invalidated)
+
+    return counts
 
 
 def scrape_authors(self) -> dict:
@@ -174,63 +302,162 @@ def scrape_authors(self) -> dict:
     scraped_authors = ScrapedAuthor.objects()
     fetched_records = 0
 
-    self.update_state(
-        state="IN_PROGRESS",
-        meta={
-            "scraping": "authors",
-            "fetched_records": 0,
-            "total": len(scraped_authors),
-        },
+    progress = ProgressReporter(
+        lambda meta: self.update_state(state="IN_PROGRESS", meta=meta)
     )
-    for author in scraped_authors:
-        res = requests.get(author.link, timeout=10)
-        soup = BeautifulSoup(res.content, features="html5lib")
-
-        dob = soup.find(class_="author-born-date").text
-        country = soup.find(class_="author-born-location").text[3:]
-        description = soup.find(class_="author-description").text.strip()
-
-        author_data = {
-            "dob": get_date(dob),
-            "country": country,
-            "description": description,
-        }
-
-        author.update(**author_data, updatedOn=datetime.now(timezone.utc))
+    progress.report(
+        {"scraping": "authors", "fetched_records": 0, "total": len(scraped_authors)},
+        phase="authors",
+    )
+    authors = {author.link: author for author in scraped_authors}
+    fingerprints = PageFingerprints.load()
+    # scraped authors without details are new, their pages are always parsed
+    fingerprints.forget(link for link, author in authors.items() if not author.dob)
+
+    unchanged = []
+    for link, author_data in fetch_authors(authors, fingerprints):
+        if author_data is not None:
+            authors[link].update(**author_data, updatedOn=datetime.now(timezone.utc))
+        else:
+            unchanged.append(link)
 
         fetched_records += 1
-        self.update_state(
-            state="IN_PROGRESS",
-            meta={
+        progress.report(
+            {
                 "scraping": "authors",
                 "fetched_records": fetched_records,
                 "total": len(scraped_authors),
-            },
+            }
+        )
+    progress.flush()
+    # scraped authors expire a day after updatedOn, and the listing pages
+    # that would create them again are skipped while unchanged
+    if unchanged:
+        ScrapedAuthor.objects(link__in=unchanged).update(
+            set__updatedOn=datetime.now(timezone.utc)
         )
 
     update_authors_collection()
+    fingerprints.save()
 
-    return {"fetched_records": fetched_records, "total": len(scraped_authors)}
+    return {
+        "fetched_records": fetched_records,
+        "total": len(scraped_authors),
+        **fingerprints.counts(),
+    }
 
 
-def update_authors_collection() -> bool:
-    """This function moves scarped authors to authors collection"""
+def update_authors_collection() -> dict:
+    """This function moves scarped authors to authors collection
 
-    for scraped_author in ScrapedAuthor.objects():
-        scraped_author_data = scraped_author.to_mongo()
-        _id = scraped_author_data.pop("_id")
-        scraped_author_data.pop("link")
+    Authors are upserted by name with a single bulk write, only the new ones
+    and the ones whose scraped details changed are written. Quotes of every
+    scraped author are re-pointed with one update_many per author, only if
+    they do not point to the author already.
 
-        try:
-            author = Author(**scraped_author_data, scrapeId=_id, createdBy="scraper")
-            author.save()
-        except NotUniqueError:
-            author = Author.objects.get(name=scraped_author_data["name"])
-            scraped_author_data["updatedOn"] = datetime.now(timezone.utc)
-            scraped_author_data["updatedBy"] = "scraper"
-            author.update(**scraped_author_data)
-
-        for quote in Quote.objects(scrapedAuthor=_id):
-            quote.update(author=author.id, updatedOn=datetime.now(timezone.utc))
+    Returns:
+        dict: no. of created, updated and unchanged authors and re-pointed quotes
+    """
+    # authors not fetched by scrape_authors yet have no details to promote
+    scraped_list = list(
+        ScrapedAuthor.objects(
+            dob__exists=True, country__exists=True, description__exists=True
+        ).as_pymongo()
+    )
+    # scraped authors sharing a name are one author, the last one gives
+    # its details and the quotes of all of them point to it
+    scraped_authors = {scraped["name"]: scraped for scraped in scraped_list}
+    authors = {
+        author["name"]: author
+        for author in Author.objects(name__in=list(scraped_authors)).as_pymongo()
+    }
+
+    now = datetime.now(timezone.utc)
+    ops, created, updated = [], [], []
+    for name, scraped in scraped_authors.items():
+        details = {field: scraped.get(field) for field in AUTHOR_DETAILS}
+        author = authors.get(name)
+        if author is None:
+            ops.append(
+                UpdateOne(
+                    {"name": name},
+                    {
+                        "$setOnInsert": {
+                            "name": name,
+                            **details,
+                            "scrapeId": scraped["_id"],
+                            "createdBy": "scraper",
+                            "createdOn": now,
+                            "updatedOn": now,
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+            created.append(name)
+        elif any(author.get(field) != value for field, value in details.items()):
+            ops.append(
+                UpdateOne(
+                    {"_id": author["_id"]},
+                    {"$set": {**details, "updatedOn": now, "updatedBy": "scraper"}},
+                )
+            )
+            updated.append(author["_id"])
+
+    author_ids = {name: author["_id"] for name, author in authors.items()}
+    if ops:
+        Author._get_collection().bulk_write(ops, ordered=False)
+    if created:
+        # also finds the authors created meanwhile by another run, which
+        # are not in the upserted ids of the bulk write
+        author_ids.update(Author.objects(name__in=created).scalar("name", "id"))
+
+    # quotes of a scraped author that do not point to its author yet
+    scraped_to_author = {
+        scraped["_id"]: author_ids[scraped["name"]]
+        for scraped in scraped_list
+        if scraped["name"] in author_ids
+    }
+    stale_quotes = [
+        quote
+        for quote in Quote.objects(scrapedAuthor__in=list(scraped_to_author))
+        .only("author", "scrapedAuthor", "tags")
+        .as_pymongo()
+        if quote.get("author") != scraped_to_author[quote["scrapedAuthor"]]
+    ]
+
+    stats = StatsDelta(authors=len(created))
+    repointed = {}
+    for quote in stale_quotes:
+        author_id = scraped_to_author[quote["scrapedAuthor"]]
+        stats.remove_quote(quote.get("author"), quote.get("tags"))
+        stats.add_quote(author_id, quote.get("tags"))
+        repointed.setdefault(quote["scrapedAuthor"], author_id)
+    if repointed:
+        Quote._get_collection().bulk_write(
+            [
+                UpdateMany(
+                    {"scrapedAuthor": scraped_id, "author": {"$ne": author_id}},
+                    {"$set": {"author": author_id, "updatedOn": now}},
+                )
+                for scraped_id, author_id in repointed.items()
+            ],
+            ordered=False,
+        )
 
-    return True
+    if ops or stale_quotes:
+        stats.apply()
+        tags = ["authors", "stats", *[f"author:{author_id}" for author_id in updated]]
+        if stale_quotes:
+            tags += [f"quote:{quote['_id']}" for quote in stale_quotes]
+            tags += quote_list_tags(
+                {tag for quote in stale_quotes for tag in quote.get("tags") or []}
+            )
+        cache.invalidate(*tags)
+
+    return {
+        "created": len(created),
+        "updated": len(updated),
+        "unchanged": len(scraped_authors) - len(ops),
+        "repointed_quotes": len(stale_quotes),
+    }
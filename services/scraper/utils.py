@@ -1,7 +1,12 @@
 """Scraper Utilities"""
 
-from dataclasses import dataclass
+import time
+import queue
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Callable, Iterable, Iterator, Optional
+from constants.app_constants import PROGRESS_REPORT_EVERY, PROGRESS_REPORT_INTERVAL
 
 
 class TaskStatus(Enum):
@@ -13,6 +18,110 @@ class TaskStatus(Enum):
     SUCCESS: str = "SUCCESS"
 
 
+class ProgressReporter:
+    """Coalesces progress updates of a task into fewer writes
+
+    The latest progress is written once `every` updates are pending or
+    `interval` seconds passed since the last write, and always when the
+    phase changes or flush() is called, so the written progress is monotonic.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict], None],
+        every: int = PROGRESS_REPORT_EVERY,
+        interval: float = PROGRESS_REPORT_INTERVAL,
+    ):
+        self.write = write
+        self.every = every
+        self.interval = interval
+        self.phase = None
+        self.pending = None
+        self.pending_count = 0
+        self.written_at = 0.0
+
+    def report(self, progress: dict, phase: Optional[str] = None) -> None:
+        """Reports the latest progress
+
+        Args:
+            progress (dict): progress to write
+            phase (str): phase of the task, None if it did not change
+        """
+        self.pending = progress
+        self.pending_count += 1
+
+        if (
+            (phase is not None and phase != self.phase)
+            or self.pending_count >= self.every
+            or time.monotonic() - self.written_at >= self.interval
+        ):
+            self.phase = phase or self.phase
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the pending progress, if any"""
+
+        if self.pending is None:
+            return
+
+        self.write(self.pending)
+        self.pending = None
+        self.pending_count = 0
+        self.written_at = time.monotonic()
+
+
+def prefetch(items: Iterable, size: int) -> Iterator:
+    """Produces the items on a background thread, at most `size` items ahead
+    of the consumer, so fetching overlaps with the consumer's writes but never
+    runs far ahead of them. Errors of the producer are raised to the consumer.
+
+    Args:
+        items (Iterable): items to produce, e.g. a crawler
+        size (int): max no. of produced items waiting for the consumer
+
+    Yields:
+        object: the produced items in order
+    """
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except Exception as exp_err:
+            put((done, exp_err))
+        finally:
+            # stops the crawler if the consumer stopped first
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 @dataclass
 class ScrapingTask:
     """Dataclass for Scraping Task Status"""
@@ -20,16 +129,39 @@ class ScrapingTask:
     quote: str = TaskStatus.NOT_STARTED.value
     author: str = TaskStatus.NOT_STARTED.value
     task: object = None
+    reporter: ProgressReporter = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.task is not None and self.reporter is None:
+            self.reporter = ProgressReporter(
+                lambda status: self.task.update(status=status)
+            )
 
     def update(self, quote: TaskStatus = None, author: TaskStatus = None) -> None:
-        """Update Task Status"""
+        """Update Task Status
+
+        A finished part is written together with the start of the next one,
+        the status is written right away when a part starts or all finished.
+        """
 
         if quote:
             self.quote = quote.value
         if author:
             self.author = author.value
 
-        self.task.update(status=self.to_dict())
+        self.reporter.report(self.to_dict(), phase=self.phase())
+
+    def phase(self) -> Optional[str]:
+        """Returns the part in progress, "done" if all finished or
+        None between the parts"""
+
+        if self.quote == TaskStatus.IN_PROGRESS.value:
+            return "quote"
+        if self.author == TaskStatus.IN_PROGRESS.value:
+            return "author"
+        if TaskStatus.NOT_STARTED.value not in (self.quote, self.author):
+            return "done"
+        return None
 
     def to_dict(self) -> dict:
         """Return dict of task status"""
@@ -0,0 +1,121 @@
+"""Incremental updates of the materialized Statistics"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+from database.models import Author, Stats, TagStat, AuthorStat
+from constants.app_constants import STATS_TOP_N_MAX
+
+logger = logging.getLogger("app")
+
+
+@dataclass
+class StatsDelta:
+    """Changes of the counters caused by writes, applied in one batch
+
+    Only Quotes with an Author are counted, like the live statistics.
+    """
+
+    quotes: int = 0
+    authors: int = 0
+    author_quotes: Counter = field(default_factory=Counter)
+    # keys are (tag, author), author is None for the overall count of a tag
+    tag_quotes: Counter = field(default_factory=Counter)
+
+    def add_quote(self, author: Optional[ObjectId], tags: list, sign: int = 1):
+        """Count a new Quote, or remove it with sign=-1"""
+
+        if author is None:
+            return
+
+        self.quotes += sign
+        self.author_quotes[author] += sign
+        for tag in set(tags or []):
+            self.tag_quotes[(tag, None)] += sign
+            self.tag_quotes[(tag, author)] += sign
+
+    def remove_quote(self, author: Optional[ObjectId], tags: list):
+        """Remove a deleted Quote"""
+
+        self.add_quote(author, tags, sign=-1)
+
+    def apply(self) -> None:
+        """Writes the changes and refreshes the top tags and author
+
+        Nothing is written before the stats are built by reconcile_stats.
+        Failures are logged only, the next reconcile corrects the counters.
+        """
+        try:
+            result = Stats._get_collection().update_one(
+                {"_id": "global"},
+                {
+                    "$inc": {"totalQuotes": self.quotes, "totalAuthors": self.authors},
+                    "$set": {"updatedOn": datetime.now(timezone.utc)},
+                },
+            )
+            if result.matched_count == 0:
+                return
+
+            tag_ops = [
+                UpdateOne(
+                    {"tag": tag, "author": author}, {"$inc": {"count": n}}, upsert=True
+                )
+                for (tag, author), n in self.tag_quotes.items()
+                if n
+            ]
+            if tag_ops:
+                TagStat._get_collection().bulk_write(tag_ops, ordered=False)
+
+            author_ops = [
+                UpdateOne({"author": author}, {"$inc": {"count": n}}, upsert=True)
+                for author, n in self.author_quotes.items()
+                if n
+            ]
+            if author_ops:
+                AuthorStat._get_collection().bulk_write(author_ops, ordered=False)
+
+            refresh_summary()
+        except PyMongoError as exp_err:
+            logger.warning(f"Stats - {str(exp_err)}")
+
+
+def refresh_summary() -> None:
+    """Stores top tags and top authors from the counters in the Stats document
+
+    STATS_TOP_N_MAX items are stored, requests read a prefix of the lists.
+    """
+
+    top_tags = TagStat.objects(author=None, count__gt=0).order_by("-count")
+    top_tags = [stat.tag for stat in top_tags.limit(STATS_TOP_N_MAX)]
+
+    author_stats = AuthorStat.objects(count__gt=0).order_by("-count")
+    author_stats = list(author_stats.limit(STATS_TOP_N_MAX))
+    names = {
+        author.id: author.name
+        for author in Author.objects(
+            id__in=[stat.author for stat in author_stats]
+        ).only("name")
+    }
+    top_authors = [
+        {"name": names.get(stat.author), "total_quotes": stat.count}
+        for stat in author_stats
+    ]
+
+    top_author = {}
+    if author_stats:
+        author_tags = TagStat.objects(author=author_stats[0].author, count__gt=0)
+        author_tags = author_tags.order_by("-count").limit(STATS_TOP_N_MAX)
+        top_author = {
+            "id": str(author_stats[0].author),
+            **top_authors[0],
+            "top_tags": [stat.tag for stat in author_tags],
+        }
+
+    Stats.objects(key="global").update_one(
+        set__topTags=top_tags, set__topAuthor=top_author, set__topAuthors=top_authors
+    )
@@ -0,0 +1,91 @@
+"""Periodic full recount of the materialized Statistics"""
+
+from datetime import datetime, timezone
+from celery import shared_task
+from pymongo import ReplaceOne
+from database.models import Author, Quote, Stats, TagStat, AuthorStat
+from services.stats.counters import refresh_summary
+from utils.cache import cache
+
+
+def replace_counters(model, counts: dict, key_fields: tuple) -> None:
+    """Overwrites the counters of a collection and removes the stale ones
+
+    Args:
+        model (Document): TagStat or AuthorStat
+        counts (dict): count of every key
+        key_fields (tuple): field names of the key
+    """
+    collection = model._get_collection()
+
+    ops = []
+    for key, count in counts.items():
+        key = dict(zip(key_fields, key))
+        ops.append(ReplaceOne(key, {**key, "count": count}, upsert=True))
+    if ops:
+        collection.bulk_write(ops, ordered=False)
+
+    stale = [
+        doc["_id"]
+        for doc in collection.find({}, {field: 1 for field in key_fields})
+        if tuple(doc.get(field) for field in key_fields) not in counts
+    ]
+    if stale:
+        collection.delete_many({"_id": {"$in": stale}})
+
+
+@shared_task
+def reconcile_stats() -> dict:
+    """Recounts the Statistics from the Quotes and Authors collections,
+    correcting any drift of the incremental updates.
+
+    Returns:
+        dict: no. of counted quotes, authors and tags
+    """
+    quotes = Quote.objects(author__exists=True)
+
+    author_counts = {
+        (doc["_id"],): doc["count"]
+        for doc in quotes.aggregate(
+            [{"$group": {"_id": "$author", "count": {"$sum": 1}}}]
+        )
+    }
+
+    tag_counts = {}
+    pipeline = [
+        # same tag twice in a quote is counted once
+        {"$project": {"author": 1, "tags": {"$setUnion": ["$tags", []]}}},
+        {"$unwind": "$tags"},
+        {
+            "$group": {
+                "_id": {"tag": "$tags", "author": "$author"},
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+    for doc in quotes.aggregate(pipeline):
+        tag, author = doc["_id"]["tag"], doc["_id"]["author"]
+        tag_counts[(tag, author)] = doc["count"]
+        tag_counts[(tag, None)] = tag_counts.get((tag, None), 0) + doc["count"]
+
+    replace_counters(AuthorStat, author_counts, ("author",))
+    replace_counters(TagStat, tag_counts, ("tag", "author"))
+
+    now = datetime.now(timezone.utc)
+    total_quotes = sum(author_counts.values())
+    total_authors = Author.objects.count()
+    Stats.objects(key="global").update_one(
+        set__totalQuotes=total_quotes,
+        set__totalAuthors=total_authors,
+        set__updatedOn=now,
+        set__reconciledOn=now,
+        upsert=True,
+    )
+    refresh_summary()
+    cache.invalidate("stats")
+
+    return {
+        "quotes": total_quotes,
+        "authors": total_authors,
+        "tags": sum(1 for _, author in tag_counts if author is None),
+    }
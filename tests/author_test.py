@@ -1,7 +1,9 @@
 """Author Tests"""
 
 import unittest
+from bson import ObjectId
 from app import create_app
+from utils.pagination import encode_cursor
 from database.models import Author
 
 
@@ -21,6 +23,43 @@ class AuthorTest(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_get_authors_next_page(self):
+        """Test for keyset pagination of Authors"""
+
+        # authors created after this id are the last ones of the collection
+        start = encode_cursor({"id": str(ObjectId())})
+        seeded = [
+            Author(
+                name=f"Pagination Author {i}",
+                dob="2000-12-1",
+                country="India",
+                description="Testing....",
+            ).save()
+            for i in range(5)
+        ]
+
+        try:
+            pages, cursor = [], start
+            while cursor:
+                response = self.client.get(f"/authors/?limit=2&after={cursor}")
+                self.assertEqual(response.status_code, 200)
+                pages.append([author["_id"] for author in response.get_json()["data"]])
+                cursor = response.get_json()["next_cursor"]
+                self.assertLessEqual(len(pages), 3)
+        finally:
+            for author in seeded:
+                author.delete()
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), [str(author.id) for author in seeded])
+
+    def test_get_authors_invalid_limit(self):
+        """Test for invalid pagination limit"""
+
+        response = self.client.get("/authors/?limit=0")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Error", response.get_json())
+
     def test_create_author(self):
         """Test for create Author"""
 
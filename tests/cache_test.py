@@ -0,0 +1,203 @@
+"""Response Cache Tests"""
+
+import unittest
+import fakeredis
+from flask import Flask, jsonify, make_response
+from app import create_app
+from database.models import Author, Quote
+from resources.quote import get_quotes_cache_tags
+from utils.cache import ResponseCache, cache, quote_list_tags
+from constants.app_constants import CACHE_VERSION_TIMEOUT
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """Response Cache Test Class, on a Flask app without database"""
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        self.cache.client = fakeredis.FakeRedis()
+        self.calls = 0
+
+        app = Flask(__name__)
+
+        @app.route("/quotes/")
+        @self.cache.cached(get_quotes_cache_tags)
+        def quotes():
+            self.calls += 1
+            return make_response(jsonify({"calls": self.calls}), 200)
+
+        @app.route("/quotes/<quote_id>/")
+        @self.cache.cached(lambda quote_id: [f"quote:{quote_id}"])
+        def quote(quote_id):  # pylint: disable=W0613
+            self.calls += 1
+            return make_response(jsonify({"Error": "Does Not Exist!"}), 404)
+
+        self.client = app.test_client()
+
+    def test_matching_etag_is_not_modified(self):
+        """Test a matching If-None-Match is answered from the cache with 304"""
+
+        etag = self.client.get("/quotes/").headers["ETag"]
+
+        response = self.client.get("/quotes/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_etag_outlives_the_entry(self):
+        """Test a matching If-None-Match is answered with 304 once the entry
+        expired, while the versions of its tags are alive"""
+
+        etag = self.client.get("/quotes/").headers["ETag"]
+        self.cache.client.delete(*self.cache.client.zrange(ResponseCache.INDEX, 0, -1))
+
+        response = self.client.get("/quotes/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_write_changes_etag(self):
+        """Test an ETag does not match after a write to a tag of the response"""
+
+        etag = self.client.get("/quotes/").headers["ETag"]
+        self.cache.invalidate("quotes")
+
+        response = self.client.get("/quotes/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.calls, 2)
+
+    def test_star_etag_of_missing_resource(self):
+        """Test If-None-Match: * is not answered with 304 for a 404"""
+
+        for _ in range(2):
+            response = self.client.get("/quotes/1/", headers={"If-None-Match": "*"})
+            self.assertEqual(response.status_code, 404)
+
+    def test_entry_without_etag_is_refreshed(self):
+        """Test an entry stored without ETag is a miss, not an error"""
+
+        self.client.get("/quotes/")
+        key = next(iter(self.cache.client.zrange(ResponseCache.INDEX, 0, -1)))
+        self.cache.client.hdel(key, "etag")
+
+        response = self.client.get("/quotes/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, 2)
+
+    def test_tag_list_is_kept_on_write_of_other_tag(self):
+        """Test a write invalidates the lists of its tags only"""
+
+        self.client.get("/quotes/?tags=love")
+        self.client.get("/quotes/?tags=life")
+        self.cache.invalidate(*quote_list_tags(["life"]))
+
+        self.client.get("/quotes/?tags=love")
+        self.assertEqual(self.calls, 2)
+        self.client.get("/quotes/?tags=life")
+        self.assertEqual(self.calls, 3)
+
+    def test_unfiltered_list_is_invalidated_by_any_write(self):
+        """Test the unfiltered list depends on every quote"""
+
+        self.client.get("/quotes/")
+        self.cache.invalidate(*quote_list_tags(["life"]))
+        self.client.get("/quotes/")
+
+        self.assertEqual(self.calls, 2)
+
+    def test_versions_expire(self):
+        """Test versions of the tags are not kept forever"""
+
+        self.client.get("/quotes/")
+        self.cache.invalidate(*quote_list_tags(["life"]))
+
+        for tag in ("quotes", "tag:life"):
+            ttl = self.cache.client.ttl(f"{ResponseCache.VERSION}{tag}")
+            self.assertGreater(ttl, 0)
+            self.assertLessEqual(ttl, CACHE_VERSION_TIMEOUT)
+
+    def test_expired_version_changes_etag(self):
+        """Test an ETag issued before a version expired does not match again"""
+
+        etag = self.client.get("/quotes/").headers["ETag"]
+        self.cache.invalidate("quotes")
+        self.cache.client.delete(f"{ResponseCache.VERSION}quotes")
+
+        response = self.client.get("/quotes/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+
+class QuoteCacheTest(unittest.TestCase):
+    """Cache invalidation by the Quote and Author write endpoints"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.client = self.app.test_client()
+        cache.client = fakeredis.FakeRedis()
+
+        self.author = Author(
+            name="Cache Author",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        ).save()
+        self.quote = Quote(
+            quote="Cache quote", author=self.author, tags=["cache-love"]
+        ).save()
+
+    def tearDown(self):
+        cache.client = None
+        self.author.delete()
+
+    def versions(self) -> dict:
+        """Returns the current versions of the tags"""
+
+        tags = ["quotes", "tag:cache-love", "tag:cache-life", "tag:cache-other"]
+        versions = cache.client.mget([f"{ResponseCache.VERSION}{tag}" for tag in tags])
+        return dict(zip(tags, versions))
+
+    def test_quote_update_invalidates_its_tags(self):
+        """Test a Quote update invalidates its old and new tags only"""
+
+        for tags in ("cache-love", "cache-life", "cache-other"):
+            self.client.get(f"/quotes/?tags={tags}")
+        before = self.versions()
+
+        response = self.client.put(
+            f"/quotes/{self.quote.id}/", json={"tags": ["cache-life"]}
+        )
+        after = self.versions()
+
+        self.assertEqual(response.status_code, 200)
+        for tag in ("quotes", "tag:cache-love", "tag:cache-life"):
+            self.assertNotEqual(after[tag], before[tag])
+        self.assertEqual(after["tag:cache-other"], before["tag:cache-other"])
+
+    def test_author_without_quotes_keeps_quote_lists(self):
+        """Test an update of an Author without Quotes keeps the Quote lists"""
+
+        author = Author(
+            name="Cache Author Without Quotes",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        ).save()
+        self.client.get("/quotes/")
+        before = self.versions()
+
+        response = self.client.put(f"/authors/{author.id}/", json={"country": "UK"})
+        author.delete()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.versions()["quotes"], before["quotes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
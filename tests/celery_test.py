@@ -2,8 +2,12 @@
 
 import pytest
 from app import create_app
+from celery.result import AsyncResult
 from services.scraper.scraper import scrape_data
-from database.models import Author, ScrapedAuthor
+from services.scraper.distributed import scrape_data_distributed
+from services.scraper.crawler import get_page_url
+from database.models import Author, ScrapedAuthor, ScrapedPage
+from benchmarks.fixture_server import start_fixture_server
 
 
 @pytest.fixture(scope="session")
@@ -14,13 +18,18 @@ def make_app(request):
         Flask: Flask app
     """
     app_ = create_app("test")
+    # scrape the local fixture site instead of the live one
+    server, url = start_fixture_server(pages=3, authors=5)
+    app_.config["SCRAPER_BASE_URL"] = url
     ctx = app_.app_context()
     ctx.push()
 
     def teardown():
         Author.objects.delete()
         ScrapedAuthor.objects.delete()
+        ScrapedPage.objects.delete()
         ctx.pop()
+        server.shutdown()
 
     request.addfinalizer(teardown)
     return app_
@@ -50,7 +59,42 @@ def test_scrape_data(make_celery, celery_worker):  # pylint: disable=W0613,W0621
         make_celery (fixture): creates celery app
         celery_worker (fixture): creates celery worker
     """
-    assert scrape_data.delay(single_page=True).get() == {
-        "quotes": {"fetched_records": 10},
-        "authors": {"fetched_records": 8, "total": 8},
-    }
+    result = scrape_data.delay(single_page=True).get()
+    quotes, authors = result["quotes"], result["authors"]
+
+    # pages unchanged since a previous run are skipped
+    assert quotes["processed_pages"] + quotes["skipped_pages"] == 1
+    assert quotes["fetched_records"] == 10 * quotes["processed_pages"]
+    assert quotes["inserted"] + quotes["updated"] + quotes["unchanged"] == (
+        quotes["fetched_records"]
+    )
+    assert authors["fetched_records"] == authors["total"]
+    assert authors["processed_pages"] + authors["skipped_pages"] == authors["total"]
+
+
+def test_scrape_data_distributed(
+    make_app, make_celery, celery_worker
+):  # pylint: disable=W0613,W0621
+    """Test Case for Scraping Quotes with a chord of page tasks
+
+    Args:
+        make_app (fixture): creates Flask app
+        make_celery (fixture): creates celery app
+        celery_worker (fixture): creates celery worker
+    """
+    crawl = scrape_data_distributed.delay().get()
+    result = AsyncResult(crawl["merge_id"]).get(timeout=60)
+    quotes = result["quotes"]
+
+    assert crawl["total_pages"] == 3
+    assert quotes["processed_pages"] + quotes["skipped_pages"] == 3
+    assert quotes["fetched_records"] == 10 * quotes["processed_pages"]
+    assert quotes["inserted"] + quotes["updated"] + quotes["unchanged"] == (
+        quotes["fetched_records"]
+    )
+
+    # the first page is fingerprinted under the url of the sequential crawl
+    base_url = make_app.config["SCRAPER_BASE_URL"]
+    assert ScrapedPage.objects(url=base_url).count() == 1
+    assert ScrapedPage.objects(url=get_page_url(base_url, 1)).count() == 0
+    assert ScrapedPage.objects(url=get_page_url(base_url, 3)).count() == 1
@@ -0,0 +1,67 @@
+"""Quote Crawler Tests"""
+
+import unittest
+from benchmarks.fixture_server import QUOTES_PER_PAGE, start_fixture_server
+from services.scraper.crawler import (
+    PageFingerprints,
+    crawl_quotes_http,
+    fetch_authors,
+)
+
+
+class CrawlerTest(unittest.TestCase):
+    """Crawler Test Class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_fixture_server(pages=3, authors=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def test_crawl_all_pages(self):
+        """Test the crawler follows the next page links"""
+
+        quotes = list(crawl_quotes_http(self.url, single_page=False))
+        self.assertEqual(len(quotes), 3 * QUOTES_PER_PAGE)
+        for quote in quotes:
+            self.assertNotIn("“", quote["quote"])
+            self.assertTrue(quote["author"]["link"].startswith(self.url))
+            self.assertTrue(quote["tags"])
+
+    def test_crawl_single_page(self):
+        """Test the crawler stops after the first page"""
+
+        quotes = list(crawl_quotes_http(self.url, single_page=True))
+        self.assertEqual(len(quotes), QUOTES_PER_PAGE)
+
+    def test_fetch_authors(self):
+        """Test every author page is fetched and parsed"""
+
+        links = [f"{self.url}author/Author-{i}" for i in range(5)]
+        authors = dict(fetch_authors(links))
+        self.assertEqual(set(authors), set(links))
+        for author in authors.values():
+            self.assertEqual(author["country"], "Ulm, Germany")
+
+    def test_crawl_unchanged_pages(self):
+        """Test unchanged pages are skipped and their next page is followed"""
+
+        first_run = PageFingerprints()
+        list(crawl_quotes_http(self.url, single_page=False, fingerprints=first_run))
+        self.assertEqual(first_run.counts(), {"processed_pages": 3, "skipped_pages": 0})
+
+        second_run = PageFingerprints(first_run.changed)
+        second_run.forget([f"{self.url}page/2/"])
+        quotes = list(
+            crawl_quotes_http(self.url, single_page=False, fingerprints=second_run)
+        )
+        self.assertEqual(len(quotes), QUOTES_PER_PAGE)
+        self.assertEqual(
+            second_run.counts(), {"processed_pages": 1, "skipped_pages": 2}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Driver Pool Tests"""
+
+import unittest
+from selenium.common.exceptions import WebDriverException
+from services.scraper.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Records the calls the pool makes on a browser"""
+
+    def __init__(self):
+        self.alive = True
+        self.quitted = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise WebDriverException("browser died")
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quitted = True
+
+
+class DriverPoolTest(unittest.TestCase):
+    """Driver Pool Test Class"""
+
+    def setUp(self):
+        self.created = []
+
+        def factory():
+            self.created.append(FakeDriver())
+            return self.created[-1]
+
+        self.pool = DriverPool(factory, size=1, max_uses=3)
+
+    def test_driver_is_created_lazily_and_reused(self):
+        """Test the browser is started on first use and kept warm"""
+
+        self.assertEqual(self.created, [])
+        for _ in range(2):
+            with self.pool.driver():
+                pass
+
+        self.assertEqual(len(self.created), 1)
+        self.assertFalse(self.created[0].quitted)
+
+    def test_driver_is_recycled_after_max_uses(self):
+        """Test the browser is quit after max_uses tasks"""
+
+        for _ in range(4):
+            with self.pool.driver():
+                pass
+
+        self.assertEqual(len(self.created), 2)
+        self.assertTrue(self.created[0].quitted)
+
+    def test_dead_driver_is_replaced(self):
+        """Test a browser failing the health check is not handed out"""
+
+        with self.pool.driver() as driver:
+            pass
+        driver.alive = False
+
+        with self.pool.driver() as new_driver:
+            self.assertIsNot(new_driver, driver)
+        self.assertTrue(driver.quitted)
+
+    def test_driver_failing_a_task_is_quit(self):
+        """Test a browser raising a driver error is not returned to the pool"""
+
+        with self.assertRaises(WebDriverException):
+            with self.pool.driver():
+                raise WebDriverException("crashed")
+
+        self.assertTrue(self.created[0].quitted)
+        self.assertEqual(self.pool.idle, [])
+
+    def test_close_quits_idle_drivers(self):
+        """Test close() quits the warm browsers, as on worker shutdown"""
+
+        with self.pool.driver():
+            pass
+        self.pool.close()
+
+        self.assertTrue(self.created[0].quitted)
+        self.assertEqual(self.pool.idle, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
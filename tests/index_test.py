@@ -0,0 +1,164 @@
+"""Index Tests"""
+
+import unittest
+from bson import ObjectId
+from app import create_app
+from database.indexes import MODELS
+from database.models import Quote, ScrapedAuthor, TagStat, AuthorStat
+from resources.quote import get_query_quotes_by_tags, get_query_quotes_by_text
+from resources.stats import get_query_most_popular, get_query_quote_stats
+from utils.pagination import Page
+from utils.tag_query import TagQuery
+from constants.app_constants import STATS_TOP_N_MAX, TAGS_QUERY_MAX_CANDIDATES
+
+
+def get_plan_stages(explain: dict) -> list:
+    """Returns names of all the stages of the winning plans in explain output"""
+
+    stages = []
+
+    def walk(node, in_plan=False):
+        if isinstance(node, dict):
+            if in_plan and "stage" in node:
+                stages.append(node["stage"])
+            for key, value in node.items():
+                if key != "rejectedPlans":
+                    walk(value, in_plan or key in ("winningPlan", "queryPlan"))
+        elif isinstance(node, list):
+            for value in node:
+                walk(value, in_plan)
+
+    walk(explain)
+    return stages
+
+
+class IndexTest(unittest.TestCase):
+    """Index Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        for model in MODELS:
+            model.ensure_indexes()
+
+    def explain_aggregate(self, queryset, pipeline: list) -> dict:
+        """Returns explain output of an aggregation on the queryset"""
+
+        collection = queryset._collection
+        # mongoengine prepends the queryset filter as the first $match
+        pipeline = [{"$match": queryset._query}] + pipeline
+        return collection.database.command(
+            "explain",
+            {"aggregate": collection.name, "pipeline": pipeline, "cursor": {}},
+            verbosity="queryPlanner",
+        )
+
+    def assertNoCollscan(self, explain: dict):  # pylint: disable=C0103
+        """Fails if the winning plan scans the whole collection"""
+
+        stages = get_plan_stages(explain)
+        self.assertTrue(stages)
+        self.assertNotIn("COLLSCAN", stages)
+
+    def test_quotes_list_uses_index(self):
+        """Test for GET /quotes/ query"""
+
+        queryset = Quote.objects(author__exists=True, id__gt=ObjectId())
+        self.assertNoCollscan(queryset.order_by("id").limit(51).explain())
+
+    def test_quotes_by_tags_uses_index(self):
+        """Test for GET /quotes/?tags= aggregation, ranked and not ranked"""
+
+        for mode in ("any", "all"):
+            tag_query = TagQuery(tags=["love", "life"], mode=mode, exclude=["humor"])
+            queryset = Quote.objects(author__exists=True, __raw__=tag_query.to_filter())
+            pipeline = get_query_quotes_by_tags(tag_query, Page(limit=50, after=None))
+            self.assertNoCollscan(self.explain_aggregate(queryset, pipeline))
+
+    def test_quotes_by_tags_bounds_candidates(self):
+        """Test the ranked GET /quotes/?tags= aggregation reads a bounded no.
+        of candidates of the tags index"""
+
+        tag_query = TagQuery(tags=["love", "life"], exclude=["humor"])
+        queryset = Quote.objects(author__exists=True, __raw__=tag_query.to_filter())
+        pipeline = get_query_quotes_by_tags(tag_query, Page(limit=50, after=None))
+
+        self.assertEqual(pipeline[0], {"$limit": TAGS_QUERY_MAX_CANDIDATES})
+        stages = get_plan_stages(self.explain_aggregate(queryset, pipeline))
+        self.assertIn("LIMIT", stages)
+        self.assertNotIn("COLLSCAN", stages)
+
+    def test_quotes_by_author_uses_index(self):
+        """Test for top author tags query of GET /stats/"""
+
+        pipeline = get_query_most_popular("tags", 5)
+        explain = self.explain_aggregate(Quote.objects(author=ObjectId()), pipeline)
+        self.assertNoCollscan(explain)
+
+    def test_quotes_search_uses_text_index(self):
+        """Test for GET /quotes/search/ aggregation"""
+
+        queryset = Quote.objects(author__exists=True).search_text("life")
+        pipeline = get_query_quotes_by_text(Page(limit=50, after=None))
+        explain = self.explain_aggregate(queryset, pipeline)
+
+        self.assertNoCollscan(explain)
+        self.assertIn("TEXT_MATCH", get_plan_stages(explain))
+
+    def test_quote_stats_uses_index(self):
+        """Test for the $facet aggregation of live GET /stats/"""
+
+        queryset = Quote.objects(author__exists=True)
+        explain = self.explain_aggregate(queryset, get_query_quote_stats(5, 5))
+        self.assertNoCollscan(explain)
+
+    def test_author_stats_lookup_is_indexed(self):
+        """Test the $lookup of quotes of the top author in live GET /stats/
+        joins on the prefix of an index"""
+
+        keys = [
+            index["key"][0][0]
+            for index in Quote._get_collection().index_information().values()
+        ]
+        self.assertIn("author", keys)
+
+    def test_top_tags_use_index(self):
+        """Test for the top tags reads of refresh_summary, overall and of an
+        author"""
+
+        for author in (None, ObjectId()):
+            queryset = TagStat.objects(author=author, count__gt=0).order_by("-count")
+            explain = queryset.limit(STATS_TOP_N_MAX).explain()
+            self.assertNoCollscan(explain)
+            self.assertNotIn("SORT", get_plan_stages(explain))
+
+    def test_top_authors_use_index(self):
+        """Test for the top authors read of refresh_summary"""
+
+        queryset = AuthorStat.objects(count__gt=0).order_by("-count")
+        explain = queryset.limit(STATS_TOP_N_MAX).explain()
+        self.assertNoCollscan(explain)
+        self.assertNotIn("SORT", get_plan_stages(explain))
+
+    def test_quotes_by_scraped_author_uses_index(self):
+        """Test for update_authors_collection query"""
+
+        queryset = Quote.objects(scrapedAuthor__in=[ObjectId(), ObjectId()])
+        self.assertNoCollscan(
+            queryset.only("author", "scrapedAuthor", "tags").explain()
+        )
+
+    def test_scraped_author_by_link_uses_index(self):
+        """Test for resolve_scraped_authors query"""
+
+        links = [
+            "https://quotes.toscrape.com/author/Albert-Einstein",
+            "https://quotes.toscrape.com/author/Jane-Austen",
+        ]
+        cursor = ScrapedAuthor._get_collection().find(
+            {"link": {"$in": links}}, {"_id": 1, "link": 1}
+        )
+        self.assertNoCollscan(cursor.explain())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""HTML Parser Tests"""
+
+import datetime
+import os
+import unittest
+from services.scraper.parsers import PARSERS, get_parser, lxml
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+PAGE_URL = "https://quotes.toscrape.com/"
+
+
+def read_fixture(name: str) -> bytes:
+    """Returns content of a saved page"""
+
+    with open(os.path.join(FIXTURES, name), "rb") as fixture:
+        return fixture.read()
+
+
+class ParserTest(unittest.TestCase):
+    """Parser Test Class"""
+
+    def setUp(self):
+        self.quotes_page = read_fixture("quotes_page.html")
+        self.author_page = read_fixture("author_page.html")
+
+    def test_parse_quotes(self):
+        """Test for quotes and next page of a listing page"""
+
+        quotes, next_url = get_parser("html5lib").parse_quotes(
+            self.quotes_page, PAGE_URL
+        )
+
+        self.assertEqual(len(quotes), 4)
+        self.assertEqual(next_url, "https://quotes.toscrape.com/page/2/")
+        self.assertEqual(
+            quotes[2],
+            {
+                "quote": "Try not to become a man of success. "
+                "Rather become a man of value.",
+                "author": {
+                    "name": "Albert Einstein",
+                    "link": "https://quotes.toscrape.com/author/Albert-Einstein",
+                },
+                "tags": ["adulthood", "success", "value"],
+            },
+        )
+
+    def test_parse_author(self):
+        """Test for details of an author page"""
+
+        author = get_parser("html5lib").parse_author(self.author_page)
+
+        self.assertEqual(author["dob"], datetime.datetime(1879, 3, 14))
+        self.assertEqual(author["country"], "Ulm, Germany")
+        self.assertTrue(author["description"].startswith("In 1879, Albert Einstein"))
+        self.assertIn("Zürich", author["description"])
+        self.assertTrue(author["description"].endswith("household words."))
+
+    @unittest.skipUnless(lxml, "lxml is not installed")
+    def test_parsers_are_identical(self):
+        """Test every parser returns the same data as html5lib"""
+
+        expected = get_parser("html5lib")
+        for name in PARSERS:
+            parser = get_parser(name)
+            with self.subTest(parser=name):
+                # get_parser falls back to html5lib without lxml
+                self.assertEqual(parser.name, name)
+                self.assertEqual(
+                    parser.parse_quotes(self.quotes_page, PAGE_URL),
+                    expected.parse_quotes(self.quotes_page, PAGE_URL),
+                )
+                self.assertEqual(
+                    parser.parse_author(self.author_page),
+                    expected.parse_author(self.author_page),
+                )
+
+    def test_last_page(self):
+        """Test a page without next link"""
+
+        page = self.quotes_page.replace(b'class="next"', b'class="previous"')
+        for name in PARSERS:
+            with self.subTest(parser=name):
+                self.assertIsNone(get_parser(name).parse_quotes(page, PAGE_URL)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Prefetch Tests"""
+
+import time
+import unittest
+from services.scraper.utils import prefetch
+
+
+class PrefetchTest(unittest.TestCase):
+    """Prefetch Test Class"""
+
+    def test_items_in_order(self):
+        """Test all the items are produced in order"""
+
+        self.assertEqual(list(prefetch(range(100), size=3)), list(range(100)))
+
+    def test_producer_is_bounded(self):
+        """Test the producer never runs more than size items ahead"""
+
+        produced = []
+
+        def items():
+            for item in range(100):
+                produced.append(item)
+                yield item
+
+        consumer = prefetch(items(), size=2)
+        next(consumer)
+        time.sleep(0.2)
+        # one consumed, two buffered and one waiting to be put
+        self.assertLessEqual(len(produced), 4)
+        consumer.close()
+
+    def test_producer_error_is_raised(self):
+        """Test errors of the producer reach the consumer"""
+
+        def items():
+            yield 1
+            raise RuntimeError("page failed")
+
+        with self.assertRaises(RuntimeError):
+            list(prefetch(items(), size=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
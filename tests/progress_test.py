@@ -0,0 +1,67 @@
+"""Progress Reporter Tests"""
+
+import unittest
+from services.scraper.utils import ProgressReporter, ScrapingTask, TaskStatus
+
+
+class FakeScheduledTask:
+    """Records the status writes of a Scheduled Task"""
+
+    def __init__(self):
+        self.statuses = []
+
+    def update(self, status: dict) -> None:
+        """Records a status write"""
+
+        self.statuses.append(status)
+
+
+class ProgressReporterTest(unittest.TestCase):
+    """Progress Reporter Test Class"""
+
+    def setUp(self):
+        self.writes = []
+        self.reporter = ProgressReporter(self.writes.append, every=10, interval=60)
+
+    def test_updates_are_coalesced(self):
+        """Test progress is written every n updates and on flush"""
+
+        self.reporter.report({"fetched_records": 0}, phase="quotes")
+        for count in range(1, 26):
+            self.reporter.report({"fetched_records": count})
+        self.reporter.flush()
+
+        counts = [write["fetched_records"] for write in self.writes]
+        self.assertEqual(counts, [0, 10, 20, 25])
+
+    def test_phase_change_is_written(self):
+        """Test a new phase is written right away"""
+
+        self.reporter.report({"scraping": "quotes"}, phase="quotes")
+        self.reporter.report({"scraping": "authors"}, phase="authors")
+        self.assertEqual(len(self.writes), 2)
+
+    def test_scraping_task_transitions(self):
+        """Test a finished part is written with the start of the next one"""
+
+        scheduled_task = FakeScheduledTask()
+        task_status = ScrapingTask(task=scheduled_task)
+        task_status.reporter.interval = 60
+
+        task_status.update(quote=TaskStatus.IN_PROGRESS)
+        task_status.update(quote=TaskStatus.SUCCESS)
+        task_status.update(author=TaskStatus.IN_PROGRESS)
+        task_status.update(author=TaskStatus.SUCCESS)
+
+        self.assertEqual(
+            scheduled_task.statuses,
+            [
+                {"quote": "IN_PROGRESS", "author": "NOT_STARTED"},
+                {"quote": "SUCCESS", "author": "IN_PROGRESS"},
+                {"quote": "SUCCESS", "author": "SUCCESS"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
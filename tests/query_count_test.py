@@ -0,0 +1,98 @@
+"""Database round trip Tests"""
+
+import unittest
+from pymongo import monitoring
+from app import create_app
+from database.models import Quote, Author
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts the commands sent to MongoDB"""
+
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        self.commands.append(event.command_name)
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Listeners are only attached to clients created after registration,
+# so this must run before the app connects to the database.
+command_counter = CommandCounter()
+monitoring.register(command_counter)
+
+
+class QueryCountTest(unittest.TestCase):
+    """Query Count Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.client = self.app.test_client()
+
+        self.authors = [
+            Author(
+                name=f"Query Count Author {i}",
+                dob="2000-12-1",
+                country="India",
+                description="Testing....",
+            ).save()
+            for i in range(3)
+        ]
+        self.quotes = [
+            Quote(
+                quote=f"Query count quote {i}",
+                author=self.authors[i % len(self.authors)],
+                tags=["testing"],
+            ).save()
+            for i in range(6)
+        ]
+
+    def tearDown(self):
+        for author in self.authors:
+            author.delete()
+
+    def count_commands(self, url: str) -> int:
+        """Returns no. of commands sent to MongoDB while serving the url"""
+
+        # first request may create the indexes of the collections
+        self.client.get(url)
+        command_counter.commands.clear()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(command_counter.commands)
+
+    def test_get_all_quotes_commands(self):
+        """Test authors of the quotes list are fetched in bulk"""
+
+        self.assertLessEqual(self.count_commands("/quotes/"), 2)
+
+    def test_get_quotes_by_tags_commands(self):
+        """Test quotes by tags are fetched with a single aggregation"""
+
+        self.assertEqual(self.count_commands("/quotes/?tags=testing"), 1)
+
+    def test_get_quotes_by_all_tags_commands(self):
+        """Test a page filled by quotes matching every tag takes one aggregation"""
+
+        url = "/quotes/?tags=testing,query&limit=2"
+        Quote.objects(id__in=[quote.id for quote in self.quotes]).update(
+            push__tags="query"
+        )
+        self.assertEqual(self.count_commands(url), 1)
+
+    def test_get_quote_commands(self):
+        """Test single quote and its author are fetched without dereferencing"""
+
+        quote_id = self.quotes[0].id
+        self.assertLessEqual(self.count_commands(f"/quotes/{quote_id}/"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
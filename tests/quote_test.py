@@ -1,8 +1,13 @@
 """Quote Tests"""
 
+import json
 import unittest
+from unittest import mock
+from bson import ObjectId
 from app import create_app
+from utils.pagination import encode_cursor, decode_cursor
 from database.models import Quote, Author
+from constants.app_constants import TAGS_QUERY_MAX_TAGS
 
 
 class QuoteTest(unittest.TestCase):
@@ -20,6 +25,164 @@ class QuoteTest(unittest.TestCase):
         response = self.client.get("/quotes/")
         self.assertEqual(response.status_code, 200)
 
+    def test_get_quotes_next_page(self):
+        """Test for keyset pagination of Quotes"""
+
+        author = Author(
+            name="Pagination Author",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        )
+        author.save()
+        # quotes created after this id are the last ones of the collection
+        start = encode_cursor({"id": str(ObjectId())})
+        seeded = [
+            str(Quote(quote=f"Pagination quote {i}", author=author).save().id)
+            for i in range(5)
+        ]
+
+        try:
+            pages, cursor = [], start
+            while cursor:
+                response = self.client.get(f"/quotes/?limit=2&after={cursor}")
+                self.assertEqual(response.status_code, 200)
+                pages.append([quote["_id"] for quote in response.get_json()["data"]])
+                cursor = response.get_json()["next_cursor"]
+                self.assertLessEqual(len(pages), 3)
+        finally:
+            author.delete()
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), seeded)
+
+    def test_get_quotes_stream(self):
+        """Test for streaming Quotes as newline delimited JSON"""
+
+        response = self.client.get(
+            "/quotes/", headers={"Accept": "application/x-ndjson"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        for line in response.data.splitlines():
+            self.assertIn("quote", json.loads(line))
+
+    def test_get_quotes_invalid_cursor(self):
+        """Test for invalid pagination cursor"""
+
+        response = self.client.get("/quotes/?after=63bfb6768a1d693e61cd")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Error", response.get_json())
+
+    def test_get_quotes_by_tags_modes(self):
+        """Test for all / any / exclude tags filters"""
+
+        response = self.client.get("/quotes/?tags=code,testing&mode=all&exclude=life")
+        self.assertEqual(response.status_code, 200)
+        for quote in response.get_json()["data"]:
+            self.assertTrue({"code", "testing"}.issubset(quote["tags"]))
+            self.assertNotIn("life", quote["tags"])
+
+    def test_get_quotes_by_tags_next_page(self):
+        """Test for keyset pagination of Quotes ranked by matched tags"""
+
+        author = Author(
+            name="Ranked Pagination Author",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        ).save()
+        tags = [["rank-a", "rank-b"], ["rank-a"], ["rank-b", "rank-a"], ["rank-b"]]
+        seeded = [
+            Quote(quote=f"Ranked quote {i}", author=author, tags=quote_tags).save()
+            for i, quote_tags in enumerate(tags + [["rank-a"]])
+        ]
+        # quotes matching both tags first, _id is the tiebreak of a level
+        expected = [str(seeded[i].id) for i in (0, 2, 1, 3, 4)]
+
+        try:
+            pages, cursors = [], []
+            params = {"tags": "rank-a,rank-b", "limit": 2}
+            while len(pages) < 3:
+                response = self.client.get("/quotes/", query_string=params)
+                self.assertEqual(response.status_code, 200)
+                pages.append([quote["_id"] for quote in response.get_json()["data"]])
+                params["after"] = response.get_json()["next_cursor"]
+                cursors.append(params["after"] and decode_cursor(params["after"]))
+        finally:
+            author.delete()
+
+        self.assertEqual(sum(pages, []), expected)
+        self.assertEqual(cursors[0], {"m": 2, "id": seeded[2].id})
+        self.assertEqual(cursors[1], {"m": 1, "id": seeded[3].id})
+        self.assertIsNone(cursors[2])
+
+    @mock.patch("resources.quote.TAGS_QUERY_MAX_CANDIDATES", 3)
+    def test_get_quotes_by_tags_candidates_bound(self):
+        """Test a ranked tags query ranks at most TAGS_QUERY_MAX_CANDIDATES"""
+
+        author = Author(
+            name="Ranked Candidates Author",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        ).save()
+        for i in range(5):
+            Quote(
+                quote=f"Candidate quote {i}",
+                author=author,
+                tags=["candidate-a", "candidate-b"][: i % 2 + 1],
+            ).save()
+
+        try:
+            response = self.client.get("/quotes/?tags=candidate-a,candidate-b")
+            page = response.get_json()
+            response = self.client.get("/quotes/?tags=candidate-a,candidate-b&stream=1")
+            streamed = response.get_data(as_text=True).splitlines()
+        finally:
+            author.delete()
+
+        self.assertEqual(len(page["data"]), 3)
+        self.assertIsNone(page["next_cursor"])
+        self.assertEqual(len(streamed), 3)
+
+    def test_get_quotes_too_many_tags(self):
+        """Test for more tags than TAGS_QUERY_MAX_TAGS"""
+
+        tags = ",".join(f"tag-{i}" for i in range(TAGS_QUERY_MAX_TAGS + 1))
+        for param in ("tags", "exclude"):
+            response = self.client.get("/quotes/", query_string={param: tags})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("Error", response.get_json())
+
+    def test_get_quotes_invalid_tags_mode(self):
+        """Test for unknown tags mode"""
+
+        response = self.client.get("/quotes/?tags=code&mode=none")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Error", response.get_json())
+
+    def test_search_quotes(self):
+        """Test for full-text search of Quotes"""
+
+        response = self.client.get("/quotes/search/?q=code&limit=5")
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(response.get_json()["data"]), 5)
+
+    def test_search_quotes_without_query(self):
+        """Test for search without text"""
+
+        response = self.client.get("/quotes/search/")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Error", response.get_json())
+
+    def test_search_quotes_without_trailing_slash(self):
+        """Test /quotes/search is served by search, not redirected"""
+
+        response = self.client.get("/quotes/search")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Error", response.get_json())
+
     def test_create_quote(self):
         """Test for create Quote"""
 
@@ -0,0 +1,88 @@
+"""Scheduler Lease Tests"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from flask_apscheduler import APScheduler
+from app import create_app
+from database.models import SchedulerLease
+from services.scraper.scheduler import SchedulerLeader
+
+
+def add_job(scheduler: APScheduler) -> None:
+    """Adds a job, as init_scheduler_jobs does"""
+
+    scheduler.add_job(id="job", func=print, trigger="interval", minutes=5)
+
+
+class SchedulerLeaseTest(unittest.TestCase):
+    """Scheduler Lease Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.client = self.app.test_client()
+        SchedulerLease.drop_collection()
+        self.nodes = [
+            SchedulerLeader(APScheduler(), add_job, node=node) for node in ("a", "b")
+        ]
+
+    def tearDown(self):
+        SchedulerLease.drop_collection()
+
+    def job_ids(self, leader: SchedulerLeader) -> list:
+        """Returns ids of the scheduled jobs of a node"""
+
+        return [job.id for job in leader.scheduler.get_jobs()]
+
+    def test_single_leader_runs_the_jobs(self):
+        """Test only the first node takes the lease and adds the jobs"""
+
+        for _ in range(2):
+            for leader in self.nodes:
+                leader.renew()
+
+        self.assertTrue(self.nodes[0].is_leader)
+        self.assertFalse(self.nodes[1].is_leader)
+        self.assertEqual(self.job_ids(self.nodes[0]), ["job"])
+        self.assertEqual(self.job_ids(self.nodes[1]), [])
+
+    def test_expired_lease_fails_over(self):
+        """Test another node takes the lease once it expires"""
+
+        first, second = self.nodes
+        first.renew()
+        SchedulerLease.objects(name=SchedulerLeader.LEASE).update(
+            expiresOn=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+        second.renew()
+        first.renew()
+
+        self.assertTrue(second.is_leader)
+        self.assertFalse(first.is_leader)
+        self.assertEqual(self.job_ids(first), [])
+
+    def test_renewal_keeps_acquired_on(self):
+        """Test renewals extend the lease and keep the time it was taken"""
+
+        leader = self.nodes[0]
+        leader.renew()
+        acquired = SchedulerLease.objects.get(name=SchedulerLeader.LEASE)
+        leader.renew()
+        renewed = SchedulerLease.objects.get(name=SchedulerLeader.LEASE)
+
+        self.assertEqual(renewed.acquiredOn, acquired.acquiredOn)
+        self.assertGreaterEqual(renewed.expiresOn, acquired.expiresOn)
+        self.assertGreater(renewed.expiresOn, renewed.acquiredOn)
+
+    def test_scheduler_reports_lease_holder(self):
+        """Test /scheduler/lease/ reports the node holding the lease"""
+
+        self.nodes[1].renew()
+
+        response = self.client.get("/scheduler/lease/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["leader"], "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
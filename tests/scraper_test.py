@@ -0,0 +1,197 @@
+"""Scraped Data Tests"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+from pymongo.errors import BulkWriteError
+from app import create_app
+from database.models import Author, Quote, ScrapedAuthor
+from services.scraper.scraper import (
+    add_quotes_db,
+    scrape_authors,
+    update_authors_collection,
+)
+
+
+class UpdateAuthorsTest(unittest.TestCase):
+    """update_authors_collection Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.scraped = []
+
+    def tearDown(self):
+        names = {scraped.name for scraped in self.scraped}
+        Author.objects(name__in=list(names)).delete()
+        for scraped in self.scraped:
+            scraped.delete()
+
+    def scrape_author(self, name: str, link: str, country: str = "India") -> Quote:
+        """Saves a scraped author with a quote, as scrape_data does"""
+
+        scraped = ScrapedAuthor(
+            name=name,
+            link=link,
+            dob="2000-12-1",
+            country=country,
+            description="Testing....",
+        ).save()
+        self.scraped.append(scraped)
+        return Quote(quote=f"Quote of {link}", scrapedAuthor=scraped).save()
+
+    def author_of(self, quote: Quote) -> str:
+        """Returns name of the author the quote points to"""
+
+        quote.reload()
+        return quote.author.name if quote.author else None
+
+    def test_created_and_updated_authors(self):
+        """Test a batch updating an author and creating others points every
+        quote to the author of its name"""
+
+        Author(
+            name="Scraper Existing",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+        ).save()
+        quotes = {
+            name: self.scrape_author(name, f"/author/{i}", country="UK")
+            for i, name in enumerate(
+                ("Scraper Existing", "Scraper New A", "Scraper New B")
+            )
+        }
+
+        result = update_authors_collection()
+
+        self.assertGreaterEqual(result["created"], 2)
+        self.assertGreaterEqual(result["updated"], 1)
+        for name, quote in quotes.items():
+            self.assertEqual(self.author_of(quote), name)
+        self.assertEqual(Author.objects.get(name="Scraper Existing").country, "UK")
+
+    def test_scraped_authors_with_the_same_name(self):
+        """Test quotes of every scraped author sharing a name are re-pointed"""
+
+        quotes = [
+            self.scrape_author("Scraper Duplicate", f"/author/duplicate-{i}")
+            for i in range(2)
+        ]
+
+        update_authors_collection()
+
+        self.assertEqual(Author.objects(name="Scraper Duplicate").count(), 1)
+        for quote in quotes:
+            self.assertEqual(self.author_of(quote), "Scraper Duplicate")
+
+
+class ScrapeAuthorsTest(unittest.TestCase):
+    """scrape_authors Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.scraped = ScrapedAuthor(
+            name="Scraper Unchanged",
+            link="/author/unchanged",
+            dob="2000-12-1",
+            country="India",
+            description="Testing....",
+            updatedOn=datetime.utcnow() - timedelta(hours=20),
+        ).save()
+
+    def tearDown(self):
+        Author.objects(name="Scraper Unchanged").delete()
+        self.scraped.delete()
+
+    @mock.patch("services.scraper.scraper.fetch_authors")
+    def test_unchanged_authors_are_kept(self, fetch_authors):
+        """Test updatedOn of a scraped author with an unchanged page is
+        refreshed, so it does not expire while it is scraped"""
+
+        fetch_authors.side_effect = lambda authors, fingerprints: (
+            (link, None) for link in authors
+        )
+        task = SimpleNamespace(update_state=lambda **kwargs: None)
+
+        scrape_authors(task)
+
+        self.scraped.reload()
+        self.assertGreater(
+            self.scraped.updatedOn, datetime.utcnow() - timedelta(hours=1)
+        )
+
+
+class AddQuotesTest(unittest.TestCase):
+    """add_quotes_db Test Class"""
+
+    LINK = "/author/shared"
+
+    def setUp(self):
+        self.app = create_app("test")
+
+    def tearDown(self):
+        Quote.objects(quote__startswith="Shared author quote").delete()
+        ScrapedAuthor.objects(link=self.LINK).delete()
+
+    def scraped_quote(self, page: int) -> dict:
+        """Returns a scraped quote of the shared author, as a page yields it"""
+
+        return {
+            "quote": f"Shared author quote {page}",
+            "author": {"name": "Scraper Shared", "link": self.LINK},
+            "tags": ["shared"],
+        }
+
+    def assertOneScrapedAuthor(self):  # pylint: disable=C0103
+        """Fails unless the quotes of every page point to one scraped author"""
+
+        self.assertEqual(ScrapedAuthor.objects(link=self.LINK).count(), 1)
+        scraped = ScrapedAuthor.objects.get(link=self.LINK)
+        for quote in Quote.objects(quote__startswith="Shared author quote"):
+            self.assertEqual(quote.scrapedAuthor.id, scraped.id)
+
+    def test_page_tasks_sharing_an_author(self):
+        """Test page tasks running at the same time create the author once"""
+
+        barrier = threading.Barrier(2)
+
+        def scrape_page(page):
+            barrier.wait()
+            add_quotes_db([self.scraped_quote(page)])
+
+        threads = [threading.Thread(target=scrape_page, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            Quote.objects(quote__startswith="Shared author quote").count(), 2
+        )
+        self.assertOneScrapedAuthor()
+
+    def test_author_inserted_by_another_task(self):
+        """Test the upsert of an author inserted meanwhile is retried"""
+
+        collection_class = type(ScrapedAuthor._get_collection())
+        bulk_write = collection_class.bulk_write
+        calls = []
+
+        def insert_meanwhile(collection, ops, **kwargs):
+            calls.append(collection.name)
+            if len(calls) == 1:
+                ScrapedAuthor(name="Scraper Shared", link=self.LINK).save()
+                raise BulkWriteError({"writeErrors": [{"code": 11000}]})
+            return bulk_write(collection, ops, **kwargs)
+
+        with mock.patch.object(collection_class, "bulk_write", insert_meanwhile):
+            add_quotes_db([self.scraped_quote(0)])
+
+        self.assertEqual(calls[:2], ["scrapedAuthors", "scrapedAuthors"])
+        self.assertOneScrapedAuthor()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Statistics Tests"""
+
+import unittest
+from bson import ObjectId
+from app import create_app
+from database.models import Author, Stats, TagStat, AuthorStat
+from services.stats.counters import StatsDelta
+from services.stats.reconcile import reconcile_stats
+
+
+class StatsDeltaTest(unittest.TestCase):
+    """Stats Delta Test Class"""
+
+    def test_quote_changes_are_counted(self):
+        """Test counters of an added and a removed Quote"""
+
+        author = ObjectId()
+        stats = StatsDelta()
+        stats.add_quote(author, ["love", "life", "love"])
+        stats.remove_quote(author, ["life"])
+        stats.add_quote(None, ["love"])
+
+        self.assertEqual(stats.quotes, 0)
+        self.assertEqual(stats.author_quotes[author], 0)
+        self.assertEqual(stats.tag_quotes[("love", None)], 1)
+        self.assertEqual(stats.tag_quotes[("love", author)], 1)
+        self.assertEqual(stats.tag_quotes[("life", None)], 0)
+
+
+class StatsTest(unittest.TestCase):
+    """Materialized Statistics Test Class"""
+
+    TAG = "stats-test-tag"
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.client = self.app.test_client()
+        reconcile_stats()
+
+    def tag_count(self, author=None) -> int:
+        """Returns the counter of the test tag, overall or of an author"""
+
+        stat = TagStat.objects(tag=self.TAG, author=author).first()
+        return stat.count if stat else 0
+
+    def test_author_delete_removes_its_quotes(self):
+        """Test deleting an Author decrements the counters of its Quotes"""
+
+        before = Stats.objects.get(key="global")
+        response = self.client.post(
+            "/authors/",
+            json={
+                "name": "Stats Author",
+                "dob": "2000-12-1",
+                "country": "India",
+                "description": "Testing....",
+            },
+        )
+        author_id = response.get_json()["_id"]
+        for i in range(2):
+            self.client.post(
+                "/quotes/",
+                json={
+                    "quote": f"Stats quote {i}",
+                    "author": author_id,
+                    "tags": [self.TAG],
+                },
+            )
+
+        added = Stats.objects.get(key="global")
+        self.assertEqual(added.totalQuotes, before.totalQuotes + 2)
+        self.assertEqual(added.totalAuthors, before.totalAuthors + 1)
+        self.assertEqual(self.tag_count(), 2)
+        self.assertEqual(self.tag_count(ObjectId(author_id)), 2)
+
+        response = self.client.delete(f"/authors/{author_id}/")
+
+        deleted = Stats.objects.get(key="global")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(deleted.totalQuotes, before.totalQuotes)
+        self.assertEqual(deleted.totalAuthors, before.totalAuthors)
+        self.assertEqual(self.tag_count(), 0)
+        self.assertEqual(AuthorStat.objects.get(author=author_id).count, 0)
+
+    def test_reconcile_fixes_drift(self):
+        """Test reconcile_stats overwrites drifted counters"""
+
+        expected = Stats.objects.get(key="global")
+        Stats.objects(key="global").update_one(inc__totalQuotes=5, inc__totalAuthors=-1)
+        TagStat(tag=self.TAG, author=None, count=3).save()
+        AuthorStat(author=ObjectId(), count=7).save()
+
+        reconcile_stats()
+
+        stats = Stats.objects.get(key="global")
+        self.assertEqual(stats.totalQuotes, expected.totalQuotes)
+        self.assertEqual(stats.totalAuthors, expected.totalAuthors)
+        self.assertEqual(self.tag_count(), 0)
+        self.assertEqual(AuthorStat.objects(count=7).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
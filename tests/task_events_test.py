@@ -0,0 +1,140 @@
+"""Task Events Tests"""
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+import fakeredis
+from app import create_app
+from resources.scrape import iter_task_events
+from utils.task_events import TaskEvents, task_events
+
+
+def task_results(*results: tuple) -> mock.Mock:
+    """Returns a replacement of AsyncResult reading the given (state, info)
+    one per call, the last one is repeated"""
+
+    results = list(results)
+
+    def read(task_id):  # pylint: disable=W0613
+        state, info = results.pop(0) if len(results) > 1 else results[0]
+        return SimpleNamespace(status=state, result=info)
+
+    return mock.Mock(side_effect=read)
+
+
+class TaskEventsTest(unittest.TestCase):
+    """Task Events pub/sub Test Class"""
+
+    def setUp(self):
+        self.events = TaskEvents()
+        self.events.client = fakeredis.FakeRedis()
+
+    def test_published_event_is_received(self):
+        """Test a subscriber receives the state and info of a task"""
+
+        pubsub = self.events.subscribe("task")
+        self.events.publish("task", "IN_PROGRESS", {"fetched_records": 10})
+
+        event = TaskEvents.wait(pubsub, 1)
+
+        self.assertEqual(event, ("IN_PROGRESS", {"fetched_records": 10}))
+        self.assertIsNone(TaskEvents.wait(pubsub, 0.1))
+
+    def test_events_of_other_tasks_are_ignored(self):
+        """Test a subscriber only receives events of its tasks"""
+
+        pubsub = self.events.subscribe("task")
+        self.events.publish("other", "SUCCESS", {})
+
+        self.assertIsNone(TaskEvents.wait(pubsub, 0.1))
+
+    def test_publish_without_redis(self):
+        """Test publishing is a no-op without TASK_EVENTS_URI"""
+
+        self.events.client = None
+
+        self.events.publish("task", "SUCCESS", {})
+        self.assertFalse(self.events.enabled)
+
+
+class TaskEventsStreamTest(unittest.TestCase):
+    """Scrape Events stream Test Class"""
+
+    def setUp(self):
+        self.app = create_app("test")
+        self.client = self.app.test_client()
+        task_events.client = fakeredis.FakeRedis()
+
+    def tearDown(self):
+        task_events.client = None
+
+    @mock.patch("resources.scrape.AsyncResult")
+    def test_stream_follows_published_events(self, async_result):
+        """Test every published status is streamed until the task completes"""
+
+        async_result.side_effect = task_results(("IN_PROGRESS", {}))
+        events = iter_task_events("task")
+
+        first = next(events)
+        task_events.publish("task", "IN_PROGRESS", {"fetched_records": 10})
+        task_events.publish("task", "SUCCESS", {"quotes": {}})
+
+        self.assertEqual(first, {"task_status": "IN_PROGRESS"})
+        self.assertEqual(
+            list(events),
+            [
+                {"task_status": "IN_PROGRESS", "fetched_records": 10},
+                {"task_status": "SUCCESS", "quotes": {}},
+            ],
+        )
+
+    @mock.patch("resources.scrape.TASK_EVENTS_POLL_INTERVAL", 0)
+    @mock.patch("resources.scrape.AsyncResult")
+    def test_stream_polls_without_redis(self, async_result):
+        """Test the result backend is read when events are not published"""
+
+        task_events.client = None
+        async_result.side_effect = task_results(
+            ("IN_PROGRESS", {}), ("IN_PROGRESS", {}), ("SUCCESS", {"quotes": {}})
+        )
+
+        self.assertEqual(
+            list(iter_task_events("task")),
+            [{"task_status": "IN_PROGRESS"}, {"task_status": "SUCCESS", "quotes": {}}],
+        )
+
+    @mock.patch("resources.scrape.TASK_EVENTS_MAX_DURATION", 0.2)
+    @mock.patch("resources.scrape.TASK_EVENTS_KEEPALIVE", 0.05)
+    @mock.patch("resources.scrape.AsyncResult")
+    def test_stream_ends_after_max_duration(self, async_result):
+        """Test a stream of a task that never completes ends"""
+
+        async_result.side_effect = task_results(("IN_PROGRESS", {}))
+
+        events = list(iter_task_events("task"))
+
+        self.assertEqual(events[0], {"task_status": "IN_PROGRESS"})
+        self.assertTrue(events[1:])
+        self.assertTrue(all(event is None for event in events[1:]))
+
+    @mock.patch("resources.scrape.AsyncResult")
+    def test_events_endpoint(self, async_result):
+        """Test the status is sent as a Server-Sent Event"""
+
+        async_result.side_effect = task_results(("SUCCESS", {"quotes": {}}))
+
+        response = self.client.get("/scrape/tasks/task/events/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/event-stream")
+        event = response.get_data(as_text=True)
+        self.assertTrue(event.startswith("data: "))
+        self.assertEqual(
+            json.loads(event[len("data: ") :]),
+            {"task_status": "SUCCESS", "quotes": {}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
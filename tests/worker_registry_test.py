@@ -0,0 +1,94 @@
+"""Worker Registry Tests"""
+
+import time
+import unittest
+from types import SimpleNamespace
+from fnmatch import fnmatch
+from utils.worker_registry import WorkerRegistry
+
+
+class FakeRedis:
+    """Keeps the keys in a dict, expiry is not simulated"""
+
+    def __init__(self):
+        self.data = {}
+        self.reads = 0
+
+    def set(self, key, value, ex=None):  # pylint: disable=W0613
+        self.data[key] = value.encode()
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        self.reads += 1
+        return [key for key in self.data if fnmatch(key, match)]
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+
+class WorkerRegistryTest(unittest.TestCase):
+    """Worker Registry Test Class"""
+
+    def setUp(self):
+        self.pings = 0
+
+        def ping(timeout):  # pylint: disable=W0613
+            self.pings += 1
+            return [{"celery@pinged": {"ok": "pong"}}]
+
+        self.registry = WorkerRegistry()
+        self.registry.celery = SimpleNamespace(
+            conf=SimpleNamespace(task_default_queue="celery"),
+            control=SimpleNamespace(ping=ping),
+        )
+        self.registry.client = FakeRedis()
+
+    def test_registered_workers_are_listed(self):
+        """Test a registered worker is live and counted on its queue"""
+
+        self.registry.register("celery@one", ["celery"])
+        worker_registry = WorkerRegistry()
+        worker_registry.celery, worker_registry.client = (
+            self.registry.celery,
+            self.registry.client,
+        )
+        worker_registry.register("celery@two", ["other"])
+
+        hostnames = {worker["hostname"] for worker in self.registry.workers()}
+        self.assertEqual(hostnames, {"celery@one", "celery@two"})
+        self.assertEqual(len(self.registry.scraping_workers()), 1)
+        self.assertEqual(self.pings, 0)
+
+    def test_registry_is_cached(self):
+        """Test Redis is read once per cache TTL, not on every check"""
+
+        self.registry.register("celery@one", ["celery"])
+        for _ in range(100):
+            self.registry.scraping_workers()
+
+        self.assertEqual(self.registry.client.reads, 1)
+
+    def test_unregistered_worker_is_removed(self):
+        """Test a stopped worker is no more live once the cache expires"""
+
+        self.registry.register("celery@one", ["celery"])
+        self.registry.unregister()
+        self.registry.cached_at = time.monotonic() - 60
+
+        self.assertEqual(self.registry.workers(), [])
+
+    def test_workers_are_pinged_without_redis(self):
+        """Test the workers are pinged without a registry"""
+
+        self.registry.client = None
+
+        workers = self.registry.scraping_workers()
+
+        self.assertEqual([worker["hostname"] for worker in workers], ["celery@pinged"])
+        self.assertEqual(self.pings, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
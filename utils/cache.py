@@ -0,0 +1,250 @@
+"""Redis backed cache and conditional GETs for responses of the read endpoints"""
+
+import time
+import uuid
+import hashlib
+import logging
+from typing import Callable, Iterable, Union
+from functools import wraps
+from urllib.parse import urlencode
+import redis
+from flask import Flask, Response, request
+from utils.streaming import wants_stream
+from constants.app_constants import (
+    CACHE_TIMEOUT,
+    CACHE_MAX_ENTRIES,
+    CACHE_VERSION_TIMEOUT,
+)
+
+logger = logging.getLogger("app")
+
+
+class ResponseCache:
+    """Caches GET responses, entries are invalidated by the tags they depend on
+
+    Tags name a collection ("quotes"), a single document ("quote:<id>") or
+    the quotes having a tag ("tag:<tag>"). Write paths invalidate the tags
+    they change, so only the affected entries are removed and the versions
+    of the tags are replaced.
+
+    The ETag of a response is derived from the versions of its tags, so a
+    matching If-None-Match is answered with 304 without running the query,
+    even once the stored response expired. A version
+    is a random token that expires CACHE_VERSION_TIMEOUT seconds after the
+    last write, a tag read after that gets a new one, so an old ETag never
+    matches again.
+    """
+
+    PREFIX = "cache:"
+    INDEX = "cache:index"
+    VERSION = "cache:version:"
+    COUNTERS = "cache:counters"
+
+    def __init__(self):
+        self.client = None
+
+    def init_app(self, app: Flask) -> None:
+        """Connect to Redis, caching is disabled without CACHE_STORAGE_URI"""
+
+        uri = app.config.get("CACHE_STORAGE_URI")
+        self.client = redis.Redis.from_url(uri) if uri else None
+
+    @property
+    def enabled(self) -> bool:
+        """True if responses are cached"""
+
+        return self.client is not None
+
+    @staticmethod
+    def make_key() -> str:
+        """Returns cache key of the current request, the route and sorted args"""
+
+        args = urlencode(sorted(request.args.items(multi=True)))
+        return f"{ResponseCache.PREFIX}response:{request.path}?{args}"
+
+    @staticmethod
+    def make_etag(key: str, versions: list) -> str:
+        """Returns ETag of a response from its key and versions of its tags"""
+
+        versions = ",".join(
+            version.decode() if version else "0" for version in versions
+        )
+        return hashlib.sha1(f"{key}|{versions}".encode()).hexdigest()
+
+    def init_versions(self, tags: list, versions: list) -> list:
+        """Sets a new version for the tags without one
+
+        Returns:
+            list: versions of the tags, the ones set by another request first
+                are kept
+        """
+        if all(versions):
+            return versions
+
+        keys = [f"{self.VERSION}{tag}" for tag in tags]
+        pipe = self.client.pipeline()
+        for key, version in zip(keys, versions):
+            if not version:
+                pipe.set(key, uuid.uuid4().hex, nx=True, ex=CACHE_VERSION_TIMEOUT)
+        pipe.mget(keys)
+        return pipe.execute()[-1]
+
+    def cached(self, tags: Union[list, Callable[..., list]]) -> Callable:
+        """Decorator that serves a GET endpoint from the cache
+
+        Args:
+            tags (list | Callable): tags of the response, or a function that
+                returns them from the url params of the endpoint
+        """
+
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def decorated_function(*args, **kwargs):
+                if not self.enabled or wants_stream():
+                    return func(*args, **kwargs)
+
+                key = self.make_key()
+                resource_tags = tags(**kwargs) if callable(tags) else tags
+                try:
+                    pipe = self.client.pipeline()
+                    pipe.mget([f"{self.VERSION}{tag}" for tag in resource_tags])
+                    pipe.hgetall(key)
+                    versions, entry = pipe.execute()
+                    versions = self.init_versions(resource_tags, versions)
+                except redis.RedisError as exp_err:
+                    logger.warning(f"Cache - {str(exp_err)}")
+                    return func(*args, **kwargs)
+
+                # Versions are read before the query, a write that happens
+                # meanwhile bumps them and the stored entry will not match.
+                etag = self.make_etag(key, versions)
+                # ETags are only sent with 200 responses and outlive the stored
+                # entry, "*" would match responses that were never sent
+                if_none_match = request.if_none_match
+                if not if_none_match.star_tag and if_none_match.contains(etag):
+                    self.count("not_modified")
+                    response = Response(status=304)
+                # entries of an older format have no ETag and are refreshed
+                elif entry.get(b"etag", b"").decode() == etag:
+                    self.count("hits")
+                    response = Response(
+                        entry[b"body"],
+                        status=int(entry[b"status"]),
+                        mimetype=entry[b"mimetype"].decode(),
+                    )
+                else:
+                    self.count("misses")
+                    response = func(*args, **kwargs)
+                    if response.status_code != 200 or response.is_streamed:
+                        return response
+                    self.set(key, response, resource_tags, etag)
+
+                response.set_etag(etag)
+                return response
+
+            return decorated_function
+
+        return decorator
+
+    def count(self, counter: str) -> None:
+        """Increments a hit/miss counter"""
+
+        try:
+            self.client.hincrby(self.COUNTERS, counter)
+        except redis.RedisError as exp_err:
+            logger.warning(f"Cache - {str(exp_err)}")
+
+    def set(self, key: str, response: Response, tags: list, etag: str) -> None:
+        """Stores the response and registers it under its tags
+
+        The oldest entries are evicted above CACHE_MAX_ENTRIES.
+        """
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(
+                key,
+                mapping={
+                    "body": response.get_data(),
+                    "status": response.status_code,
+                    "mimetype": response.mimetype,
+                    "etag": etag,
+                },
+            )
+            pipe.expire(key, CACHE_TIMEOUT)
+            for tag in tags:
+                pipe.sadd(f"{self.PREFIX}tag:{tag}", key)
+                pipe.expire(f"{self.PREFIX}tag:{tag}", CACHE_TIMEOUT)
+            pipe.zadd(self.INDEX, {key: time.time()})
+            pipe.zcard(self.INDEX)
+            size = pipe.execute()[-1]
+
+            if size > CACHE_MAX_ENTRIES:
+                evicted = self.client.zpopmin(self.INDEX, size - CACHE_MAX_ENTRIES)
+                self.client.delete(*[evicted_key for evicted_key, _ in evicted])
+        except redis.RedisError as exp_err:
+            logger.warning(f"Cache - {str(exp_err)}")
+
+    def invalidate(self, *tags: str) -> None:
+        """Replaces versions of the tags and removes all the entries registered
+        under any of them"""
+
+        if not self.enabled or not tags:
+            return
+
+        tags = list(dict.fromkeys(tags))
+        tag_keys = [f"{self.PREFIX}tag:{tag}" for tag in tags]
+        try:
+            pipe = self.client.pipeline()
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            keys = set().union(*pipe.execute())
+
+            pipe = self.client.pipeline()
+            for tag in tags:
+                pipe.set(
+                    f"{self.VERSION}{tag}", uuid.uuid4().hex, ex=CACHE_VERSION_TIMEOUT
+                )
+            if keys:
+                pipe.delete(*keys)
+                pipe.zrem(self.INDEX, *keys)
+            pipe.delete(*tag_keys)
+            pipe.execute()
+        except redis.RedisError as exp_err:
+            logger.warning(f"Cache - {str(exp_err)}")
+
+    def stats(self) -> dict:
+        """Returns hit and miss counters and no. of cached entries"""
+
+        if not self.enabled:
+            return {"enabled": False}
+
+        pipe = self.client.pipeline()
+        pipe.hgetall(self.COUNTERS)
+        pipe.zcard(self.INDEX)
+        counters, entries = pipe.execute()
+
+        hits, misses = int(counters.get(b"hits", 0)), int(counters.get(b"misses", 0))
+        return {
+            "enabled": True,
+            "hits": hits,
+            "misses": misses,
+            "not_modified": int(counters.get(b"not_modified", 0)),
+            "hit_ratio": hits / (hits + misses) if hits + misses else None,
+            "entries": entries,
+        }
+
+
+def quote_list_tags(tags: Iterable) -> list:
+    """Returns the cache tags of the Quote lists a quote with the tags is in,
+    the unfiltered lists and the lists filtered by one of the tags"""
+
+    return ["quotes", *(f"tag:{tag}" for tag in tags or [])]
+
+
+cache = ResponseCache()
+
+
+def init_cache(app: Flask) -> None:
+    """Initialize Response Cache"""
+
+    cache.init_app(app)
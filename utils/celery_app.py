@@ -3,8 +3,16 @@
 from typing import Callable
 from functools import wraps
 from flask import Flask
-from celery import Celery, Task, current_app
-from celery.signals import after_task_publish
+from celery import Celery, Task, current_app, states
+from celery.signals import (
+    after_task_publish,
+    heartbeat_sent,
+    task_postrun,
+    worker_ready,
+    worker_shutdown,
+)
+from utils.worker_registry import worker_registry
+from utils.task_events import task_events
 
 
 def init_celery(app: Flask) -> Celery:
@@ -17,6 +25,12 @@ def init_celery(app: Flask) -> Celery:
             with app.app_context():
                 return self.run(*args, **kwargs)
 
+        def update_state(self, task_id=None, state=None, meta=None, **kwargs):
+            """Stores the state and publishes it to the subscribers"""
+
+            super().update_state(task_id, state, meta, **kwargs)
+            task_events.publish(task_id or self.request.id, state, meta)
+
     celery_app = Celery(app.name, task_cls=FlaskTask)
     celery_app.config_from_object(app.config["CELERY"])
     app.extensions["celery"] = celery_app
@@ -35,13 +49,52 @@ def update_sent_state(sender=None, headers=None, **kwargs):  # pylint: disable=W
     backend.store_result(task_id=headers["id"], result=None, state="IN_PROGRESS")
 
 
+@task_postrun.connect
+def publish_task_result(
+    task_id=None, task=None, retval=None, state=None, **kwargs
+):  # pylint: disable=W0613
+    """Publishes the result of a task, it is stored by then
+
+    Tasks of a group also notify the group, e.g. pages of a distributed crawl.
+    """
+    # a task raising Ignore published its state with update_state
+    if state == states.IGNORED:
+        return
+
+    task_events.publish(task_id, state, retval if state == states.SUCCESS else None)
+    if task.request.group:
+        task_events.publish(task.request.group, state)
+
+
+@worker_ready.connect
+def register_worker(sender=None, **kwargs):  # pylint: disable=W0613
+    """Adds the worker to the registry once it consumes its queues"""
+
+    queues = [queue.name for queue in sender.task_consumer.queues]
+    worker_registry.register(sender.hostname, queues)
+
+
+@heartbeat_sent.connect
+def refresh_worker(sender=None, **kwargs):  # pylint: disable=W0613
+    """Keeps the worker alive in the registry, on every heartbeat"""
+
+    worker_registry.register()
+
+
+@worker_shutdown.connect
+def unregister_worker(sender=None, **kwargs):  # pylint: disable=W0613
+    """Removes the worker from the registry"""
+
+    worker_registry.unregister()
+
+
 def check_celery_available(func: Callable) -> Callable:
-    """This decorator checks if the celery worker is running"""
+    """This decorator checks if a celery worker consumes the scraping queue,
+    from the cached worker registry"""
 
     @wraps(func)
     def decorated_function(*args, **kwargs):
-        workers = current_app.control.ping(timeout=1)
-        if workers == []:
+        if not worker_registry.scraping_workers():
             response, status = {"message": "Celery worker is not running!"}, 500
             return response, status
 
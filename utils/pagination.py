@@ -0,0 +1,121 @@
+"""Utility for keyset (cursor) pagination of list endpoints"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from dataclasses import dataclass
+from typing import Callable, Optional
+from bson import ObjectId
+from flask import request
+from constants.app_constants import PAGINATION_DEFAULT_LIMIT, PAGINATION_MAX_LIMIT
+
+
+class InvalidPageArgs(ValueError):
+    """Raised when the limit or cursor of a request can not be parsed"""
+
+
+def encode_cursor(key: dict) -> str:
+    """Encodes the sort key of the last returned document to an opaque cursor
+
+    Args:
+        key (dict): sort key of the document, e.g. {"id": "63bfb6..."}
+
+    Returns:
+        str: url safe cursor
+    """
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decodes a cursor created by encode_cursor
+
+    Args:
+        cursor (str): opaque cursor received from the client
+
+    Raises:
+        InvalidPageArgs: if the cursor is malformed
+
+    Returns:
+        dict: sort key with "id" converted to ObjectId
+    """
+    try:
+        key = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (BinasciiError, UnicodeDecodeError, ValueError) as exp_err:
+        raise InvalidPageArgs("Invalid cursor") from exp_err
+
+    if not isinstance(key, dict) or not ObjectId.is_valid(key.get("id")):
+        raise InvalidPageArgs("Invalid cursor")
+
+    key["id"] = ObjectId(key["id"])
+    return key
+
+
+@dataclass
+class Page:
+    """Requested page: number of documents and the key to start after"""
+
+    limit: Optional[int] = PAGINATION_DEFAULT_LIMIT
+    after: Optional[dict] = None
+
+    @property
+    def fetch_limit(self) -> Optional[int]:
+        """No. of documents to query, one extra to detect the next page"""
+
+        return self.limit + 1 if self.limit else None
+
+    def paginate(self, docs: list, key: Callable[[dict], dict]) -> tuple:
+        """Trims the extra document fetched to detect the next page
+
+        Queries are expected to fetch `limit + 1` documents.
+
+        Args:
+            docs (list): list of json documents
+            key (Callable): returns the sort key of a document
+
+        Returns:
+            tuple: documents of this page and cursor of the next page (or None)
+        """
+        if self.limit is None or len(docs) <= self.limit:
+            return docs, None
+
+        docs = docs[: self.limit]
+        return docs, encode_cursor(key(docs[-1]))
+
+
+def get_page_args(
+    cursor_keys: tuple = (), default_limit: Optional[int] = PAGINATION_DEFAULT_LIMIT
+) -> Page:
+    """Reads `limit` and `after` from the request query string
+
+    Args:
+        cursor_keys (tuple): keys the cursor must contain besides "id"
+        default_limit (int): limit when not requested, None for no limit
+
+    Raises:
+        InvalidPageArgs: if limit is not a positive integer or cursor is invalid
+
+    Returns:
+        Page: requested page
+    """
+    limit = request.args.get("limit")
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError as exp_err:
+            raise InvalidPageArgs("limit must be an integer") from exp_err
+
+        if limit < 1:
+            raise InvalidPageArgs("limit must be greater than 0")
+
+        limit = min(limit, PAGINATION_MAX_LIMIT)
+    else:
+        limit = default_limit
+
+    after = request.args.get("after")
+    if after is not None:
+        after = decode_cursor(after)
+        if any(key not in after for key in cursor_keys):
+            raise InvalidPageArgs("Invalid cursor")
+
+    return Page(limit=limit, after=after)
@@ -0,0 +1,70 @@
+"""Utility for streaming list endpoints as newline delimited JSON,
+and task progress as Server-Sent Events"""
+
+from itertools import islice
+from typing import Iterable, Optional
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+SSE_MIMETYPE = "text/event-stream"
+
+
+def wants_stream() -> bool:
+    """Checks if the client asked for a streaming response
+
+    Streaming is selected with `?stream=1` or `Accept: application/x-ndjson`.
+
+    Returns:
+        bool: True if the response should be streamed
+    """
+    if request.args.get("stream") == "1":
+        return True
+
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def stream_json_lines(docs: Iterable[dict], limit: Optional[int] = None) -> Response:
+    """Streams documents as newline delimited JSON
+
+    Every document is serialized and written as soon as it is read from
+    the cursor, so memory does not grow with the size of the result.
+
+    Args:
+        docs (Iterable): json documents, usually a generator over a cursor
+        limit (int): max no. of documents to write
+
+    Returns:
+        Response: chunked response of `application/x-ndjson` type
+    """
+
+    def generate():
+        for doc in islice(docs, limit):
+            yield current_app.json.dumps(doc) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def stream_events(events: Iterable[Optional[dict]]) -> Response:
+    """Streams events as Server-Sent Events
+
+    Args:
+        events (Iterable): json events, None is sent as a keep-alive comment
+
+    Returns:
+        Response: chunked response of `text/event-stream` type
+    """
+
+    def generate():
+        for event in events:
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {current_app.json.dumps(event)}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=SSE_MIMETYPE,
+        # proxies must not buffer nor cache the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,87 @@
+"""Utility for the tags filter of the Quotes list: any / all / exclude"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+from flask import request
+from constants.app_constants import TAGS_QUERY_MAX_TAGS
+
+
+class InvalidTagQuery(ValueError):
+    """Raised when the tags, mode or exclude params of a request are invalid"""
+
+
+def split_tags(tags: Optional[str]) -> list:
+    """Splits comma separated tags, drops blanks and duplicates keeping order"""
+
+    if tags is None:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags.split(",") if tag.strip()))
+
+
+@dataclass
+class TagQuery:
+    """Requested tags filter
+
+    mode "any" matches quotes having at least one of the tags (OR),
+    "all" matches quotes having every tag (AND), excluded tags are
+    never matched (NOT).
+    """
+
+    MODES = ("any", "all")
+
+    tags: list = field(default_factory=list)
+    mode: str = "any"
+    exclude: list = field(default_factory=list)
+
+    @property
+    def ranked(self) -> bool:
+        """True if quotes match different no. of tags and are ranked by it"""
+
+        return self.mode == "any" and len(self.tags) > 1
+
+    def to_filter(self) -> dict:
+        """Returns the index friendly filter matching all the candidates"""
+
+        condition = {}
+        if self.tags:
+            condition["$all" if self.mode == "all" else "$in"] = self.tags
+        if self.exclude:
+            condition["$nin"] = self.exclude
+
+        return {"tags": condition} if condition else {}
+
+    def to_matched_count(self) -> dict:
+        """Returns the expression of the no. of tags a quote matches"""
+
+        return {"$size": {"$setIntersection": [self.tags, "$tags"]}}
+
+
+def get_tag_query_args() -> Optional[TagQuery]:
+    """Reads `tags`, `mode` and `exclude` from the request query string
+
+    Raises:
+        InvalidTagQuery: if mode is unknown, tags param has no tag or
+            tags or exclude has too many tags
+
+    Returns:
+        TagQuery: requested filter, None if neither tags nor exclude is given
+    """
+    tags = request.args.get("tags")
+    mode = request.args.get("mode", "any")
+    exclude = split_tags(request.args.get("exclude"))
+
+    if mode not in TagQuery.MODES:
+        raise InvalidTagQuery(f"mode must be one of {', '.join(TagQuery.MODES)}")
+
+    if tags is not None and not split_tags(tags):
+        raise InvalidTagQuery("tags must not be empty")
+
+    if max(len(split_tags(tags)), len(exclude)) > TAGS_QUERY_MAX_TAGS:
+        raise InvalidTagQuery(
+            f"tags and exclude must have at most {TAGS_QUERY_MAX_TAGS} tags each"
+        )
+
+    if tags is None and not exclude:
+        return None
+
+    return TagQuery(tags=split_tags(tags), mode=mode, exclude=exclude)
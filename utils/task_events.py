@@ -0,0 +1,91 @@
+"""Progress of the Celery tasks, published through Redis pub/sub"""
+
+import json
+import time
+import logging
+from typing import Optional
+import redis
+from redis.client import PubSub
+from flask import Flask
+
+logger = logging.getLogger("app")
+
+
+class TaskEvents:
+    """Publishes every state update and the result of a task on its channel
+
+    Tasks of a group also notify the channel of the group, so a subscriber
+    learns about the progress of a distributed crawl without polling the
+    result backend. Publishing is disabled without TASK_EVENTS_URI.
+    """
+
+    PREFIX = "task-events:"
+
+    def __init__(self):
+        self.client = None
+
+    def init_app(self, app: Flask) -> None:
+        """Connect to Redis, events are not published without TASK_EVENTS_URI"""
+
+        uri = app.config.get("TASK_EVENTS_URI")
+        self.client = redis.Redis.from_url(uri) if uri else None
+
+    @property
+    def enabled(self) -> bool:
+        """True if task events are published"""
+
+        return self.client is not None
+
+    def publish(self, task_id: str, state: str, info: object = None) -> None:
+        """Publishes the state of a task, errors are only logged
+
+        Args:
+            task_id (str): id of the task, or of its group
+            state (str): state of the task
+            info (object): progress meta or result of the task
+        """
+        if not self.enabled:
+            return
+
+        event = json.dumps({"state": state, "info": info}, default=str)
+        try:
+            self.client.publish(self.PREFIX + task_id, event)
+        except redis.RedisError as exp_err:
+            logger.warning(f"Task Events - {str(exp_err)}")
+
+    def subscribe(self, *task_ids: str, pubsub: Optional[PubSub] = None) -> PubSub:
+        """Returns a subscription to the events of the tasks
+
+        Args:
+            task_ids (str): ids of the tasks, or of their groups
+            pubsub (PubSub): subscription to extend, a new one by default
+        """
+        pubsub = pubsub or self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(*(self.PREFIX + task_id for task_id in task_ids))
+        return pubsub
+
+    @staticmethod
+    def wait(pubsub: PubSub, timeout: float) -> Optional[tuple]:
+        """Waits for the next event of the subscription
+
+        Returns:
+            tuple: state and info of the event, None if nothing was published
+                within timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            message = pubsub.get_message(timeout=remaining)
+            if message:
+                event = json.loads(message["data"])
+                return event["state"], event["info"]
+
+        return None
+
+
+task_events = TaskEvents()
+
+
+def init_task_events(app: Flask) -> None:
+    """Initialize Task Events"""
+
+    task_events.init_app(app)
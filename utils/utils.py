@@ -1,9 +1,11 @@
 """Utility for json conversion and selenium setup"""
 
 import datetime
+from typing import Iterator
 from selenium import webdriver
 from flask_mongoengine import BaseQuerySet
 from pymongo.command_cursor import CommandCursor
+from database.models import Author
 
 
 def cursor_to_json(data: BaseQuerySet) -> list:
@@ -19,6 +21,67 @@ def cursor_to_json(data: BaseQuerySet) -> list:
     return data
 
 
+def quotes_to_json(quotes: list) -> list:
+    """converts raw quote documents to list of json objects
+
+    Authors of all the quotes are fetched with a single query,
+    instead of dereferencing the author of every quote.
+
+    Args:
+        quotes (list): quote documents read with as_pymongo()
+
+    Returns:
+        list: list of json objects
+    """
+    author_ids = {quote["author"] for quote in quotes if quote.get("author")}
+    authors = {
+        author["_id"]: author["name"]
+        for author in Author.objects(id__in=author_ids).only("name").as_pymongo()
+    }
+
+    for quote in quotes:
+        quote["_id"] = str(quote["_id"])
+        if quote.get("author"):
+            quote["author"] = {
+                "name": authors.get(quote["author"]),
+                "id": str(quote["author"]),
+            }
+
+    return quotes
+
+
+def quote_cursor_to_json(data: BaseQuerySet) -> list:
+    """converts quotes cursor to list of json objects
+
+    Args:
+        data (cursor): mongo cursor of quotes
+
+    Returns:
+        list: list of json objects
+    """
+    return quotes_to_json(list(data.as_pymongo()))
+
+
+def iter_quote_cursor_json(data: BaseQuerySet, batch_size: int) -> Iterator[dict]:
+    """lazily converts quotes cursor to json objects, one batch at a time
+
+    Args:
+        data (cursor): mongo cursor of quotes
+        batch_size (int): no. of quotes read (and authors resolved) at a time
+
+    Yields:
+        dict: json object of a quote
+    """
+    batch = []
+    for quote in data.batch_size(batch_size).as_pymongo():
+        batch.append(quote)
+        if len(batch) == batch_size:
+            yield from quotes_to_json(batch)
+            batch = []
+
+    yield from quotes_to_json(batch)
+
+
 def get_date(date: str) -> datetime.datetime:
     """convert to datetime object
 
@@ -31,23 +94,31 @@ def get_date(date: str) -> datetime.datetime:
     return datetime.datetime.strptime(date, "%B %d, %Y")
 
 
-def quote_aggregate_to_json(cursor: CommandCursor) -> list:
-    """converts quotes aggregation result to json
+def iter_quote_aggregate_json(cursor: CommandCursor) -> Iterator[dict]:
+    """lazily converts quotes aggregation result to json
 
     Args:
         cursor: mongoengine aggregation result cursor
 
-    Returns:
-        list: list of dictionary
+    Yields:
+        dict: json object of a quote
     """
-    quotes = []
-
     for doc in cursor:
         doc["_id"] = str(doc["_id"])
         doc["author"]["_id"] = str(doc["author"]["_id"])
-        quotes.append(doc)
+        yield doc
 
-    return quotes
+
+def quote_aggregate_to_json(cursor: CommandCursor) -> list:
+    """converts quotes aggregation result to json
+
+    Args:
+        cursor: mongoengine aggregation result cursor
+
+    Returns:
+        list: list of dictionary
+    """
+    return list(iter_quote_aggregate_json(cursor))
 
 
 def init_driver() -> webdriver.Chrome:
@@ -0,0 +1,125 @@
+"""Registry of the live Celery workers, shared through Redis"""
+
+import json
+import time
+import logging
+from typing import Optional
+import redis
+from flask import Flask
+from constants.app_constants import WORKER_TTL, WORKER_REGISTRY_CACHE_TTL
+
+logger = logging.getLogger("app")
+
+
+class WorkerRegistry:
+    """Liveness of the Celery workers, without a broadcast ping per request
+
+    Workers write their hostname and queues to Redis when they are ready and
+    on every heartbeat, the entry expires WORKER_TTL seconds after the last
+    one. Readers keep the registry in memory for WORKER_REGISTRY_CACHE_TTL
+    seconds, so a liveness check is a lookup in a list.
+
+    Without WORKER_REGISTRY_URI (or if Redis fails) the workers are found by
+    a broadcast ping, cached the same way.
+    """
+
+    PREFIX = "workers:"
+
+    def __init__(self):
+        self.client = None
+        self.celery = None
+        self.hostname = None
+        self.queues = []
+        self.cached = []
+        self.cached_at = None
+
+    def init_app(self, app: Flask) -> None:
+        """Connect to Redis, workers are pinged without WORKER_REGISTRY_URI"""
+
+        uri = app.config.get("WORKER_REGISTRY_URI")
+        self.client = redis.Redis.from_url(uri) if uri else None
+        self.celery = app.extensions["celery"]
+
+    @property
+    def queue(self) -> str:
+        """Queue the scraping tasks are sent to"""
+
+        return self.celery.conf.task_default_queue
+
+    def register(
+        self, hostname: Optional[str] = None, queues: Optional[list] = None
+    ) -> None:
+        """Marks this worker alive for WORKER_TTL seconds
+
+        Args:
+            hostname (str): name of the worker, kept for the next heartbeats
+            queues (list): queues consumed by the worker
+        """
+        if hostname:
+            self.hostname, self.queues = hostname, queues or []
+        if self.client is None or self.hostname is None:
+            return
+
+        worker = {"hostname": self.hostname, "queues": self.queues, "seen": time.time()}
+        try:
+            self.client.set(
+                self.PREFIX + self.hostname, json.dumps(worker), ex=WORKER_TTL
+            )
+        except redis.RedisError as exp_err:
+            logger.warning(f"Worker Registry - {str(exp_err)}")
+
+    def unregister(self) -> None:
+        """Removes this worker, it stops taking tasks"""
+
+        if self.client is None or self.hostname is None:
+            return
+
+        try:
+            self.client.delete(self.PREFIX + self.hostname)
+        except redis.RedisError as exp_err:
+            logger.warning(f"Worker Registry - {str(exp_err)}")
+
+    def workers(self) -> list:
+        """Returns the live workers, at most WORKER_REGISTRY_CACHE_TTL seconds old"""
+
+        now = time.monotonic()
+        if self.cached_at is None or now - self.cached_at > WORKER_REGISTRY_CACHE_TTL:
+            self.cached, self.cached_at = self.load(), now
+
+        return self.cached
+
+    def scraping_workers(self) -> list:
+        """Returns the live workers consuming the scraping queue"""
+
+        return [
+            worker
+            for worker in self.workers()
+            # queues of pinged workers are unknown, they consume the default one
+            if worker["queues"] is None or self.queue in worker["queues"]
+        ]
+
+    def load(self) -> list:
+        """Reads the workers from Redis, or pings them"""
+
+        if self.client is not None:
+            try:
+                keys = list(self.client.scan_iter(match=self.PREFIX + "*"))
+                workers = self.client.mget(keys) if keys else []
+                return [json.loads(worker) for worker in workers if worker]
+            except redis.RedisError as exp_err:
+                logger.warning(f"Worker Registry - {str(exp_err)}")
+
+        return [
+            {"hostname": hostname, "queues": None, "seen": time.time()}
+            for reply in self.celery.control.ping(timeout=1)
+            for hostname in reply
+        ]
+
+
+worker_registry = WorkerRegistry()
+
+
+def init_worker_registry(app: Flask) -> None:
+    """Initialize Worker Registry"""
+
+    worker_registry.init_app(app)